@@ -0,0 +1,71 @@
+"""Micro-benchmark: per-frame cost of parsing client_audio_chunk messages.
+
+Compares the previous path (pydantic validation plus three base64 decodes per
+frame: validator, handler and debug log line) with the fast path used by
+parse_client_message (model_construct without generic validation, one
+cached decode, debug log line only evaluated at DEBUG level).
+
+Usage:
+    python benchmarks/bench_audio_chunk_parsing.py [--iterations 20000]
+"""
+
+import argparse
+import base64
+import json
+import os
+import time
+
+from kuralit.server.protocol import ClientAudioChunkMessage, parse_client_message
+
+
+def _make_raw_message(frame_ms: int, sample_rate: int = 16000) -> str:
+    """Build a JSON client_audio_chunk message carrying frame_ms of PCM16 audio."""
+    num_bytes = sample_rate * frame_ms // 1000 * 2
+    return json.dumps({
+        "type": "client_audio_chunk",
+        "session_id": "bench-session",
+        "data": {"chunk": base64.b64encode(os.urandom(num_bytes)).decode("ascii")},
+    })
+
+
+def _legacy_path(raw: str) -> int:
+    """Previous behaviour: pydantic model + handler decode + log line decode."""
+    message = ClientAudioChunkMessage(**json.loads(raw))  # validator decodes once
+    audio = base64.b64decode(message.chunk)  # handle_audio_chunk
+    size = len(base64.b64decode(message.chunk))  # debug log line
+    return len(audio) + size
+
+
+def _fast_path(raw: str) -> int:
+    """Current behaviour: parse_client_message fast path, cached decode."""
+    message = parse_client_message(json.loads(raw))
+    audio = message.get_decoded_chunk()  # The debug log line only reads it at DEBUG level
+    return len(audio) * 2
+
+
+def _time_per_frame(fn, raw: str, iterations: int) -> float:
+    """Return mean microseconds per call."""
+    for _ in range(min(1000, iterations)):  # warm-up
+        fn(raw)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn(raw)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+    
+    print(f"{'frame':>8} {'bytes':>7} {'legacy us':>10} {'fast us':>9} {'speedup':>8}")
+    for frame_ms in (10, 20, 100):
+        raw = _make_raw_message(frame_ms)
+        legacy = _time_per_frame(_legacy_path, raw, args.iterations)
+        fast = _time_per_frame(_fast_path, raw, args.iterations)
+        num_bytes = 16000 * frame_ms // 1000 * 2
+        print(f"{frame_ms:>6}ms {num_bytes:>7} {legacy:>10.2f} {fast:>9.2f} {legacy / fast:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Micro-benchmark: dashboard event fan-out cost vs. subscriber count.
+
+Publishes a burst of representative events through EventBus to N dashboard
+subscribers whose sockets discard the payload, and measures event-loop time
+until every subscriber queue is drained. Compares serializing the event in
+each subscriber (previous behaviour) with the shared cached payload.
+
+Usage:
+    python benchmarks/bench_event_fanout.py [--events 2000]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+
+from kuralit.server.event_bus import Event, EventBus
+
+
+def _event_data(i: int) -> dict:
+    """Payload roughly the size of a partial transcript / tool event."""
+    return {
+        "text": "what is the weather like in san francisco tomorrow " * 2,
+        "is_final": i % 10 == 0,
+        "confidence": 0.93,
+        "metadata": {"source": "stt", "sequence": i, "words": list(range(20))},
+    }
+
+
+async def _run(num_subscribers: int, num_events: int, shared: bool) -> float:
+    """Return mean microseconds of loop time per published event."""
+    bus = EventBus(max_queue_size=num_events)
+    sent = [0]
+
+    def make_callback():
+        if shared:
+            async def callback(event: Event) -> None:
+                sent[0] += len(event.to_json())
+        else:
+            async def callback(event: Event) -> None:
+                sent[0] += len(json.dumps(event.to_dict()))
+        return callback
+
+    callbacks = [make_callback() for _ in range(num_subscribers)]
+    for callback in callbacks:
+        bus.subscribe(callback)
+
+    start = time.perf_counter()
+    for i in range(num_events):
+        await bus.publish("stt_partial", "bench-session", _event_data(i))
+    while any(s["queue_depth"] for s in bus.get_subscriber_stats()):
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - start
+
+    for callback in callbacks:
+        bus.unsubscribe(callback)
+    return elapsed / num_events * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=2000)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    print(f"{'subscribers':>11} {'per-sub us':>11} {'shared us':>10} {'speedup':>8}")
+    for num_subscribers in (1, 5, 20, 50):
+        per_sub = asyncio.run(_run(num_subscribers, args.events, shared=False))
+        shared = asyncio.run(_run(num_subscribers, args.events, shared=True))
+        print(f"{num_subscribers:>11} {per_sub:>11.1f} {shared:>10.1f} {per_sub / shared:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
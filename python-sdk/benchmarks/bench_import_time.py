@@ -0,0 +1,109 @@
+"""Benchmark: import time of the package entry points, with budgets.
+
+Imports each entry point in a fresh interpreter with `python -X importtime`
+and sums the cumulative time of the modules it loads (interpreter startup
+excluded), best of --runs. Reports the slowest modules and whether any
+heavy provider dependency was pulled in.
+
+Exits non-zero if an entry point is over its budget or imports a module it
+must not (e.g. `import kuralit.server` loading google-cloud-speech or
+onnxruntime), so it can run in CI to keep startup from regressing.
+
+Usage:
+    python benchmarks/bench_import_time.py [--runs 5] [--budget-scale 1.0] [--top 5]
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+
+# Entry point -> (budget ms, modules it must not import)
+PROVIDER_MODULES = (
+    "google.genai",
+    "google.cloud.speech",
+    "aiohttp",
+    "onnxruntime",
+    "transformers",
+    "requests",
+)
+ENTRY_POINTS = {
+    "kuralit": (50.0, PROVIDER_MODULES + ("pydantic", "numpy", "fastapi")),
+    "kuralit.server": (50.0, PROVIDER_MODULES + ("pydantic", "numpy", "fastapi")),
+    "kuralit.core": (50.0, PROVIDER_MODULES + ("numpy", "fastapi")),
+    "kuralit.plugins.stt": (50.0, PROVIDER_MODULES + ("numpy", "fastapi")),
+    "kuralit.server.websocket_server": (1000.0, PROVIDER_MODULES),
+}
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def _import_times(statement: str) -> list:
+    """(module, self µs, cumulative µs, depth) for each module a statement imports.
+
+    Raises:
+        RuntimeError: If the statement fails (last line of its traceback)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    rows = []
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append((module, int(self_us), int(cumulative_us), len(indent) // 2))
+    return rows
+
+
+def _measure(module: str, startup: set, runs: int) -> tuple:
+    """Best total ms over runs, and the module rows of the best run."""
+    best_ms, best_rows = None, []
+    for _ in range(runs):
+        rows = [row for row in _import_times(f"import {module}") if row[0] not in startup]
+        total_ms = sum(cumulative for _, _, cumulative, depth in rows if depth == 0) / 1000
+        if best_ms is None or total_ms < best_ms:
+            best_ms, best_rows = total_ms, rows
+    return best_ms, best_rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-scale", type=float, default=1.0, help="Multiply budgets (slow CI machines)")
+    parser.add_argument("--top", type=int, default=5, help="Slowest modules shown per entry point")
+    args = parser.parse_args()
+
+    startup = {row[0] for row in _import_times("pass")}
+    failures = []
+
+    print(f"{'entry point':<34} {'ms':>8} {'budget':>8} {'modules':>8}  forbidden imported")
+    for module, (budget_ms, forbidden) in ENTRY_POINTS.items():
+        try:
+            total_ms, rows = _measure(module, startup, args.runs)
+        except RuntimeError as e:
+            print(f"{module:<34} {'-':>8} {budget_ms:>8.0f} {'-':>8}  import failed: {e}")
+            failures.append(f"{module}: import failed")
+            continue
+        budget_ms *= args.budget_scale
+        loaded = {row[0] for row in rows}
+        imported = [name for name in forbidden if name in loaded]
+        print(f"{module:<34} {total_ms:>8.1f} {budget_ms:>8.0f} {len(rows):>8}  {', '.join(imported) or '-'}")
+        for name, self_us, _, _ in sorted(rows, key=lambda row: row[1], reverse=True)[:args.top]:
+            print(f"    {name:<50} {self_us / 1000:>7.1f} ms self")
+        if total_ms > budget_ms:
+            failures.append(f"{module}: {total_ms:.1f} ms > {budget_ms:.0f} ms budget")
+        if imported:
+            failures.append(f"{module}: imports {', '.join(imported)}")
+
+    if failures:
+        print("\nFAILED:\n  " + "\n  ".join(failures))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Benchmark: streaming resampler throughput.
+
+Feeds 20 ms PCM16 chunks through StreamingResampler for the conversions the
+server performs and reports input samples per second per core (per CPU
+second of the process) and the real-time factor, i.e. how many concurrent
+streams one core can resample.
+
+Usage:
+    python benchmarks/bench_resampling.py [--seconds 30] [--chunk-ms 20]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from kuralit.server.resampler import StreamingResampler
+
+CONVERSIONS = [(48000, 16000), (44100, 16000), (8000, 16000), (16000, 8000)]
+
+
+def _chunks(rate: int, seconds: float, chunk_ms: int) -> list:
+    """Speech-band noise split into chunk_ms chunks."""
+    rng = np.random.default_rng(0)
+    samples = (rng.standard_normal(int(rate * seconds)) * 3000).astype(np.int16)
+    step = rate * chunk_ms // 1000
+    return [samples[i:i + step] for i in range(0, len(samples), step)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=30.0, help="audio per conversion")
+    parser.add_argument("--chunk-ms", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'conversion':>16} {'taps':>5} {'Msamples/s/core':>16} {'x real time':>12}")
+    for input_rate, output_rate in CONVERSIONS:
+        chunks = _chunks(input_rate, args.seconds, args.chunk_ms)
+        resampler = StreamingResampler(input_rate, output_rate)
+        resampler.process(chunks[0])  # warm up
+
+        cpu = time.process_time()
+        for chunk in chunks:
+            resampler.process(chunk)
+        cpu = time.process_time() - cpu
+
+        samples_per_second = input_rate * args.seconds / cpu
+        conversion = f"{input_rate} -> {output_rate}"
+        print(
+            f"{conversion:>16} {resampler._num_taps:>5} {samples_per_second / 1e6:>16.2f} "
+            f"{samples_per_second / input_rate:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
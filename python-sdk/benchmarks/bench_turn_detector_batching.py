@@ -0,0 +1,91 @@
+"""Benchmark: turn detector throughput and latency with cross-session batching.
+
+N sessions each run end-of-turn checks back to back (different transcript
+lengths, so batched contexts need padding), first through the per-request
+path (one batch-1 ONNX run per check in the turn detector worker pool),
+then with TurnDetectorBatcher. Reports checks per second and p50/p99
+latency per check.
+
+Requires the turn detector model and tokenizer (downloaded from Hugging Face
+like the server does, or --model-path / --tokenizer-path).
+
+Usage:
+    python benchmarks/bench_turn_detector_batching.py
+        [--model-path model_q8.onnx] [--tokenizer-path DIR]
+        [--checks 20] [--max-batch-size 16] [--max-wait-ms 5] [--worker-threads 2]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+import numpy as np
+
+from kuralit.config.schema import TurnDetectorConfig
+from kuralit.plugins.turn_detector.multilingual.handler import MultilingualTurnDetectorHandler
+from kuralit.server.turn_detector_executor import get_turn_detector_executor
+
+WORDS = "i would like to book a table for four people tomorrow evening at around seven if possible".split()
+
+
+def _histories(sessions: int) -> list:
+    """One short conversation per session, user transcripts of 3 to 30 words."""
+    rng = random.Random(0)
+    return [
+        [
+            {"role": "user", "content": "hi there"},
+            {"role": "assistant", "content": "hello, how can i help you today?"},
+            {"role": "user", "content": " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 30)))},
+        ]
+        for _ in range(sessions)
+    ]
+
+
+async def _run_sessions(handler: MultilingualTurnDetectorHandler, histories: list, checks: int) -> tuple:
+    """Run every session's checks concurrently; returns (checks/s, latencies ms)."""
+    latencies = []
+
+    async def session(history: list) -> None:
+        for _ in range(checks):
+            started = time.perf_counter()
+            await handler.predict_end_of_turn_async(history)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(session(history) for history in histories))
+    return len(latencies) / (time.perf_counter() - started), latencies
+
+
+async def _main(args: argparse.Namespace) -> None:
+    get_turn_detector_executor().configure(max_workers=args.worker_threads)
+    config = TurnDetectorConfig(model_path=args.model_path, tokenizer_path=args.tokenizer_path)
+    per_request = MultilingualTurnDetectorHandler(config)
+    batched = MultilingualTurnDetectorHandler(config)  # Same shared ONNX session
+    batched.enable_batching(max_batch_size=args.max_batch_size, max_wait_ms=args.max_wait_ms)
+
+    print(f"{'sessions':>8} {'path':>12} {'checks/s':>10} {'p50 ms':>8} {'p99 ms':>8}")
+    for sessions in (1, 16, 64, 256):
+        histories = _histories(sessions)
+        for name, handler in (("per-request", per_request), ("batched", batched)):
+            await _run_sessions(handler, histories, 2)  # warm up
+            throughput, latencies = await _run_sessions(handler, histories, args.checks)
+            print(
+                f"{sessions:>8} {name:>12} {throughput:>10.0f}"
+                f" {np.percentile(latencies, 50):>8.2f} {np.percentile(latencies, 99):>8.2f}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model-path", default=None)
+    parser.add_argument("--tokenizer-path", default=None)
+    parser.add_argument("--checks", type=int, default=20)
+    parser.add_argument("--max-batch-size", type=int, default=16)
+    parser.add_argument("--max-wait-ms", type=float, default=5.0)
+    parser.add_argument("--worker-threads", type=int, default=2)
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
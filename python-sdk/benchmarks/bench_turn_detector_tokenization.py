@@ -0,0 +1,120 @@
+"""Benchmark: end-of-turn check latency with incremental tokenization.
+
+Each check converts the session history, formats and tokenizes it and runs
+the turn detector. The previous path converted the whole history and
+rendered and tokenized the full context on every check; the current path
+converts only the messages the model reads and reuses the cached token IDs
+of the committed prefix, tokenizing only the user transcript. Checks follow
+a growing transcript (one per word, like interim transcripts) after 2, 10
+and 100 history turns, interleaved across --sessions concurrent sessions
+(each with its own history and prefix cache key) on one shared handler.
+Reports p50/p99 milliseconds per check, with and without the ONNX run, and
+the prefix cache hit rate.
+
+Requires the turn detector model and tokenizer (downloaded from Hugging Face
+like the server does, or --model-path / --tokenizer-path).
+
+Usage:
+    python benchmarks/bench_turn_detector_tokenization.py
+        [--model-path model_q8.onnx] [--tokenizer-path DIR] [--sessions 1 16 64]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from kuralit.config.schema import TurnDetectorConfig
+from kuralit.models.message import Message
+from kuralit.plugins.turn_detector.multilingual.handler import (
+    MAX_HISTORY_TOKENS,
+    MAX_HISTORY_TURNS,
+    MultilingualTurnDetectorHandler,
+)
+
+TRANSCRIPT = "i would like to book a table for four people tomorrow evening at around seven if that is possible"
+
+
+def _history(turns: int, session: int) -> list:
+    """Alternating user/assistant messages, as in session.conversation_history."""
+    history = []
+    for i in range(turns):
+        if i % 2 == 0:
+            history.append(Message(role="user", content=f"can you tell me about option {i} for guest {session}"))
+        else:
+            history.append(Message(role="assistant", content=f"option {i} costs {i * 3 + session} dollars and includes breakfast"))
+    return history
+
+
+def _previous_tokenize(handler: MultilingualTurnDetectorHandler, history: list, transcript: str, session: int) -> np.ndarray:
+    """Full conversion, chat template and tokenizer call on every check."""
+    chat_ctx = handler.convert_message_history(history) + [{"role": "user", "content": transcript}]
+    text = handler._format_chat_context(chat_ctx[-MAX_HISTORY_TURNS:])
+    return handler._tokenizer(
+        text,
+        add_special_tokens=False,
+        return_tensors="np",
+        max_length=MAX_HISTORY_TOKENS,
+        truncation=True,
+    )["input_ids"].astype("int64")
+
+
+def _current_tokenize(handler: MultilingualTurnDetectorHandler, history: list, transcript: str, session: int) -> np.ndarray:
+    """Tail-only conversion and the session's cached prefix token IDs."""
+    chat_ctx = handler.convert_message_history(history, limit=handler.max_history_turns)
+    chat_ctx.append({"role": "user", "content": transcript})
+    return np.array([handler.tokenize_history(chat_ctx, cache_key=session)], dtype=np.int64)
+
+
+def _check_latencies(handler: MultilingualTurnDetectorHandler, tokenize, histories: list, run_model: bool) -> list:
+    """Milliseconds per check over transcripts growing one word at a time.
+    
+    Every session checks its next word in turn, as concurrent sessions do.
+    """
+    words = TRANSCRIPT.split()
+    latencies = []
+    for repeat in range(5):
+        for n in range(1, len(words) + 1):
+            for session, history in enumerate(histories):
+                started = time.perf_counter()
+                input_ids = tokenize(handler, history, " ".join(words[:n]), session)
+                if run_model:
+                    handler._session.run(None, {"input_ids": input_ids})
+                latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model-path", default=None)
+    parser.add_argument("--tokenizer-path", default=None)
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 16, 64])
+    args = parser.parse_args()
+
+    handler = MultilingualTurnDetectorHandler(
+        TurnDetectorConfig(model_path=args.model_path, tokenizer_path=args.tokenizer_path)
+    )
+
+    print(
+        f"{'sessions':>8} {'turns':>6} {'path':>10} {'p50 ms':>8} {'p99 ms':>8}"
+        f" {'tok p50':>8} {'tok p99':>8} {'prefix hits':>12}"
+    )
+    for sessions in args.sessions:
+        for turns in (2, 10, 100):
+            histories = [_history(turns, session) for session in range(sessions)]
+            for name, tokenize in (("previous", _previous_tokenize), ("current", _current_tokenize)):
+                handler.clear_cache()
+                handler.prefix_cache_hits = handler.prefix_cache_misses = 0
+                _check_latencies(handler, tokenize, histories, run_model=True)  # warm up
+                total = _check_latencies(handler, tokenize, histories, run_model=True)
+                tokenize_only = _check_latencies(handler, tokenize, histories, run_model=False)
+                lookups = handler.prefix_cache_hits + handler.prefix_cache_misses
+                hit_rate = f"{handler.prefix_cache_hits / lookups:.1%}" if lookups else "-"
+                print(
+                    f"{sessions:>8} {turns:>6} {name:>10} {np.percentile(total, 50):>8.2f} {np.percentile(total, 99):>8.2f}"
+                    f" {np.percentile(tokenize_only, 50):>8.3f} {np.percentile(tokenize_only, 99):>8.3f} {hit_rate:>12}"
+                )
+
+
+if __name__ == "__main__":
+    main()
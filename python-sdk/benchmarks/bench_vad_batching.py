@@ -0,0 +1,90 @@
+"""Benchmark: Silero VAD throughput with and without cross-stream batching.
+
+Runs N concurrent VAD streams over random 32 ms windows, first one
+inference call per window (previous behaviour), then through
+SileroVADBatcher. Reports windows per second of wall time and per core
+(windows per CPU-second of the process, all threads included).
+
+Requires the Silero VAD model (same lookup as the server, or --model-path).
+
+Usage:
+    python benchmarks/bench_vad_batching.py [--model-path silero_vad.onnx]
+        [--windows 8192] [--max-batch-size 64] [--max-wait-ms 2]
+"""
+
+import argparse
+import asyncio
+import time
+
+import numpy as np
+
+from kuralit.plugins.vad.silero.batching import SileroVADBatcher
+from kuralit.plugins.vad.silero.handler import SileroVADModel, load_vad_model
+
+SAMPLE_RATE = 16000
+
+
+def _windows(model: SileroVADModel, count: int) -> list:
+    """Random normalized float32 windows (content does not affect cost)."""
+    rng = np.random.default_rng(0)
+    return [
+        (rng.standard_normal(model.window_size_samples) * 0.1).astype(np.float32)
+        for _ in range(count)
+    ]
+
+
+def _run_unbatched(model: SileroVADModel, num_streams: int, windows_per_stream: int, windows: list):
+    """One inference call per window, streams interleaved as on a live server."""
+    states = [model.create_state() for _ in range(num_streams)]
+    for step in range(windows_per_stream):
+        window = windows[step % len(windows)]
+        for state in states:
+            model(window, state)
+
+
+async def _run_batched(batcher: SileroVADBatcher, model: SileroVADModel, num_streams: int, windows_per_stream: int, windows: list):
+    """Each stream awaits its windows in order; the batcher groups streams."""
+    async def stream() -> None:
+        state = model.create_state()
+        for step in range(windows_per_stream):
+            await batcher.infer(windows[step % len(windows)], state)
+
+    await asyncio.gather(*(stream() for _ in range(num_streams)))
+
+
+def _measure(fn) -> tuple:
+    """Return (wall seconds, process CPU seconds) for fn()."""
+    wall, cpu = time.perf_counter(), time.process_time()
+    fn()
+    return time.perf_counter() - wall, time.process_time() - cpu
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model-path", default=None)
+    parser.add_argument("--windows", type=int, default=8192, help="total windows per measurement")
+    parser.add_argument("--max-batch-size", type=int, default=64)
+    parser.add_argument("--max-wait-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    model = SileroVADModel(load_vad_model(args.model_path), SAMPLE_RATE)
+    windows = _windows(model, 64)
+
+    print(f"{'streams':>8} {'mode':>10} {'win/s':>10} {'win/s/core':>11} {'avg batch':>10}")
+    for num_streams in (1, 64, 512):
+        windows_per_stream = max(4, args.windows // num_streams)
+        total = windows_per_stream * num_streams
+
+        wall, cpu = _measure(lambda: _run_unbatched(model, num_streams, windows_per_stream, windows))
+        print(f"{num_streams:>8} {'unbatched':>10} {total / wall:>10.0f} {total / cpu:>11.0f} {1.0:>10.1f}")
+
+        batcher = SileroVADBatcher(model, args.max_batch_size, args.max_wait_ms)
+        wall, cpu = _measure(lambda: asyncio.run(
+            _run_batched(batcher, model, num_streams, windows_per_stream, windows)
+        ))
+        avg_batch = batcher.get_stats()["average_batch_size"]
+        print(f"{num_streams:>8} {'batched':>10} {total / wall:>10.0f} {total / cpu:>11.0f} {avg_batch:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""Benchmark: per-window cost of single-stream Silero VAD inference.
+
+Compares the previous per-window path (fresh float32 array, division, input
+dict, session.run(), result dict) with SileroVADHandler.process_frame()
+(in-place normalization into preallocated buffers, IO binding, tuple
+result). Reports microseconds per window and the bytes allocated per
+window (tracemalloc peak above the steady state, numpy and Python objects).
+The last row feeds near-silent windows, which the energy gate answers
+without running the model.
+
+Then checks that the gate does not change speech events: a voiced clip with
+short near-silent gaps inside the utterance must give the same
+START_OF_SPEECH / END_OF_SPEECH windows with silence_threshold on and off.
+Exits non-zero if they differ.
+
+Requires the Silero VAD model (same lookup as the server, or --model-path).
+
+Usage:
+    python benchmarks/bench_vad_inference.py [--model-path silero_vad.onnx]
+        [--windows 20000]
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from kuralit.config.schema import VADConfig
+from kuralit.plugins.vad.silero.handler import SileroVADHandler, SileroVADModel, load_vad_model
+
+SAMPLE_RATE = 16000
+
+
+class _PreviousPath:
+    """The per-window inference path before preallocated buffers."""
+
+    def __init__(self, model: SileroVADModel):
+        self._sess = model._sess
+        self._context_size = model._context_size
+        self._sample_rate_nd = np.array(SAMPLE_RATE, dtype=np.int64)
+        self._context = np.zeros((1, self._context_size), dtype=np.float32)
+        self._rnn_state = np.zeros((2, 1, 128), dtype=np.float32)
+        self._input_buffer = np.zeros((1, self._context_size + model.window_size_samples), dtype=np.float32)
+        self._is_speaking = False
+
+    def process_audio_frame(self, audio_frame: np.ndarray) -> dict:
+        audio_f32 = audio_frame.astype(np.float32) / np.iinfo(np.int16).max
+        self._input_buffer[:, :self._context_size] = self._context
+        self._input_buffer[:, self._context_size:] = audio_f32
+        out, self._rnn_state = self._sess.run(None, {
+            "input": self._input_buffer,
+            "state": self._rnn_state,
+            "sr": self._sample_rate_nd,
+        })
+        self._context[:] = self._input_buffer[:, -self._context_size:]
+        probability = float(out.item())
+        is_speech = probability >= 0.5
+        event = "CONTINUING"
+        if is_speech != self._is_speaking:
+            self._is_speaking = is_speech
+            event = "START_OF_SPEECH" if is_speech else "END_OF_SPEECH"
+        return {"is_speech": is_speech, "probability": probability, "is_speaking": self._is_speaking, "event": event}
+
+
+def _frames(window_size: int, amplitude: int = 3000) -> list:
+    """Random int16 windows (content only matters to the energy gate)."""
+    rng = np.random.default_rng(0)
+    return [rng.integers(-amplitude, amplitude, window_size, dtype=np.int16) for _ in range(64)]
+
+
+def _gapped_speech(window_size: int) -> list:
+    """Windows of a voiced clip whose utterance has short near-silent gaps.
+    
+    0.5 s silence, three 0.6 s syllable trains with 96 ms gaps, 1 s silence.
+    """
+    rng = np.random.default_rng(1)
+    t = np.arange(int(0.6 * SAMPLE_RATE)) / SAMPLE_RATE
+    voiced = sum(np.sin(2 * np.pi * 150 * k * t) / k for k in range(1, 8))
+    voiced *= 0.5 + 0.5 * np.abs(np.sin(2 * np.pi * 4 * t))
+    voiced = (voiced / np.abs(voiced).max() * 8000).astype(np.int16)
+
+    def quiet(seconds: float) -> np.ndarray:
+        return rng.integers(-20, 20, int(seconds * SAMPLE_RATE), dtype=np.int16)
+
+    gap = 3 * window_size / SAMPLE_RATE
+    clip = np.concatenate([quiet(0.5), voiced, quiet(gap), voiced, quiet(gap), voiced, quiet(1.0)])
+    return [clip[i:i + window_size] for i in range(0, len(clip) - window_size + 1, window_size)]
+
+
+def _speech_events(handler: SileroVADHandler, frames: list) -> list:
+    """(window index, event) of each START_OF_SPEECH / END_OF_SPEECH."""
+    handler.reset()
+    events = []
+    for i, frame in enumerate(frames):
+        event = handler.process_frame(frame).event
+        if event != "CONTINUING":
+            events.append((i, event))
+    return events
+
+
+def _time_per_window(process, frames: list, windows: int) -> float:
+    """Microseconds per window."""
+    for frame in frames:
+        process(frame)  # warm up
+    started = time.perf_counter()
+    for i in range(windows):
+        process(frames[i % len(frames)])
+    return (time.perf_counter() - started) / windows * 1e6
+
+
+def _bytes_per_window(process, frames: list, windows: int = 1000) -> float:
+    """Average bytes allocated per window above the steady state."""
+    tracemalloc.start()
+    total = 0
+    for i in range(windows):
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        process(frames[i % len(frames)])
+        total += tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+    return total / windows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model-path", default=None)
+    parser.add_argument("--windows", type=int, default=20000)
+    args = parser.parse_args()
+
+    model = SileroVADModel(load_vad_model(args.model_path), SAMPLE_RATE)
+    handler = SileroVADHandler(VADConfig(sample_rate=SAMPLE_RATE), model=model)
+    previous = _PreviousPath(model)
+    frames = _frames(model.window_size_samples)
+    silence = _frames(model.window_size_samples, amplitude=30)
+
+    print(f"{'path':>24} {'us/window':>10} {'alloc B/window':>15}")
+    for name, process, inputs in (
+        ("previous (dict, run)", previous.process_audio_frame, frames),
+        ("process_frame", handler.process_frame, frames),
+        ("process_frame (silence)", handler.process_frame, silence),
+    ):
+        us = _time_per_window(process, inputs, args.windows)
+        allocated = _bytes_per_window(process, inputs)
+        print(f"{name:>24} {us:>10.1f} {allocated:>15.0f}")
+
+    clip = _gapped_speech(model.window_size_samples)
+    results = {}
+    print(f"\n{'silence gate':>24} {'skipped':>10} {'speech events (window, event)'}")
+    for name, silence_threshold in (("off", 0.0), ("on", 0.01)):
+        gated = SileroVADHandler(VADConfig(sample_rate=SAMPLE_RATE, silence_threshold=silence_threshold), model=model)
+        skipped = model.windows_skipped
+        results[name] = _speech_events(gated, clip)
+        print(f"{name:>24} {model.windows_skipped - skipped:>10} {results[name]}")
+    if results["on"] != results["off"]:
+        print("\nFAILED: the silence gate changes speech events")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -22,6 +22,9 @@ Usage:
 Or with custom server URL:
     python examples/clients/send_audio_client.py --server ws://localhost:8000/ws --api-key demo-api-key
 
+Or send audio as binary WebSocket frames instead of base64 JSON:
+    python examples/clients/send_audio_client.py --binary
+
 Prerequisites:
     - A Kuralit WebSocket server must be running (use one of the server examples)
     - pip install websockets pyaudio
@@ -41,9 +44,11 @@ What this client does:
 import asyncio
 import base64
 import json
+import struct
 import sys
 import argparse
 import queue
+import time
 from typing import Optional
 
 try:
@@ -66,6 +71,10 @@ CHANNELS = 1
 CHUNK_SIZE = 1024  # Frames per buffer
 FORMAT = pyaudio.paInt16
 
+# Binary audio frame header: version, flags, stream id, sequence, timestamp (ms)
+BINARY_HEADER = struct.Struct("<BBHII")
+BINARY_STREAM_ID = 1
+
 
 class AudioStreamClient:
     """Client for streaming audio to Kuralit WebSocket server.
@@ -74,15 +83,17 @@ class AudioStreamClient:
     and streams it to the server while receiving transcriptions and responses.
     """
     
-    def __init__(self, server_url: str, api_key: str):
+    def __init__(self, server_url: str, api_key: str, binary: bool = False):
         """Initialize the audio streaming client.
         
         Args:
             server_url: WebSocket server URL to connect to
             api_key: API key for authentication
+            binary: Send audio as binary WebSocket frames instead of base64 JSON
         """
         self.server_url = server_url
         self.api_key = api_key
+        self.binary = binary
         self.session_id: Optional[str] = None
         self.audio_queue = queue.Queue()
         self.is_running = False
@@ -133,8 +144,14 @@ class AudioStreamClient:
                 "encoding": "PCM16"
             }
         }
+        if self.binary:
+            start_msg["data"]["transport"] = "binary"
+            start_msg["data"]["stream_id"] = BINARY_STREAM_ID
         await websocket.send(json.dumps(start_msg))
-        print("📤 Sent audio start message")
+        print(f"📤 Sent audio start message ({'binary' if self.binary else 'json'} transport)")
+        
+        sequence = 0
+        stream_start = time.monotonic()
 
         # 2. Stream Audio Chunks
         print("📤 Streaming audio... (Press Ctrl+C to stop)")
@@ -144,6 +161,15 @@ class AudioStreamClient:
                     # Non-blocking get from queue
                     audio_data = self.audio_queue.get_nowait()
                     
+                    if self.binary:
+                        # Raw PCM16 behind a 12-byte header
+                        timestamp_ms = int((time.monotonic() - stream_start) * 1000)
+                        header = BINARY_HEADER.pack(1, 0, BINARY_STREAM_ID, sequence, timestamp_ms & 0xFFFFFFFF)
+                        sequence = (sequence + 1) & 0xFFFFFFFF
+                        await websocket.send(header + audio_data)
+                        await asyncio.sleep(0.001)
+                        continue
+                    
                     # Base64 encode
                     b64_audio = base64.b64encode(audio_data).decode('utf-8')
                     
@@ -253,10 +279,15 @@ if __name__ == "__main__":
         default=DEFAULT_API_KEY,
         help=f"API key for authentication (default: {DEFAULT_API_KEY})"
     )
+    parser.add_argument(
+        "--binary",
+        action="store_true",
+        help="Send audio as binary WebSocket frames instead of base64 JSON"
+    )
     args = parser.parse_args()
     
     # Create and run client
-    client = AudioStreamClient(args.server, args.api_key)
+    client = AudioStreamClient(args.server, args.api_key, binary=args.binary)
     try:
         asyncio.run(client.run())
     except KeyboardInterrupt:
@@ -1,9 +1,20 @@
 """Kuralit - World's 1st AI Agent for Mobile Apps."""
 
+from typing import TYPE_CHECKING
+
 from kuralit.version import __version__
+from kuralit.utils.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from kuralit.agent import Agent
+    from kuralit.tools import Toolkit, Function
 
-from kuralit.agent import Agent
-from kuralit.tools import Toolkit, Function
+# Imported on first access (Agent and the tools pull in pydantic)
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    "Agent": "kuralit.agent:Agent",
+    "Toolkit": "kuralit.tools:Toolkit",
+    "Function": "kuralit.tools:Function",
+})
 
 __all__ = [
     "Agent",
@@ -11,4 +22,3 @@ __all__ = [
     "Function",
     "__version__",
 ]
-
@@ -174,6 +174,8 @@ class ConfigManager:
         - KURALIT_VAD_PROVIDER (default: "silero")
         - KURALIT_VAD_ACTIVATION_THRESHOLD (default: 0.5)
         - KURALIT_VAD_MODEL_PATH (optional)
+        - KURALIT_SILENCE_THRESHOLD (default: 0.01)
+        - KURALIT_SILENCE_DURATION_MS (default: 500)
         """
         return VADConfig(
             enabled=os.getenv("KURALIT_VAD_ENABLED", "true").lower() == "true",
@@ -182,6 +184,8 @@ class ConfigManager:
             activation_threshold=float(os.getenv("KURALIT_VAD_ACTIVATION_THRESHOLD", "0.5")),
             model_path=_normalize_model_path(os.getenv("KURALIT_VAD_MODEL_PATH")),
             sample_rate=int(os.getenv("KURALIT_SAMPLE_RATE", "16000")),
+            silence_threshold=float(os.getenv("KURALIT_SILENCE_THRESHOLD", "0.01")),
+            silence_reset_ms=int(os.getenv("KURALIT_SILENCE_DURATION_MS", "500")),
         )
     
     def _load_turn_detector_config(self) -> TurnDetectorConfig:
@@ -192,6 +196,7 @@ class ConfigManager:
         - KURALIT_TURN_DETECTOR_PROVIDER (default: "multilingual")
         - KURALIT_TURN_DETECTOR_THRESHOLD (default: 0.6)
         - KURALIT_TURN_DETECTOR_MODEL_PATH (optional)
+        - KURALIT_TURN_DETECTOR_OFFLINE (default: "false")
         """
         return TurnDetectorConfig(
             enabled=os.getenv("KURALIT_TURN_DETECTOR_ENABLED", "true").lower() == "true",
@@ -200,6 +205,7 @@ class ConfigManager:
             threshold=float(os.getenv("KURALIT_TURN_DETECTOR_THRESHOLD", "0.6")),
             model_path=_normalize_model_path(os.getenv("KURALIT_TURN_DETECTOR_MODEL_PATH")),
             tokenizer_path=_normalize_model_path(os.getenv("KURALIT_TURN_DETECTOR_TOKENIZER_PATH")),
+            offline=os.getenv("KURALIT_TURN_DETECTOR_OFFLINE", "false").lower() == "true",
         )
     
     def _load_agent_config(self) -> AgentConfig:
@@ -239,6 +245,8 @@ class ConfigManager:
             port=int(os.getenv("KURALIT_PORT", "8000")),
             debug=os.getenv("KURALIT_DEBUG", "false").lower() == "true",
             log_level=os.getenv("KURALIT_LOG_LEVEL", "INFO"),
+            preload_models=os.getenv("KURALIT_PRELOAD_MODELS", "false").lower() == "true",
+            warmup_inferences=int(os.getenv("KURALIT_WARMUP_INFERENCES", "3")),
             api_key_validator=None,  # Must be set programmatically
             require_wss=os.getenv("KURALIT_REQUIRE_WSS", "true").lower() == "true",
             silence_threshold=float(os.getenv("KURALIT_SILENCE_THRESHOLD", "0.01")),
@@ -246,12 +254,37 @@ class ConfigManager:
             max_buffer_duration_ms=int(os.getenv("KURALIT_MAX_BUFFER_DURATION_MS", "3000")),
             max_buffer_size_bytes=int(os.getenv("KURALIT_MAX_BUFFER_SIZE_BYTES", "131072")),
             chunk_size_ms=int(os.getenv("KURALIT_CHUNK_SIZE_MS", "50")),
+            stt_max_sample_rate=int(os.getenv("KURALIT_STT_MAX_SAMPLE_RATE", "16000")),
+            stt_vad_gating=os.getenv("KURALIT_STT_VAD_GATING", "false").lower() == "true",
+            stt_preroll_ms=int(os.getenv("KURALIT_STT_PREROLL_MS", "300")),
+            stt_hangover_ms=int(os.getenv("KURALIT_STT_HANGOVER_MS", "500")),
+            stt_queue_max_bytes=int(os.getenv("KURALIT_STT_QUEUE_MAX_BYTES", "64000")),
+            stt_queue_overflow_policy=os.getenv("KURALIT_STT_QUEUE_OVERFLOW_POLICY", "drop_oldest"),
+            stt_packet_ms=int(os.getenv("KURALIT_STT_PACKET_MS", "40")),
+            stt_packet_max_delay_ms=int(os.getenv("KURALIT_STT_PACKET_MAX_DELAY_MS", "60")),
+            vad_execution_mode=os.getenv("KURALIT_VAD_EXECUTION_MODE", "thread_pool"),
+            vad_worker_threads=int(os.getenv("KURALIT_VAD_WORKER_THREADS", "4")),
+            vad_batch_max_size=int(os.getenv("KURALIT_VAD_BATCH_MAX_SIZE", "64")),
+            vad_batch_max_wait_ms=float(os.getenv("KURALIT_VAD_BATCH_MAX_WAIT_MS", "2.0")),
+            turn_detector_worker_threads=int(os.getenv("KURALIT_TURN_DETECTOR_WORKER_THREADS", "2")),
+            turn_detector_offline=os.getenv("KURALIT_TURN_DETECTOR_OFFLINE", "false").lower() == "true",
+            turn_detector_batching=os.getenv("KURALIT_TURN_DETECTOR_BATCHING", "false").lower() == "true",
+            turn_detector_batch_max_size=int(os.getenv("KURALIT_TURN_DETECTOR_BATCH_MAX_SIZE", "16")),
+            turn_detector_batch_max_wait_ms=float(os.getenv("KURALIT_TURN_DETECTOR_BATCH_MAX_WAIT_MS", "5.0")),
+            turn_detector_memo_size=int(os.getenv("KURALIT_TURN_DETECTOR_MEMO_SIZE", "16")),
+            turn_detector_speculative=os.getenv("KURALIT_TURN_DETECTOR_SPECULATIVE", "false").lower() == "true",
+            turn_detector_speculative_stable_ms=float(os.getenv("KURALIT_TURN_DETECTOR_SPECULATIVE_STABLE_MS", "200")),
             min_endpointing_delay=float(os.getenv("KURALIT_MIN_ENDPOINTING_DELAY", "0.5")),
             max_endpointing_delay=float(os.getenv("KURALIT_MAX_ENDPOINTING_DELAY", "3.0")),
+            agent_speculative_generation=os.getenv("KURALIT_AGENT_SPECULATIVE_GENERATION", "false").lower() == "true",
+            agent_speculative_threshold=float(os.getenv("KURALIT_AGENT_SPECULATIVE_THRESHOLD", "0.3")),
             max_text_size_bytes=int(os.getenv("KURALIT_MAX_TEXT_SIZE", "4096")),
             max_audio_chunk_size_bytes=int(os.getenv("KURALIT_MAX_AUDIO_CHUNK_SIZE", "16384")),
             max_concurrent_connections=int(os.getenv("KURALIT_MAX_CONNECTIONS", "1000")),
             connection_timeout_seconds=int(os.getenv("KURALIT_CONNECTION_TIMEOUT", "300")),
+            session_reconnect_grace_seconds=float(os.getenv("KURALIT_SESSION_RECONNECT_GRACE", "30")),
+            dashboard_event_queue_size=int(os.getenv("KURALIT_DASHBOARD_EVENT_QUEUE_SIZE", "256")),
+            dashboard_event_drop_policy=os.getenv("KURALIT_DASHBOARD_EVENT_DROP_POLICY", "drop_oldest"),
             enable_metrics=os.getenv("KURALIT_ENABLE_METRICS", "true").lower() == "true",
             metrics_port=int(os.getenv("KURALIT_METRICS_PORT", "9090")),
         )
@@ -65,6 +65,8 @@ class VADConfig:
     activation_threshold: float = 0.5  # Speech activation threshold
     model_path: Optional[str] = None  # Path to model file
     sample_rate: int = 16000  # Audio sample rate (must match audio)
+    silence_threshold: float = 0.01  # RMS (0-1) below which windows skip the model; 0 = off
+    silence_reset_ms: int = 500  # Skipped silence after which the model state is reset
 
 
 @dataclass
@@ -79,6 +81,7 @@ class TurnDetectorConfig:
     threshold: float = 0.6  # End-of-turn probability threshold
     model_path: Optional[str] = None  # Path to model file
     tokenizer_path: Optional[str] = None  # Path to tokenizer
+    offline: bool = False  # Never use the network (model must be local or cached)
 
 
 @dataclass
@@ -118,6 +121,8 @@ class ServerConfig:
     port: int = 8000
     debug: bool = False
     log_level: str = "INFO"
+    preload_models: bool = False  # Load and warm up models at startup
+    warmup_inferences: int = 3
     
     # Security
     api_key_validator: Optional[Callable[[str], bool]] = None
@@ -130,15 +135,56 @@ class ServerConfig:
     max_buffer_size_bytes: int = 131072  # 128KB
     chunk_size_ms: int = 50
     
+    # Audio resampling (client rates above this are downsampled for STT; 0 = never)
+    stt_max_sample_rate: int = 16000
+    
+    # VAD-gated STT streaming (only speech, plus pre-roll and hangover, reaches STT)
+    stt_vad_gating: bool = False
+    stt_preroll_ms: int = 300
+    stt_hangover_ms: int = 500
+    
+    # Audio waiting for the STT stream (byte budget and what happens beyond it)
+    stt_queue_max_bytes: int = 64000  # ~2s of 16kHz PCM16; 0 = unbounded
+    stt_queue_overflow_policy: str = "drop_oldest"  # "drop_oldest", "coalesce" or "pause"
+    
+    # Frames coalesced into packets before each STT send (0 = no coalescing)
+    stt_packet_ms: int = 40
+    stt_packet_max_delay_ms: int = 60
+    
+    # VAD execution (inference off the event loop)
+    vad_execution_mode: str = "thread_pool"  # "thread_pool", "batched" or "inline"
+    vad_worker_threads: int = 4
+    vad_batch_max_size: int = 64
+    vad_batch_max_wait_ms: float = 2.0
+    
+    # Turn detector execution (inference off the event loop)
+    turn_detector_worker_threads: int = 2
+    turn_detector_offline: bool = False  # Never use the network to load the model
+    turn_detector_batching: bool = False  # Batch inference across sessions
+    turn_detector_batch_max_size: int = 16
+    turn_detector_batch_max_wait_ms: float = 5.0
+    turn_detector_memo_size: int = 16  # Predictions memoized per turn; 0 = off
+    turn_detector_speculative: bool = False  # Predict on stable interim transcripts
+    turn_detector_speculative_stable_ms: float = 200.0
+    
     # Endpointing delays
     min_endpointing_delay: float = 0.5  # seconds
     max_endpointing_delay: float = 3.0  # seconds
     
+    # Speculative agent responses during the endpointing delay
+    agent_speculative_generation: bool = False
+    agent_speculative_threshold: float = 0.3  # EOU probability
+    
     # Limits
     max_text_size_bytes: int = 4096
     max_audio_chunk_size_bytes: int = 16384  # 16KB
     max_concurrent_connections: int = 1000
     connection_timeout_seconds: int = 300
+    session_reconnect_grace_seconds: float = 30.0  # 0 = release on disconnect
+    
+    # Dashboard event delivery
+    dashboard_event_queue_size: int = 256
+    dashboard_event_drop_policy: str = "drop_oldest"  # "drop_oldest" or "coalesce"
     
     # Metrics
     enable_metrics: bool = True
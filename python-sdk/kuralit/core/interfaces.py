@@ -92,6 +92,15 @@ class STTPlugin(ABC):
         language_code: Optional[str] = None,
     ) -> AsyncIterator[tuple[str, bool, Optional[float]]]:
         \"\"\"Stream audio and yield (transcript, is_final, confidence).\"\"\"
+    
+    Audio arrives as PCM16 unless the handler declares native_encodings
+    (client encodings such as "MULAW" it accepts as-is); streams in one of
+    those are passed through undecoded with that encoding.
+    
+    With VAD-gated streaming the audio stream pauses between utterances.
+    Handlers that keep their provider connection open on their own declare
+    sends_keepalives = True; others are sent a short burst of silence every
+    few seconds while the stream is paused.
     """
     
     @property
@@ -159,6 +168,15 @@ class VADPlugin(ABC):
                 "probability": float
             }
         \"\"\"
+    
+    Handlers that keep per-stream state may also implement create_stream(),
+    returning an independent handler that shares the loaded model. Sessions
+    given a shared handler (e.g. from AgentSession) use it to get their own
+    stream.
+    
+    Handlers may also implement process_frame() (and process_frame_async()),
+    returning an object with event and probability attributes instead of a
+    dict; the server's VAD loop prefers it to avoid a dict per window.
     """
     
     @property
@@ -229,6 +247,16 @@ class TurnDetectorPlugin(ABC):
         Returns:
             Probability (0.0 to 1.0) that user has finished their turn
         \"\"\"
+    
+    predict_end_of_turn() blocks, so the server runs it in the turn detector
+    executor. Handlers may instead provide an async
+    predict_end_of_turn_async(conversation_history) (e.g. one that uses the
+    executor and stops early when cancelled); it is preferred when present.
+    
+    Handlers that cache per-session state between predictions (e.g. token
+    IDs of the committed history) provide clear_cache(cache_key); the server
+    then passes each session's cache_key to the predict methods and clears it
+    when the session's turn commits or the session ends.
     """
     
     @property
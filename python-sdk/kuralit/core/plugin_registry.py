@@ -2,10 +2,16 @@
 
 The PluginRegistry is a centralized system for registering and retrieving
 plugins. Plugins can be registered manually or automatically on import.
+
+Built-in plugins are not imported up front: a plugin's module pulls in its
+provider's dependencies (google-cloud-speech, aiohttp, onnxruntime,
+transformers), so it is imported, and registers itself, the first time it
+is looked up by name.
 """
 
+import importlib
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
 from kuralit.core.interfaces import (
     LLMPlugin,
@@ -16,6 +22,17 @@ from kuralit.core.interfaces import (
 
 logger = logging.getLogger(__name__)
 
+# Built-in plugin modules by plugin type and name, imported on first lookup
+_BUILTIN_PLUGINS: Dict[str, Dict[str, str]] = {
+    "llm": {"gemini": "kuralit.plugins.llm.gemini"},
+    "stt": {
+        "deepgram": "kuralit.plugins.stt.deepgram",
+        "google": "kuralit.plugins.stt.google",
+    },
+    "vad": {"silero": "kuralit.plugins.vad.silero"},
+    "turn_detector": {"multilingual": "kuralit.plugins.turn_detector.multilingual"},
+}
+
 
 class PluginRegistry:
     """Centralized registry for all plugins.
@@ -30,6 +47,8 @@ class PluginRegistry:
     _stt_plugins: Dict[str, STTPlugin] = {}
     _vad_plugins: Dict[str, VADPlugin] = {}
     _turn_detector_plugins: Dict[str, TurnDetectorPlugin] = {}
+    # Built-in plugins whose import failed (missing dependencies)
+    _unavailable_builtins: Set[Tuple[str, str]] = set()
     
     @classmethod
     def register_llm_plugin(cls, plugin: LLMPlugin) -> None:
@@ -111,7 +130,10 @@ class PluginRegistry:
         Returns:
             LLM plugin instance or None if not found
         """
-        return cls._llm_plugins.get(name.lower())
+        name = name.lower()
+        if name not in cls._llm_plugins:
+            cls._load_builtin("llm", name)
+        return cls._llm_plugins.get(name)
     
     @classmethod
     def get_stt_plugin(cls, name: str) -> Optional[STTPlugin]:
@@ -123,7 +145,10 @@ class PluginRegistry:
         Returns:
             STT plugin instance or None if not found
         """
-        return cls._stt_plugins.get(name.lower())
+        name = name.lower()
+        if name not in cls._stt_plugins:
+            cls._load_builtin("stt", name)
+        return cls._stt_plugins.get(name)
     
     @classmethod
     def get_vad_plugin(cls, name: str) -> Optional[VADPlugin]:
@@ -135,7 +160,10 @@ class PluginRegistry:
         Returns:
             VAD plugin instance or None if not found
         """
-        return cls._vad_plugins.get(name.lower())
+        name = name.lower()
+        if name not in cls._vad_plugins:
+            cls._load_builtin("vad", name)
+        return cls._vad_plugins.get(name)
     
     @classmethod
     def get_turn_detector_plugin(cls, name: str) -> Optional[TurnDetectorPlugin]:
@@ -147,43 +175,73 @@ class PluginRegistry:
         Returns:
             Turn Detector plugin instance or None if not found
         """
-        return cls._turn_detector_plugins.get(name.lower())
+        name = name.lower()
+        if name not in cls._turn_detector_plugins:
+            cls._load_builtin("turn_detector", name)
+        return cls._turn_detector_plugins.get(name)
     
     @classmethod
     def list_llm_plugins(cls) -> List[str]:
         """List all registered LLM plugin names.
         
         Returns:
-            List of plugin names
+            List of plugin names (built-in plugins included, loaded or not)
         """
-        return list(cls._llm_plugins.keys())
+        return cls._list("llm", cls._llm_plugins)
     
     @classmethod
     def list_stt_plugins(cls) -> List[str]:
         """List all registered STT plugin names.
         
         Returns:
-            List of plugin names
+            List of plugin names (built-in plugins included, loaded or not)
         """
-        return list(cls._stt_plugins.keys())
+        return cls._list("stt", cls._stt_plugins)
     
     @classmethod
     def list_vad_plugins(cls) -> List[str]:
         """List all registered VAD plugin names.
         
         Returns:
-            List of plugin names
+            List of plugin names (built-in plugins included, loaded or not)
         """
-        return list(cls._vad_plugins.keys())
+        return cls._list("vad", cls._vad_plugins)
     
     @classmethod
     def list_turn_detector_plugins(cls) -> List[str]:
         """List all registered Turn Detector plugin names.
         
         Returns:
-            List of plugin names
+            List of plugin names (built-in plugins included, loaded or not)
         """
-        return list(cls._turn_detector_plugins.keys())
+        return cls._list("turn_detector", cls._turn_detector_plugins)
+    
+    @classmethod
+    def _load_builtin(cls, plugin_type: str, name: str) -> None:
+        """Import a built-in plugin's module, which registers the plugin.
+        
+        Args:
+            plugin_type: Plugin type ("llm", "stt", "vad" or "turn_detector")
+            name: Plugin name (lowercase)
+        """
+        module = _BUILTIN_PLUGINS.get(plugin_type, {}).get(name)
+        if module is None or (plugin_type, name) in cls._unavailable_builtins:
+            return
+        try:
+            importlib.import_module(module)
+        except ImportError as e:
+            cls._unavailable_builtins.add((plugin_type, name))
+            logger.warning(f"Failed to import plugin '{name}' ({module}): {e}")
+    
+    @classmethod
+    def _list(cls, plugin_type: str, plugins: Dict[str, object]) -> List[str]:
+        """Registered plugin names, then built-in names not imported yet."""
+        names = list(plugins.keys())
+        names.extend(
+            name for name in _BUILTIN_PLUGINS.get(plugin_type, {})
+            if name not in plugins and (plugin_type, name) not in cls._unavailable_builtins
+        )
+        return names
     
     @classmethod
     def clear_all(cls) -> None:
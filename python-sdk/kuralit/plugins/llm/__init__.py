@@ -1,10 +1,15 @@
 """LLM plugins for Kuralit.
 
 This module provides access to all LLM plugins.
+
+Plugins are imported (and registered) on first access, or when the
+PluginRegistry resolves them by name.
 """
 
-# Import gemini module to trigger auto-registration
-from kuralit.plugins.llm import gemini
+from kuralit.utils.lazy import lazy_attributes
 
-__all__ = ["gemini"]
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    "gemini": "kuralit.plugins.llm.gemini",
+})
 
+__all__ = ["gemini"]
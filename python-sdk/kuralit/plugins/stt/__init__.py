@@ -1,10 +1,16 @@
 """STT plugins for Kuralit.
 
 This module provides access to all STT plugins.
+
+Plugins are imported (and registered) on first access, or when the
+PluginRegistry resolves them by name.
 """
 
-# Import plugins to trigger auto-registration
-from kuralit.plugins.stt import deepgram, google
+from kuralit.utils.lazy import lazy_attributes
 
-__all__ = ["deepgram", "google"]
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    "deepgram": "kuralit.plugins.stt.deepgram",
+    "google": "kuralit.plugins.stt.google",
+})
 
+__all__ = ["deepgram", "google"]
@@ -20,6 +20,13 @@ from kuralit.server.exceptions import STTError
 
 logger = logging.getLogger(__name__)
 
+# Client audio encodings Deepgram accepts as-is, with its names for them
+DEEPGRAM_ENCODINGS = {
+    "PCM16": "linear16",
+    "MULAW": "mulaw",
+    "ALAW": "alaw",
+}
+
 
 @dataclass
 class DeepgramOptions:
@@ -56,6 +63,12 @@ class DeepgramSTTHandler:
     _KEEPALIVE_MSG = json.dumps({"type": "KeepAlive"})
     _CLOSE_MSG = json.dumps({"type": "CloseStream"})
     
+    # Encodings streamed to Deepgram without decoding to PCM16 first
+    native_encodings = tuple(DEEPGRAM_ENCODINGS)
+    
+    # _keepalive_task keeps the connection open while no audio is sent
+    sends_keepalives = True
+    
     def __init__(self, config: STTConfig):
         """
         Initialize Deepgram STT handler.
@@ -149,6 +162,8 @@ class DeepgramSTTHandler:
             self.options.language = language_code
         
         self.options.sample_rate = sample_rate
+        if encoding in DEEPGRAM_ENCODINGS:
+            self.options.encoding = DEEPGRAM_ENCODINGS[encoding]
         
         # Queue for passing transcripts from receiver task to this generator
         transcript_queue: asyncio.Queue[Optional[tuple[str, bool, Optional[float]]]] = asyncio.Queue()
@@ -20,6 +20,9 @@ except ImportError:
 class GoogleSTTHandler:
     """Handles Speech-to-Text transcription using Google Cloud Speech-to-Text API."""
     
+    # Encodings streamed to Google without decoding to PCM16 first
+    native_encodings = ("PCM16", "MULAW")
+    
     def __init__(self, config: STTConfig):
         """Initialize STT handler.
         
@@ -101,7 +104,7 @@ class GoogleSTTHandler:
         if sample_rate not in [8000, 16000, 44100, 48000]:
             return False
         
-        if encoding not in ["PCM16", "PCM8"]:
+        if encoding not in ["PCM16", "PCM8", "MULAW"]:
             return False
         
         # Check minimum size (at least 1 frame)
@@ -140,6 +143,7 @@ class GoogleSTTHandler:
             encoding_map = {
                 "PCM16": speech_types.RecognitionConfig.AudioEncoding.LINEAR16,
                 "PCM8": speech_types.RecognitionConfig.AudioEncoding.LINEAR16,  # Fallback
+                "MULAW": speech_types.RecognitionConfig.AudioEncoding.MULAW,
             }
             speech_encoding = encoding_map.get(encoding, speech_types.RecognitionConfig.AudioEncoding.LINEAR16)
             
@@ -208,6 +212,7 @@ class GoogleSTTHandler:
             encoding_map = {
                 "PCM16": speech_types.RecognitionConfig.AudioEncoding.LINEAR16,
                 "PCM8": speech_types.RecognitionConfig.AudioEncoding.LINEAR16,
+                "MULAW": speech_types.RecognitionConfig.AudioEncoding.MULAW,
             }
             speech_encoding = encoding_map.get(encoding, speech_types.RecognitionConfig.AudioEncoding.LINEAR16)
             
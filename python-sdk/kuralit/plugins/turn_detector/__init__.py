@@ -1,10 +1,15 @@
 """Turn Detector plugins for Kuralit.
 
 This module provides access to all Turn Detector plugins.
+
+Plugins are imported (and registered) on first access, or when the
+PluginRegistry resolves them by name.
 """
 
-# Import plugins to trigger auto-registration
-from kuralit.plugins.turn_detector import multilingual
+from kuralit.utils.lazy import lazy_attributes
 
-__all__ = ["multilingual"]
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    "multilingual": "kuralit.plugins.turn_detector.multilingual",
+})
 
+__all__ = ["multilingual"]
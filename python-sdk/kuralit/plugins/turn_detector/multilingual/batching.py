@@ -0,0 +1,273 @@
+"""Cross-session dynamic batching for turn detector inference."""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def build_batches(
+    input_names: List[str],
+    sequences: List[List[int]],
+    pad_token_id: int = 0,
+) -> List[Tuple[List[int], Dict[str, np.ndarray]]]:
+    """Build ONNX feeds for a batch of token ID sequences.
+    
+    Models with an attention_mask input get one feed: sequences are
+    left-padded to the longest, so each row's last position is its last
+    real token, and masked (position_ids, if the model takes them, count
+    real tokens only). Models without one would attend to padding, so
+    sequences are grouped by length and each group runs unpadded.
+    
+    Args:
+        input_names: Names of the model's inputs
+        sequences: Token IDs of each request
+        pad_token_id: Token used for padding
+    
+    Returns:
+        List of (request indices, feed) pairs
+    """
+    if "attention_mask" not in input_names:
+        groups: Dict[int, List[int]] = {}
+        for i, ids in enumerate(sequences):
+            groups.setdefault(len(ids), []).append(i)
+        return [
+            (indices, {"input_ids": np.array([sequences[i] for i in indices], dtype=np.int64)})
+            for indices in groups.values()
+        ]
+    
+    length = max(len(ids) for ids in sequences)
+    input_ids = np.full((len(sequences), length), pad_token_id, dtype=np.int64)
+    attention_mask = np.zeros((len(sequences), length), dtype=np.int64)
+    for row, ids in enumerate(sequences):
+        input_ids[row, length - len(ids):] = ids
+        attention_mask[row, length - len(ids):] = 1
+    feed = {"input_ids": input_ids, "attention_mask": attention_mask}
+    if "position_ids" in input_names:
+        feed["position_ids"] = np.maximum(np.cumsum(attention_mask, axis=1) - 1, 0)
+    return [(list(range(len(sequences))), feed)]
+
+
+class TurnDetectorBatcher:
+    """Collects end-of-turn requests from many sessions into batched inference.
+    
+    Sessions await infer() with their tokenized context. The batcher waits
+    up to max_wait_ms for up to max_batch_size requests, runs them through
+    the shared ONNX session in one call (see build_batches) on its inference
+    thread and resolves each request with the probability at its last token.
+    Requests that arrive while a batch is running form the next batch, and
+    requests cancelled before their batch runs are left out.
+    
+    The wait ends early once as many requests are pending as the previous
+    batch held, so a lone session is not delayed by max_wait_ms.
+    """
+    
+    def __init__(
+        self,
+        session: Any,
+        pad_token_id: int = 0,
+        max_batch_size: int = 16,
+        max_wait_ms: float = 5.0,
+    ):
+        """Initialize batcher.
+        
+        Args:
+            session: Shared turn detector onnxruntime.InferenceSession
+            pad_token_id: Token used to left-pad shorter contexts
+            max_batch_size: Maximum requests per inference call
+            max_wait_ms: Maximum time to wait for a batch to fill
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms must be non-negative")
+        
+        self._session = session
+        self._input_names = [model_input.name for model_input in session.get_inputs()]
+        self._pad_token_id = pad_token_id
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_ms / 1000.0
+        
+        self._pending: List[Tuple[List[int], asyncio.Future]] = []
+        self._last_batch_size = 1
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kuralit-turn-batch")
+        
+        # Metrics
+        self._batches = 0
+        self._requests = 0
+        self._runs = 0  # Inference calls (more than batches if grouped by length)
+        self._max_batch = 0
+        self._padding_tokens = 0
+        self._inference_seconds = 0.0
+    
+    async def infer(self, input_ids: List[int]) -> float:
+        """Run end-of-turn inference for one tokenized context.
+        
+        Args:
+            input_ids: Token IDs of the formatted conversation
+        
+        Returns:
+            End-of-turn probability (0.0 to 1.0)
+        """
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = loop.create_task(self._run())
+        
+        future = loop.create_future()
+        self._pending.append((input_ids, future))
+        self._wakeup.set()
+        return await future
+    
+    async def _run(self) -> None:
+        """Form batches and run them on the inference thread."""
+        loop = asyncio.get_running_loop()
+        while True:
+            while not self._pending:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+            
+            # Give other sessions up to max_wait to join the batch
+            target = min(self.max_batch_size, self._last_batch_size)
+            deadline = loop.time() + self.max_wait_seconds
+            while len(self._pending) < target:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), remaining)
+                except asyncio.TimeoutError:
+                    break
+            
+            batch = self._pending[:self.max_batch_size]
+            del self._pending[:self.max_batch_size]
+            batch = [item for item in batch if not item[1].cancelled()]
+            if not batch:
+                continue
+            
+            sequences = [item[0] for item in batch]
+            started = time.perf_counter()
+            try:
+                probabilities = await loop.run_in_executor(self._executor, self.run_batch, sequences)
+            except Exception as e:
+                logger.error(f"[TurnDetector] Batched inference failed for {len(batch)} requests: {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            finally:
+                self._inference_seconds += time.perf_counter() - started
+            
+            self._last_batch_size = len(batch)
+            self._batches += 1
+            self._requests += len(batch)
+            if len(batch) > self._max_batch:
+                self._max_batch = len(batch)
+            
+            for (_, future), probability in zip(batch, probabilities):
+                if not future.done():
+                    future.set_result(probability)
+    
+    def run_batch(self, sequences: List[List[int]]) -> List[float]:
+        """Run inference for several tokenized contexts (blocking).
+        
+        Args:
+            sequences: Token IDs of each request
+        
+        Returns:
+            End-of-turn probability of each request, in order
+        """
+        probabilities = [0.0] * len(sequences)
+        for indices, feed in build_batches(self._input_names, sequences, self._pad_token_id):
+            outputs = self._session.run(None, feed)
+            # Probability at each row's last position (the real last token)
+            last = np.asarray(outputs[0]).reshape(len(indices), -1)[:, -1]
+            for i, probability in zip(indices, last.tolist()):
+                probabilities[i] = float(probability)
+            self._runs += 1
+            self._padding_tokens += feed["input_ids"].size - sum(len(sequences[i]) for i in indices)
+        return probabilities
+    
+    def close(self) -> None:
+        """Stop the batching task and inference thread (pending requests are cancelled)."""
+        task = self._task
+        try:
+            if task is not None and not task.done():
+                task.get_loop().call_soon_threadsafe(task.cancel)
+            for _, future in self._pending:
+                future.get_loop().call_soon_threadsafe(future.cancel)
+        except RuntimeError:  # Event loop already closed
+            pass
+        self._pending = []
+        self._executor.shutdown(wait=False)
+    
+    def get_stats(self) -> Dict[str, float]:
+        """Get batching statistics."""
+        return {
+            "batches": self._batches,
+            "requests": self._requests,
+            "inference_runs": self._runs,
+            "average_batch_size": self._requests / self._batches if self._batches else 0.0,
+            "max_batch_size_seen": self._max_batch,
+            "padding_tokens": self._padding_tokens,
+            "pending": len(self._pending),
+            "average_batch_ms": self._inference_seconds / self._batches * 1000 if self._batches else 0.0,
+        }
+
+
+# One batcher per shared ONNX session
+_batchers: Dict[int, TurnDetectorBatcher] = {}
+_batchers_lock = threading.Lock()
+
+
+def get_turn_detector_batcher(
+    session: Any,
+    pad_token_id: int = 0,
+    max_batch_size: int = 16,
+    max_wait_ms: float = 5.0,
+) -> TurnDetectorBatcher:
+    """Get the batcher for a shared session, creating it on first use.
+    
+    The first caller's batch settings apply to the session's batcher.
+    
+    Args:
+        session: Shared turn detector onnxruntime.InferenceSession
+        pad_token_id: Token used to left-pad shorter contexts
+        max_batch_size: Maximum requests per inference call
+        max_wait_ms: Maximum time to wait for a batch to fill
+    
+    Returns:
+        TurnDetectorBatcher for the session
+    """
+    with _batchers_lock:
+        batcher = _batchers.get(id(session))
+        if batcher is None:
+            batcher = TurnDetectorBatcher(session, pad_token_id, max_batch_size, max_wait_ms)
+            _batchers[id(session)] = batcher
+        return batcher
+
+
+def discard_turn_detector_batcher(session: Any) -> None:
+    """Stop and forget the batcher for a session that is being unloaded.
+    
+    Args:
+        session: Shared turn detector onnxruntime.InferenceSession
+    """
+    with _batchers_lock:
+        batcher = _batchers.pop(id(session), None)
+    if batcher is not None:
+        batcher.close()
+
+
+def get_turn_detector_batcher_stats() -> List[Dict[str, float]]:
+    """Get statistics for all turn detector batchers."""
+    return [batcher.get_stats() for batcher in _batchers.values()]
@@ -1,33 +1,42 @@
 """Turn Detector handler using English Turn Detector model."""
 
+import asyncio
+import functools
 import logging
-import math
-import os
-from typing import Dict, List, Optional
+import threading
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
 
 try:
+    import numpy as np
     import onnxruntime as ort
     from transformers import AutoTokenizer
     TURN_DETECTOR_AVAILABLE = True
 except ImportError:
     TURN_DETECTOR_AVAILABLE = False
+    np = None
     ort = None
     AutoTokenizer = None
 
 from kuralit.config.schema import TurnDetectorConfig
+from kuralit.plugins.turn_detector.multilingual.model_registry import (
+    HG_MODEL,
+    MODEL_REVISION,
+    ONNX_FILENAME,
+    acquire_turn_detector_model,
+    release_turn_detector_model,
+)
 from kuralit.server.exceptions import AudioProcessingError
+from kuralit.server.turn_detector_executor import get_turn_detector_executor
 
 logger = logging.getLogger(__name__)
 
-# Model configuration
-HG_MODEL = "livekit/turn-detector"
-MODEL_REVISION = "v1.2.2-en"  # English model revision
-ONNX_FILENAME = "model_q8.onnx"
-
 # Model limits
 MAX_HISTORY_TOKENS = 128
 MAX_HISTORY_TURNS = 6
 
+# Stands in for message content when deriving the chat template's wrapper
+_CONTENT_PLACEHOLDER = "\x00content\x00"
+
 
 class MultilingualTurnDetectorHandler:
     """Multilingual Turn Detector Model - Standalone Implementation"""
@@ -53,78 +62,39 @@ class MultilingualTurnDetectorHandler:
             )
         
         threshold = config.threshold
-        model_path = config.model_path
-        tokenizer_path = config.tokenizer_path
         
         if not (0.0 <= threshold <= 1.0):
             raise ValueError("threshold must be between 0.0 and 1.0")
         
         self._threshold = threshold
         
-        # Download model if not provided
-        # Handle empty string as None (already handled in config loader)
-        
-        if model_path is None:
-            try:
-                from huggingface_hub import hf_hub_download
-                logger.info(f"Downloading Turn Detector model from Hugging Face: {HG_MODEL} (revision: {MODEL_REVISION})")
-                model_path = hf_hub_download(
-                    repo_id=HG_MODEL,
-                    filename=ONNX_FILENAME,
-                    subfolder="onnx",
-                    revision=MODEL_REVISION,
-                )
-                logger.info(f"Downloaded ONNX model to: {model_path}")
-            except Exception as e:
-                raise AudioProcessingError(
-                    f"Failed to download Turn Detector model: {str(e)}",
-                    retriable=False
-                ) from e
-        else:
-            if not os.path.exists(model_path):
-                raise AudioProcessingError(
-                    f"Turn Detector model file not found: {model_path}",
-                    retriable=False
-                )
-        
-        # Load ONNX model
-        try:
-            sess_options = ort.SessionOptions()
-            sess_options.intra_op_num_threads = max(1, min(math.ceil((os.cpu_count() or 1) // 2), 4))
-            sess_options.inter_op_num_threads = 1
-            sess_options.add_session_config_entry("session.dynamic_block_base", "4")
-            
-            providers = ["CPUExecutionProvider"] if force_cpu else None
-            self._session = ort.InferenceSession(
-                model_path,
-                providers=providers,
-                sess_options=sess_options
-            )
-            logger.info(f"Successfully loaded Turn Detector ONNX model from: {model_path}")
-        except Exception as e:
-            raise AudioProcessingError(
-                f"Failed to load Turn Detector ONNX model: {str(e)}",
-                retriable=False
-            ) from e
+        # ONNX session and tokenizer are shared by all handlers on the same
+        # model (loaded, or downloaded, by the first one)
+        self._model = acquire_turn_detector_model(
+            model_path=config.model_path,
+            tokenizer_path=config.tokenizer_path,
+            force_cpu=force_cpu,
+            offline=getattr(config, 'offline', False),
+        )
+        self._session = self._model.session
+        self._tokenizer = self._model.tokenizer
+        self._input_names = self._model.input_names
+        self._batcher = None
         
-        # Load tokenizer
-        try:
-            if tokenizer_path is None:
-                logger.info(f"Loading Turn Detector tokenizer from Hugging Face: {HG_MODEL} (revision: {MODEL_REVISION})")
-                self._tokenizer = AutoTokenizer.from_pretrained(
-                    HG_MODEL,
-                    revision=MODEL_REVISION,
-                    local_files_only=False,
-                    truncation_side="left",
-                )
-            else:
-                self._tokenizer = AutoTokenizer.from_pretrained(tokenizer_path)
-            logger.info("Successfully loaded Turn Detector tokenizer")
-        except Exception as e:
-            raise AudioProcessingError(
-                f"Failed to load Turn Detector tokenizer: {str(e)}",
-                retriable=False
-            ) from e
+        # Incremental tokenization: the committed history changes once per
+        # turn while the user transcript changes on every check, so prefix
+        # token IDs are cached and only the last message is tokenized. One
+        # prefix per cache key (session), since the handler may be shared
+        self._prefix_cache: Dict[Hashable, Tuple[Tuple[Tuple[str, str], ...], List[int]]] = {}
+        self._message_templates = self._model.message_templates
+        self._cache_lock = threading.Lock()
+        self.prefix_cache_hits = 0
+        self.prefix_cache_misses = 0
+    
+    @property
+    def max_history_turns(self) -> int:
+        """Most recent messages the model reads (older ones are ignored)"""
+        return MAX_HISTORY_TURNS
     
     @property
     def threshold(self) -> float:
@@ -138,17 +108,15 @@ class MultilingualTurnDetectorHandler:
             raise ValueError("threshold must be between 0.0 and 1.0")
         self._threshold = value
     
-    def _format_chat_context(self, chat_ctx: List[Dict[str, str]]) -> str:
-        """Format conversation history for the model.
+    def _merge_turns(self, chat_ctx: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """Drop empty messages and combine adjacent messages with the same role.
         
         Args:
             chat_ctx: List of messages with "role" and "content" keys
-                    Example: [{"role": "user", "content": "Hello"}, ...]
         
         Returns:
-            Formatted text string for tokenization
+            New list of messages (inputs are not modified)
         """
-        # Combine adjacent messages with same role
         new_chat_ctx = []
         last_msg = None
         
@@ -162,12 +130,24 @@ class MultilingualTurnDetectorHandler:
             if last_msg and last_msg["role"] == msg["role"]:
                 last_msg["content"] += f" {content}"
             else:
-                new_chat_ctx.append(msg.copy())
+                new_chat_ctx.append({"role": msg["role"], "content": content})
                 last_msg = new_chat_ctx[-1]
         
+        return new_chat_ctx
+    
+    def _format_chat_context(self, chat_ctx: List[Dict[str, str]]) -> str:
+        """Format conversation history for the model.
+        
+        Args:
+            chat_ctx: List of messages with "role" and "content" keys
+                    Example: [{"role": "user", "content": "Hello"}, ...]
+        
+        Returns:
+            Formatted text string for tokenization
+        """
         # Apply chat template
         convo_text = self._tokenizer.apply_chat_template(
-            new_chat_ctx,
+            self._merge_turns(chat_ctx),
             add_generation_prompt=False,
             add_special_tokens=False,
             tokenize=False
@@ -179,9 +159,148 @@ class MultilingualTurnDetectorHandler:
         
         return text
     
-    def predict_end_of_turn(self, conversation_history: List[Dict[str, str]]) -> float:
+    def _encode(self, text: str) -> List[int]:
+        """Tokenize text without special tokens or truncation."""
+        return self._tokenizer(text, add_special_tokens=False)["input_ids"]
+    
+    def _message_template(self, role: str) -> Optional[Tuple[str, str]]:
+        """Get the text the chat template puts before and after a message.
+        
+        Derived once per role by rendering a message after another one. None
+        if appending a message does not just append text, or the message
+        does not start with a special token (tokenizing it separately from
+        the prefix would then not give the same token IDs).
+        """
+        if role in self._message_templates:
+            return self._message_templates[role]
+        
+        template = None
+        try:
+            first = [{"role": "assistant" if role == "user" else "user", "content": "a"}]
+            base = self._tokenizer.apply_chat_template(first, add_generation_prompt=False, tokenize=False)
+            text = self._tokenizer.apply_chat_template(
+                first + [{"role": role, "content": _CONTENT_PLACEHOLDER}],
+                add_generation_prompt=False,
+                tokenize=False,
+            )
+            if text.startswith(base):
+                head, found, tail = text[len(base):].partition(_CONTENT_PLACEHOLDER)
+                special_tokens = set(self._tokenizer.get_added_vocab()) | set(self._tokenizer.all_special_tokens)
+                if found and "<|im_end|>" in tail and any(head.startswith(token) for token in special_tokens if token):
+                    template = (head, tail)
+        except Exception as e:
+            logger.debug(f"[TurnDetector] Chat template not splittable for role {role!r}: {e}")
+        
+        if template is None:
+            logger.info(f"[TurnDetector] Incremental tokenization unavailable for role {role!r}, tokenizing full context")
+        self._message_templates[role] = template
+        return template
+    
+    def _tokenize_chat(self, chat_ctx: List[Dict[str, str]], cache_key: Optional[Hashable] = None) -> List[int]:
+        """Tokenize conversation history, truncated to MAX_HISTORY_TOKENS.
+        
+        Gives the same token IDs as tokenizing _format_chat_context(), but
+        the committed prefix (all messages before the last) is looked up in
+        the prefix cache, so usually only the last message is tokenized.
+        
+        Args:
+            chat_ctx: List of messages with "role" and "content" keys
+            cache_key: Session the prefix is cached for (None: not cached)
+        
+        Returns:
+            Token IDs (empty if there is nothing to tokenize)
+        """
+        merged = self._merge_turns(chat_ctx)
+        last = merged[-1] if merged else None
+        template = self._message_template(last["role"]) if len(merged) > 1 else None
+        
+        if template is None:
+            text = self._format_chat_context(merged)
+            if not text.strip():
+                return []
+            ids = self._encode(text)
+        else:
+            key = tuple((msg["role"], msg["content"]) for msg in merged[:-1])
+            prefix_ids = None
+            if cache_key is not None:
+                with self._cache_lock:
+                    cached = self._prefix_cache.get(cache_key)
+                    if cached is not None and cached[0] == key:
+                        prefix_ids = cached[1]
+                        self.prefix_cache_hits += 1
+            
+            if prefix_ids is None:
+                prefix_text = self._tokenizer.apply_chat_template(
+                    merged[:-1],
+                    add_generation_prompt=False,
+                    add_special_tokens=False,
+                    tokenize=False
+                )
+                prefix_ids = self._encode(prefix_text)
+                if cache_key is not None:
+                    with self._cache_lock:
+                        self.prefix_cache_misses += 1
+                        self._prefix_cache[cache_key] = (key, prefix_ids)
+            
+            # Last message without its EOU token (as in _format_chat_context)
+            head, tail = template
+            text = head + last["content"] + tail
+            ids = prefix_ids + self._encode(text[:text.rfind("<|im_end|>")])
+        
+        if len(ids) > MAX_HISTORY_TOKENS:
+            if self._tokenizer.truncation_side == "left":
+                ids = ids[-MAX_HISTORY_TOKENS:]
+            else:
+                ids = ids[:MAX_HISTORY_TOKENS]
+        return ids
+    
+    def tokenize_history(
+        self,
+        conversation_history: List[Dict[str, str]],
+        cache_key: Optional[Hashable] = None,
+    ) -> List[int]:
+        """Tokenize the last max_history_turns messages for the model.
+        
+        Args:
+            conversation_history: List of messages with "role" and "content"
+            cache_key: Session the history prefix is cached for (None: not cached)
+        
+        Returns:
+            Token IDs, at most MAX_HISTORY_TOKENS (empty if nothing to tokenize)
+        """
+        return self._tokenize_chat(conversation_history[-MAX_HISTORY_TURNS:], cache_key)
+    
+    def clear_cache(self, cache_key: Optional[Hashable] = None) -> None:
+        """Drop a session's cached prefix token IDs (e.g. when its turn commits).
+        
+        Args:
+            cache_key: Session to drop (None: all sessions)
+        """
+        with self._cache_lock:
+            if cache_key is None:
+                self._prefix_cache.clear()
+            else:
+                self._prefix_cache.pop(cache_key, None)
+    
+    def close(self) -> None:
+        """Release the shared model (the handler cannot be used afterwards)."""
+        self.clear_cache()
+        if self._model is not None:
+            model, self._model = self._model, None
+            self._batcher = None
+            release_turn_detector_model(model)
+    
+    def predict_end_of_turn(
+        self,
+        conversation_history: List[Dict[str, str]],
+        is_cancelled: Optional[Callable[[], bool]] = None,
+        cache_key: Optional[Hashable] = None,
+    ) -> float:
         """Predict the probability that the user has finished their turn.
         
+        Blocks for the tokenization and ONNX run; from the event loop use
+        predict_end_of_turn_async().
+        
         Args:
             conversation_history: List of messages with "role" and "content"
                 Example: [
@@ -189,6 +308,9 @@ class MultilingualTurnDetectorHandler:
                     {"role": "assistant", "content": "Hi there!"},
                     {"role": "user", "content": "How are you?"}
                 ]
+            is_cancelled: Checked before the ONNX run; if it returns True
+                the prediction is abandoned and 0.0 returned
+            cache_key: Session the history prefix is cached for (None: not cached)
         
         Returns:
             Probability score (0.0 to 1.0) indicating likelihood of end-of-turn
@@ -202,40 +324,26 @@ class MultilingualTurnDetectorHandler:
             return 0.0
         
         try:
-            # Limit to last N turns
-            chat_ctx = conversation_history[-MAX_HISTORY_TURNS:]
-            
-            logger.debug(f"[TurnDetector] Processing {len(chat_ctx)} messages from history (total: {len(conversation_history)})")
+            logger.debug(f"[TurnDetector] Processing {min(len(conversation_history), MAX_HISTORY_TURNS)} messages from history (total: {len(conversation_history)})")
             
-            # Format the conversation
-            text = self._format_chat_context(chat_ctx)
+            # Tokenize (only the last message unless the history prefix changed)
+            input_ids = self.tokenize_history(conversation_history, cache_key)
             
-            if not text or len(text.strip()) == 0:
-                logger.warning("[TurnDetector] Formatted text is empty, returning 0.0")
+            if not input_ids:
+                logger.warning("[TurnDetector] Tokenized input is empty, returning 0.0")
                 return 0.0
             
-            logger.debug(f"[TurnDetector] Formatted text length: {len(text)} chars")
-            
-            # Tokenize
-            inputs = self._tokenizer(
-                text,
-                add_special_tokens=False,
-                return_tensors="np",
-                max_length=MAX_HISTORY_TOKENS,
-                truncation=True,
-            )
+            logger.debug(f"[TurnDetector] Tokenized input length: {len(input_ids)}")
             
-            if inputs["input_ids"].size == 0:
-                logger.warning("[TurnDetector] Tokenized input is empty, returning 0.0")
+            if is_cancelled is not None and is_cancelled():
+                logger.debug("[TurnDetector] Prediction cancelled before inference")
                 return 0.0
             
-            logger.debug(f"[TurnDetector] Tokenized input shape: {inputs['input_ids'].shape}")
-            
             # Run inference
-            outputs = self._session.run(
-                None,
-                {"input_ids": inputs["input_ids"].astype("int64")}
-            )
+            feed = {"input_ids": np.array([input_ids], dtype=np.int64)}
+            if "attention_mask" in self._input_names:
+                feed["attention_mask"] = np.ones_like(feed["input_ids"])
+            outputs = self._session.run(None, feed)
             
             if outputs is None or len(outputs) == 0:
                 logger.warning("[TurnDetector] Model output is empty, returning 0.0")
@@ -257,6 +365,68 @@ class MultilingualTurnDetectorHandler:
             logger.error(f"[TurnDetector] Error predicting end of turn: {e}", exc_info=True)
             return 0.0
     
+    async def predict_end_of_turn_async(
+        self,
+        conversation_history: List[Dict[str, str]],
+        cache_key: Optional[Hashable] = None,
+    ) -> float:
+        """Predict end-of-turn probability in the turn detector executor.
+        
+        Keeps the event loop free while the prediction runs. Cancelling the
+        awaiting task drops the request if it has not started, or skips the
+        ONNX run if it is still tokenizing. With batching enabled, only the
+        tokenization runs in the executor and inference is batched with
+        other sessions.
+        
+        Args:
+            conversation_history: List of messages with "role" and "content"
+            cache_key: Session the history prefix is cached for (None: not cached)
+        
+        Returns:
+            Probability score (0.0 to 1.0) indicating likelihood of end-of-turn
+        """
+        if self._batcher is None:
+            return await get_turn_detector_executor().run(
+                functools.partial(self.predict_end_of_turn, cache_key=cache_key),
+                conversation_history,
+                cancellable=True,
+            )
+        
+        try:
+            input_ids = await get_turn_detector_executor().run(
+                functools.partial(self.tokenize_history, cache_key=cache_key), conversation_history
+            )
+            if not input_ids:
+                logger.warning("[TurnDetector] Tokenized input is empty, returning 0.0")
+                return 0.0
+            return await self._batcher.infer(input_ids)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"[TurnDetector] Error predicting end of turn: {e}", exc_info=True)
+            return 0.0
+    
+    def enable_batching(self, max_batch_size: int = 16, max_wait_ms: float = 5.0) -> None:
+        """Batch this handler's inference with other sessions on the same model.
+        
+        Applies to predict_end_of_turn_async(); one batcher is shared by all
+        handlers over the same model.
+        
+        Args:
+            max_batch_size: Maximum requests per inference call
+            max_wait_ms: Maximum time to wait for a batch to fill
+        """
+        from kuralit.plugins.turn_detector.multilingual.batching import get_turn_detector_batcher
+        pad_token_id = self._tokenizer.pad_token_id
+        if pad_token_id is None:
+            pad_token_id = self._tokenizer.eos_token_id or 0
+        self._batcher = get_turn_detector_batcher(self._session, pad_token_id, max_batch_size, max_wait_ms)
+    
+    @property
+    def batching_enabled(self) -> bool:
+        """Whether predict_end_of_turn_async() batches across sessions"""
+        return self._batcher is not None
+    
     def is_end_of_turn(self, conversation_history: List[Dict[str, str]]) -> bool:
         """Check if the conversation indicates end-of-turn.
         
@@ -269,17 +439,22 @@ class MultilingualTurnDetectorHandler:
         probability = self.predict_end_of_turn(conversation_history)
         return probability > self._threshold
     
-    def convert_message_history(self, messages: List) -> List[Dict[str, str]]:
+    def convert_message_history(self, messages: List, limit: Optional[int] = None) -> List[Dict[str, str]]:
         """Convert message objects to Turn Detector format.
         
         Args:
             messages: List of Message objects (from session.conversation_history)
+            limit: Convert only the last limit non-empty messages (e.g.
+                max_history_turns), so long conversations are not walked in full
         
         Returns:
             List of dicts with "role" and "content" keys
         """
         result = []
-        for msg in messages:
+        for msg in reversed(messages):
+            if limit is not None and len(result) >= limit:
+                break
+            
             # Handle Message objects with to_dict() method
             if hasattr(msg, 'to_dict'):
                 msg_dict = msg.to_dict()
@@ -306,5 +481,5 @@ class MultilingualTurnDetectorHandler:
                     "content": content
                 })
         
+        result.reverse()
         return result
-
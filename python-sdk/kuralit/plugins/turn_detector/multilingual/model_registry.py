@@ -0,0 +1,290 @@
+"""Process-wide registry of turn detector models.
+
+Loading the turn detector means resolving the ONNX file (a Hugging Face
+download, or a network probe when it is cached), loading the tokenizer
+(another probe) and creating an ONNX session with its own intra-op thread
+pool. Handlers are created per session, so each one takes a reference on a
+shared TurnDetectorModel instead, keyed by (model path, tokenizer path,
+revision, force_cpu), and releases it when the session ends. A model no
+handler references is unloaded, except the MAX_IDLE_MODELS most recently
+released, so sessions that come and go one at a time do not reload it.
+
+The registry lock only guards its dicts. Loading runs outside it, so
+/metrics and releases (on the event loop) never wait on a download; a
+second acquirer of a key being loaded waits on that load instead of
+starting another.
+
+Once a key has been loaded, later loads (after it was unloaded) use local
+files only, so the network is only touched by the first load. In offline
+mode the first load does not touch it either and fails if the model and
+tokenizer are not in the Hugging Face cache (or given as paths).
+"""
+
+import logging
+import math
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+try:
+    import onnxruntime as ort
+    from transformers import AutoTokenizer
+except ImportError:
+    ort = None
+    AutoTokenizer = None
+
+from kuralit.server.exceptions import AudioProcessingError
+
+logger = logging.getLogger(__name__)
+
+# Model configuration
+HG_MODEL = "livekit/turn-detector"
+MODEL_REVISION = "v1.2.2-en"  # English model revision
+ONNX_FILENAME = "model_q8.onnx"
+
+# Unreferenced models kept loaded
+MAX_IDLE_MODELS = 1
+
+ModelKey = Tuple[Optional[str], Optional[str], str, bool]
+
+
+class TurnDetectorModel:
+    """A loaded ONNX session and tokenizer shared by turn detector handlers.
+    
+    InferenceSession.run is thread-safe and the tokenizer is only read, so
+    one model serves every handler (and lets their requests be batched).
+    """
+    
+    def __init__(self, key: ModelKey, model_path: str, session: Any, tokenizer: Any):
+        """Initialize model.
+        
+        Args:
+            key: Registry key (model path, tokenizer path, revision, force_cpu)
+            model_path: Resolved path of the ONNX file
+            session: onnxruntime.InferenceSession
+            tokenizer: Hugging Face tokenizer
+        """
+        self.key = key
+        self.model_path = model_path
+        self.session = session
+        self.tokenizer = tokenizer
+        self.input_names = [model_input.name for model_input in session.get_inputs()]
+        # Chat template split per role, derived once per tokenizer
+        self.message_templates: Dict[str, Optional[Tuple[str, str]]] = {}
+        self.references = 0
+
+
+def load_turn_detector_session(model_path: str, force_cpu: bool = True) -> "ort.InferenceSession":
+    """Create an ONNX session for the turn detector model.
+    
+    Args:
+        model_path: Path to the ONNX model file
+        force_cpu: Force CPU execution
+    
+    Returns:
+        onnxruntime.InferenceSession
+    
+    Raises:
+        AudioProcessingError: If model cannot be loaded
+    """
+    try:
+        sess_options = ort.SessionOptions()
+        sess_options.intra_op_num_threads = max(1, min(math.ceil((os.cpu_count() or 1) // 2), 4))
+        sess_options.inter_op_num_threads = 1
+        sess_options.add_session_config_entry("session.dynamic_block_base", "4")
+        
+        providers = ["CPUExecutionProvider"] if force_cpu else None
+        session = ort.InferenceSession(
+            model_path,
+            providers=providers,
+            sess_options=sess_options
+        )
+        logger.info(f"Successfully loaded Turn Detector ONNX model from: {model_path}")
+        return session
+    except Exception as e:
+        raise AudioProcessingError(
+            f"Failed to load Turn Detector ONNX model: {str(e)}",
+            retriable=False
+        ) from e
+
+
+def _resolve_model_path(model_path: Optional[str], revision: str, local_files_only: bool) -> str:
+    """Get the ONNX file path, downloading the model if no path is given."""
+    if model_path is not None:
+        if not os.path.exists(model_path):
+            raise AudioProcessingError(
+                f"Turn Detector model file not found: {model_path}",
+                retriable=False
+            )
+        return model_path
+    
+    try:
+        from huggingface_hub import hf_hub_download
+        logger.info(f"Downloading Turn Detector model from Hugging Face: {HG_MODEL} (revision: {revision}, local_files_only={local_files_only})")
+        model_path = hf_hub_download(
+            repo_id=HG_MODEL,
+            filename=ONNX_FILENAME,
+            subfolder="onnx",
+            revision=revision,
+            local_files_only=local_files_only,
+        )
+        logger.info(f"Downloaded ONNX model to: {model_path}")
+        return model_path
+    except Exception as e:
+        raise AudioProcessingError(
+            f"Failed to download Turn Detector model: {str(e)}",
+            retriable=False
+        ) from e
+
+
+def _load_tokenizer(tokenizer_path: Optional[str], revision: str, local_files_only: bool) -> Any:
+    """Load the tokenizer from a path or the Hugging Face cache/hub."""
+    try:
+        if tokenizer_path is None:
+            logger.info(f"Loading Turn Detector tokenizer from Hugging Face: {HG_MODEL} (revision: {revision}, local_files_only={local_files_only})")
+            tokenizer = AutoTokenizer.from_pretrained(
+                HG_MODEL,
+                revision=revision,
+                local_files_only=local_files_only,
+                truncation_side="left",
+            )
+        else:
+            tokenizer = AutoTokenizer.from_pretrained(tokenizer_path, local_files_only=local_files_only)
+        logger.info("Successfully loaded Turn Detector tokenizer")
+        return tokenizer
+    except Exception as e:
+        raise AudioProcessingError(
+            f"Failed to load Turn Detector tokenizer: {str(e)}",
+            retriable=False
+        ) from e
+
+
+class _PendingLoad:
+    """A load in progress, waited on by other acquirers of the same key."""
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.error: Optional[BaseException] = None
+
+
+_models: Dict[ModelKey, TurnDetectorModel] = {}
+_idle: "OrderedDict[ModelKey, TurnDetectorModel]" = OrderedDict()  # Loaded, unreferenced
+_loaded_keys: Set[ModelKey] = set()  # Keys loaded at least once (files are local)
+_loading: Dict[ModelKey, "_PendingLoad"] = {}  # Loads in progress
+_registry_lock = threading.RLock()
+_registry_stats: Dict[str, int] = {
+    "loads": 0,
+    "reuses": 0,
+    "unloads": 0,
+}
+
+
+def acquire_turn_detector_model(
+    model_path: Optional[str] = None,
+    tokenizer_path: Optional[str] = None,
+    revision: str = MODEL_REVISION,
+    force_cpu: bool = True,
+    offline: bool = False,
+) -> TurnDetectorModel:
+    """Take a reference on the shared model, loading it on first use.
+    
+    Every call must be paired with release_turn_detector_model().
+    
+    Args:
+        model_path: Path to the ONNX model file (None = download from Hugging Face)
+        tokenizer_path: Path to the tokenizer (None = load from Hugging Face)
+        revision: Hugging Face model revision
+        force_cpu: Force CPU execution
+        offline: Never use the network; the model must be local or cached
+    
+    Returns:
+        TurnDetectorModel (shared, do not modify)
+    
+    Raises:
+        AudioProcessingError: If model or tokenizer cannot be loaded
+    """
+    key = (model_path, tokenizer_path, revision, force_cpu)
+    while True:
+        with _registry_lock:
+            model = _models.get(key)
+            if model is not None:
+                _registry_stats["reuses"] += 1
+                _idle.pop(key, None)
+                model.references += 1
+                return model
+            pending = _loading.get(key)
+            loader = pending is None
+            if loader:
+                pending = _loading[key] = _PendingLoad()
+                local_files_only = offline or key in _loaded_keys
+        
+        if not loader:
+            # Another thread is loading this key: wait, then take a reference
+            # (or fail with its error)
+            pending.done.wait()
+            if pending.error is not None:
+                raise pending.error
+            continue
+        
+        try:
+            resolved_path = _resolve_model_path(model_path, revision, local_files_only)
+            tokenizer = _load_tokenizer(tokenizer_path, revision, local_files_only)
+            session = load_turn_detector_session(resolved_path, force_cpu)
+            model = TurnDetectorModel(key, resolved_path, session, tokenizer)
+        except BaseException as e:
+            with _registry_lock:
+                _loading.pop(key, None)
+            pending.error = e
+            pending.done.set()
+            raise
+        
+        with _registry_lock:
+            _loading.pop(key, None)
+            _models[key] = model
+            _loaded_keys.add(key)
+            _registry_stats["loads"] += 1
+            model.references += 1
+        pending.done.set()
+        return model
+
+
+def release_turn_detector_model(model: TurnDetectorModel) -> None:
+    """Drop a reference taken by acquire_turn_detector_model().
+    
+    Args:
+        model: Model to release
+    """
+    with _registry_lock:
+        if model.references <= 0 or _models.get(model.key) is not model:
+            return
+        model.references -= 1
+        if model.references:
+            return
+        
+        _idle[model.key] = model
+        while len(_idle) > MAX_IDLE_MODELS:
+            _, evicted = _idle.popitem(last=False)
+            _unload(evicted)
+
+
+def _unload(model: TurnDetectorModel) -> None:
+    """Remove an unreferenced model and the batcher over its session."""
+    _models.pop(model.key, None)
+    _registry_stats["unloads"] += 1
+    try:
+        from kuralit.plugins.turn_detector.multilingual.batching import discard_turn_detector_batcher
+        discard_turn_detector_batcher(model.session)
+    except ImportError:
+        pass
+    logger.info(f"Unloaded Turn Detector model: {model.model_path}")
+
+
+def get_turn_detector_model_stats() -> Dict[str, Any]:
+    """Get loaded models, their references and load/reuse counters."""
+    with _registry_lock:
+        models: List[Dict[str, Any]] = [
+            {"model_path": model.model_path, "references": model.references}
+            for model in _models.values()
+        ]
+        return dict(_registry_stats, loaded=len(_models), loading=len(_loading), models=models)
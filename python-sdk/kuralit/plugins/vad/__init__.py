@@ -1,10 +1,15 @@
 """VAD plugins for Kuralit.
 
 This module provides access to all VAD plugins.
+
+Plugins are imported (and registered) on first access, or when the
+PluginRegistry resolves them by name.
 """
 
-# Import plugins to trigger auto-registration
-from kuralit.plugins.vad import silero
+from kuralit.utils.lazy import lazy_attributes
 
-__all__ = ["silero"]
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    "silero": "kuralit.plugins.vad.silero",
+})
 
+__all__ = ["silero"]
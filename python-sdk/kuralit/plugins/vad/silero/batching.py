@@ -0,0 +1,169 @@
+"""Cross-stream dynamic batching for Silero VAD inference."""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from kuralit.plugins.vad.silero.handler import SileroVADModel, SileroVADState
+
+logger = logging.getLogger(__name__)
+
+
+class SileroVADBatcher:
+    """Collects pending VAD windows from many streams into batched inference.
+    
+    Streams await infer() for each window. The batcher waits up to
+    max_wait_ms for up to max_batch_size windows, runs a single
+    SileroVADModel.run_batch() on its inference thread and resolves each
+    stream's future with its probability. Windows that arrive while a batch
+    is running form the next batch.
+    
+    The wait ends early once as many windows are pending as the previous
+    batch held, so a lone stream is not delayed by max_wait_ms per window.
+    """
+    
+    def __init__(self, model: SileroVADModel, max_batch_size: int = 64, max_wait_ms: float = 2.0):
+        """Initialize batcher.
+        
+        Args:
+            model: Shared model the streams run on
+            max_batch_size: Maximum windows per inference call
+            max_wait_ms: Maximum time to wait for a batch to fill
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms must be non-negative")
+        
+        self._model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_ms / 1000.0
+        
+        self._pending: List[Tuple[Any, SileroVADState, asyncio.Future]] = []
+        self._last_batch_size = 1
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kuralit-vad-batch")
+        
+        # Metrics
+        self._batches = 0
+        self._windows = 0
+        self._max_batch = 0
+        self._inference_seconds = 0.0
+    
+    async def infer(self, window: Any, state: SileroVADState) -> float:
+        """Run inference for one window of one stream.
+        
+        Args:
+            window: Normalized float32 window (window_size_samples,); may
+                be the state's own window buffer
+            state: The stream's state (updated in place)
+        
+        Returns:
+            Speech probability (0.0 to 1.0)
+        """
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = loop.create_task(self._run())
+        
+        future = loop.create_future()
+        self._pending.append((window, state, future))
+        self._wakeup.set()
+        return await future
+    
+    async def _run(self) -> None:
+        """Form batches and run them on the inference thread."""
+        loop = asyncio.get_running_loop()
+        while True:
+            while not self._pending:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+            
+            # Give other streams up to max_wait to join the batch
+            target = min(self.max_batch_size, self._last_batch_size)
+            deadline = loop.time() + self.max_wait_seconds
+            while len(self._pending) < target:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), remaining)
+                except asyncio.TimeoutError:
+                    break
+            
+            batch = self._pending[:self.max_batch_size]
+            del self._pending[:self.max_batch_size]
+            batch = [item for item in batch if not item[2].cancelled()]
+            if not batch:
+                continue
+            
+            windows = [item[0] for item in batch]
+            states = [item[1] for item in batch]
+            started = time.perf_counter()
+            try:
+                probabilities = await loop.run_in_executor(self._executor, self._model.run_batch, windows, states)
+            except Exception as e:
+                logger.error(f"[VAD] Batched inference failed for {len(batch)} windows: {e}")
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            finally:
+                self._inference_seconds += time.perf_counter() - started
+            
+            self._last_batch_size = len(batch)
+            self._batches += 1
+            self._windows += len(batch)
+            if len(batch) > self._max_batch:
+                self._max_batch = len(batch)
+            
+            for (_, _, future), probability in zip(batch, probabilities):
+                if not future.done():
+                    future.set_result(probability)
+    
+    def get_stats(self) -> Dict[str, float]:
+        """Get batching statistics."""
+        return {
+            "batches": self._batches,
+            "windows": self._windows,
+            "average_batch_size": self._windows / self._batches if self._batches else 0.0,
+            "max_batch_size_seen": self._max_batch,
+            "pending": len(self._pending),
+            "average_batch_ms": self._inference_seconds / self._batches * 1000 if self._batches else 0.0,
+        }
+
+
+# One batcher per shared model
+_batchers: Dict[int, SileroVADBatcher] = {}
+_batchers_lock = threading.Lock()
+
+
+def get_vad_batcher(model: SileroVADModel, max_batch_size: int = 64, max_wait_ms: float = 2.0) -> SileroVADBatcher:
+    """Get the batcher for a model, creating it on first use.
+    
+    The first caller's batch settings apply to the model's batcher.
+    
+    Args:
+        model: Shared SileroVADModel
+        max_batch_size: Maximum windows per inference call
+        max_wait_ms: Maximum time to wait for a batch to fill
+    
+    Returns:
+        SileroVADBatcher for the model
+    """
+    with _batchers_lock:
+        batcher = _batchers.get(id(model))
+        if batcher is None:
+            batcher = SileroVADBatcher(model, max_batch_size, max_wait_ms)
+            _batchers[id(model)] = batcher
+        return batcher
+
+
+def get_vad_batcher_stats() -> List[Dict[str, float]]:
+    """Get statistics for all VAD batchers."""
+    return [batcher.get_stats() for batcher in _batchers.values()]
@@ -1,7 +1,9 @@
 """Voice Activity Detection (VAD) handler using Silero VAD model."""
 
 import logging
-from typing import Any, Dict, Literal, Optional
+import math
+import threading
+from typing import Any, Dict, List, Literal, NamedTuple, Optional, Sequence, Tuple
 
 try:
     import numpy as np
@@ -20,11 +22,65 @@ logger = logging.getLogger(__name__)
 # Supported sample rates
 SUPPORTED_SAMPLE_RATES = [8000, 16000]
 
+# int16 -> [-1.0, 1.0] scale factor (0-d array: a Python float would be
+# converted to an array on every multiply)
+_INT16_SCALE = np.array(1.0 / 32767, dtype=np.float32) if VAD_AVAILABLE else None
+
+
+class VADFrameResult(NamedTuple):
+    """Result of one VAD window (see SileroVADHandler.process_frame)."""
+    
+    event: str
+    probability: float
+    is_speech: bool
+    is_speaking: bool
+
+
+class SileroVADState:
+    """Per-stream Silero VAD state (RNN state and audio context).
+    
+    A few KB per stream; the ONNX session itself is shared through
+    SileroVADModel. All buffers are allocated once and updated in place:
+    input_buffer holds the context followed by the current window (context,
+    window and tail, the next window's context, are views into it), and the
+    ONNX outputs are written to
+    output and rnn_state_out through the stream's IO binding.
+    """
+    
+    __slots__ = ("context", "window", "tail", "rnn_state", "rnn_state_out", "output", "input_buffer", "binding")
+    
+    def __init__(self, context_size: int, window_size_samples: int):
+        """Allocate zeroed state buffers.
+        
+        Args:
+            context_size: Number of context samples carried between windows
+            window_size_samples: Number of audio samples per inference window
+        """
+        self.input_buffer = np.zeros((1, context_size + window_size_samples), dtype=np.float32)
+        self.context = self.input_buffer[:, :context_size]
+        self.window = self.input_buffer[0, context_size:]
+        self.tail = self.input_buffer[:, -context_size:]
+        self.rnn_state = np.zeros((2, 1, 128), dtype=np.float32)
+        self.rnn_state_out = np.zeros((2, 1, 128), dtype=np.float32)
+        self.output = np.zeros((1, 1), dtype=np.float32)
+        self.binding = None  # Created by SileroVADModel on first inference
+    
+    def reset(self) -> None:
+        """Reset RNN state and context buffers."""
+        self.context.fill(0.0)
+        self.rnn_state.fill(0.0)
+
 
 class SileroVADModel:
     """Silero VAD Model - Standalone Implementation
     
-    Processes audio frames to detect speech activity.
+    Processes audio frames to detect speech activity. The model only holds the
+    ONNX session and can be shared by any number of streams, each passing its
+    own SileroVADState; calls without a state use a default one.
+    
+    Single-stream inference runs through onnxruntime IO binding on the
+    state's preallocated buffers, so a window costs no array allocations
+    (sessions without io_binding() fall back to run()).
     """
     
     def __init__(self, onnx_session: onnxruntime.InferenceSession, sample_rate: int):
@@ -48,14 +104,17 @@ class SileroVADModel:
             self._window_size_samples = 512  # 32ms at 16kHz
             self._context_size = 64
         
-        # Initialize RNN state and context buffers
         self._sample_rate_nd = np.array(sample_rate, dtype=np.int64)
-        self._context = np.zeros((1, self._context_size), dtype=np.float32)
-        self._rnn_state = np.zeros((2, 1, 128), dtype=np.float32)
-        self._input_buffer = np.zeros(
-            (1, self._context_size + self._window_size_samples),
-            dtype=np.float32
+        self._use_io_binding = hasattr(onnx_session, "io_binding")
+        
+        # Metrics (approximate under concurrent streams)
+        self.inferences = 0
+        self.windows_skipped = 0
+        self._output_names = (
+            [output.name for output in onnx_session.get_outputs()]
+            if self._use_io_binding else None
         )
+        self._state = self.create_state()
     
     @property
     def window_size_samples(self) -> int:
@@ -67,44 +126,213 @@ class SileroVADModel:
         """Audio sample rate"""
         return self._sample_rate
     
-    def __call__(self, audio_samples: np.ndarray) -> float:
+    def create_state(self) -> SileroVADState:
+        """Create fresh per-stream state for this model."""
+        return SileroVADState(self._context_size, self._window_size_samples)
+    
+    def __call__(self, audio_samples: np.ndarray, state: Optional[SileroVADState] = None) -> float:
         """Run inference on audio samples.
         
         Args:
             audio_samples: Audio samples as float32 array
                           Shape: (window_size_samples,)
                           Values should be normalized to [-1.0, 1.0]
+            state: Per-stream state to read and update (defaults to the
+                   model's own state)
         
         Returns:
             Probability score (0.0 to 1.0) indicating speech likelihood
             Higher values = more likely to be speech
         """
-        # Prepare input buffer with context from previous inference
-        # Context is the last N samples from previous window
-        self._input_buffer[:, :self._context_size] = self._context
-        self._input_buffer[:, self._context_size:] = audio_samples
-        
-        # Prepare ONNX inputs
-        ort_inputs = {
-            "input": self._input_buffer,      # Audio input with context
-            "state": self._rnn_state,        # RNN hidden state
-            "sr": self._sample_rate_nd,      # Sample rate
+        if state is None:
+            state = self._state
+        
+        state.window[:] = audio_samples
+        return self.infer(state)
+    
+    def load_int16(self, audio_frame: np.ndarray, state: SileroVADState) -> None:
+        """Normalize an int16 window into the state's input buffer (no copies).
+        
+        Args:
+            audio_frame: window_size_samples int16 samples
+            state: Per-stream state whose window is overwritten
+        """
+        # Cast into the window, then scale it in place (casting inside the
+        # multiply would go through a temporary buffer)
+        np.copyto(state.window, audio_frame, casting="unsafe")
+        np.multiply(state.window, _INT16_SCALE, out=state.window)
+    
+    def infer(self, state: SileroVADState) -> float:
+        """Run inference on the window already loaded into a state.
+        
+        Args:
+            state: Per-stream state (window loaded via load_int16() or
+                   written to state.window)
+        
+        Returns:
+            Probability score (0.0 to 1.0) indicating speech likelihood
+        """
+        self.inferences += 1
+        if self._use_io_binding:
+            binding = state.binding
+            if binding is None:
+                binding = self._bind(state)
+            self._sess.run_with_iobinding(binding)
+            np.copyto(state.rnn_state, state.rnn_state_out)
+            probability = float(state.output[0, 0])
+        else:
+            out, new_state = self._sess.run(None, {
+                "input": state.input_buffer,     # Audio input with context
+                "state": state.rnn_state,        # RNN hidden state
+                "sr": self._sample_rate_nd,      # Sample rate
+            })
+            np.copyto(state.rnn_state, new_state)
+            probability = float(out.item())
+        
+        # Context for the next window is the tail of this one
+        np.copyto(state.context, state.tail)
+        return probability
+    
+    def skip(self, state: SileroVADState, reset: bool = False) -> None:
+        """Advance a state past its loaded window without running inference.
+        
+        Used for windows known to be silent: the window still becomes the
+        next window's context.
+        
+        Args:
+            state: Per-stream state
+            reset: Also reset the RNN state (after long silence, so the
+                   model does not resume from a state that is long stale)
+        """
+        self.windows_skipped += 1
+        np.copyto(state.context, state.tail)
+        if reset:
+            state.rnn_state.fill(0.0)
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Get inference counters."""
+        return {
+            "sample_rate": self._sample_rate,
+            "inferences": self.inferences,
+            "windows_skipped": self.windows_skipped,
         }
+    
+    def _bind(self, state: SileroVADState) -> Any:
+        """Bind a state's buffers as the session's inputs and outputs.
+        
+        Bindings reference the buffers' memory, so they stay valid as the
+        buffers are updated in place.
+        """
+        binding = self._sess.io_binding()
+        binding.bind_cpu_input("input", state.input_buffer)
+        binding.bind_cpu_input("state", state.rnn_state)
+        binding.bind_cpu_input("sr", self._sample_rate_nd)
+        for name, buffer in zip(self._output_names, (state.output, state.rnn_state_out)):
+            binding.bind_output(name, "cpu", 0, np.float32, buffer.shape, buffer.ctypes.data)
+        state.binding = binding
+        return binding
+    
+    def run_batch(self, windows: Sequence[np.ndarray], states: Sequence[SileroVADState]) -> List[float]:
+        """Run one inference over windows from several streams.
         
-        # Run inference
-        outputs = self._sess.run(None, ort_inputs)
-        out, self._rnn_state = outputs[0], outputs[1]
+        Inputs and RNN states are stacked along the batch dimension; each
+        stream's state is updated exactly as by __call__.
+        
+        Args:
+            windows: One normalized float32 window per stream
+            states: The corresponding per-stream states (distinct objects)
+        
+        Returns:
+            Speech probability per stream, in input order
+        """
+        batch_size = len(states)
+        self.inferences += batch_size
+        input_batch = np.empty((batch_size, self._context_size + self._window_size_samples), dtype=np.float32)
+        state_batch = np.empty((2, batch_size, 128), dtype=np.float32)
+        for i, (window, state) in enumerate(zip(windows, states)):
+            input_batch[i, :self._context_size] = state.context[0]
+            input_batch[i, self._context_size:] = window
+            state_batch[:, i, :] = state.rnn_state[:, 0, :]
         
-        # Update context for next inference (last N samples of current buffer)
-        self._context = self._input_buffer[:, -self._context_size:]
+        out, new_state = self._sess.run(None, {
+            "input": input_batch,
+            "state": state_batch,
+            "sr": self._sample_rate_nd,
+        })
         
-        # Return probability score
-        return float(out.item())
+        for i, state in enumerate(states):
+            state.rnn_state[:, 0, :] = new_state[:, i, :]
+            state.context[0] = input_batch[i, -self._context_size:]
+        return out[:, 0].tolist()
     
     def reset(self) -> None:
-        """Reset RNN state and context buffers."""
-        self._context = np.zeros((1, self._context_size), dtype=np.float32)
-        self._rnn_state = np.zeros((2, 1, 128), dtype=np.float32)
+        """Reset the default state's RNN state and context buffers."""
+        self._state.reset()
+
+
+# Process-wide ONNX sessions keyed by (model path, force_cpu)
+_shared_sessions: Dict[Tuple[Optional[str], bool], "onnxruntime.InferenceSession"] = {}
+_shared_sessions_lock = threading.Lock()
+
+
+def get_shared_vad_session(onnx_file_path: Optional[str] = None, force_cpu: bool = True) -> onnxruntime.InferenceSession:
+    """Get the process-wide Silero VAD ONNX session, loading it on first use.
+    
+    InferenceSession.run is thread-safe and all per-stream state lives in
+    SileroVADState, so one session serves every VAD stream.
+    
+    Args:
+        onnx_file_path: Path to ONNX model file (None = default model lookup)
+        force_cpu: Force CPU execution
+    
+    Returns:
+        onnxruntime.InferenceSession: Shared ONNX session
+    
+    Raises:
+        AudioProcessingError: If model cannot be loaded
+    """
+    if onnx_file_path is not None and onnx_file_path.strip() == "":
+        onnx_file_path = None
+    key = (onnx_file_path, force_cpu)
+    
+    with _shared_sessions_lock:
+        session = _shared_sessions.get(key)
+        if session is None:
+            session = load_vad_model(onnx_file_path, force_cpu)
+            _shared_sessions[key] = session
+        return session
+
+
+_shared_models: Dict[Tuple[int, int], SileroVADModel] = {}
+
+
+def get_shared_vad_model(onnx_file_path: Optional[str] = None, force_cpu: bool = True, sample_rate: int = 16000) -> SileroVADModel:
+    """Get the process-wide SileroVADModel for a model file and sample rate.
+    
+    Handlers over the same shared model can have their windows batched
+    together (see SileroVADBatcher).
+    
+    Args:
+        onnx_file_path: Path to ONNX model file (None = default model lookup)
+        force_cpu: Force CPU execution
+        sample_rate: Audio sample rate (8000 or 16000 Hz)
+    
+    Returns:
+        Shared SileroVADModel
+    """
+    session = get_shared_vad_session(onnx_file_path, force_cpu)
+    key = (id(session), sample_rate)
+    with _shared_sessions_lock:
+        model = _shared_models.get(key)
+        if model is None:
+            model = SileroVADModel(session, sample_rate)
+            _shared_models[key] = model
+        return model
+
+
+def get_vad_model_stats() -> List[Dict[str, int]]:
+    """Get inference counters of the process-wide shared models."""
+    return [model.get_stats() for model in _shared_models.values()]
 
 
 def load_vad_model(onnx_file_path: Optional[str] = None, force_cpu: bool = True) -> onnxruntime.InferenceSession:
@@ -250,18 +478,31 @@ def load_vad_model(onnx_file_path: Optional[str] = None, force_cpu: bool = True)
 
 
 class SileroVADHandler:
-    """Complete Silero VAD handler implementation"""
+    """Complete Silero VAD handler implementation
+    
+    Each handler is one VAD stream (RNN state, context and speaking state).
+    The ONNX model is shared process-wide, so per-session streams are cheap:
+    use create_stream() to get an independent handler for each session.
+    
+    While the user is not speaking, windows whose RMS is below
+    config.silence_threshold are reported as non-speech without running the
+    model (during speech every window runs, so a short quiet gap does not end
+    the utterance). Once config.silence_reset_ms of such windows have passed,
+    the model state is reset.
+    """
     
     def __init__(
         self,
         config: VADConfig,
-        force_cpu: bool = True
+        force_cpu: bool = True,
+        model: Optional[SileroVADModel] = None,
     ):
         """Initialize VAD handler.
         
         Args:
             config: VAD configuration object (VADConfig)
             force_cpu: Force CPU execution
+            model: Optional already-loaded model to share (skips loading)
         
         Raises:
             AudioProcessingError: If VAD cannot be initialized
@@ -281,10 +522,14 @@ class SileroVADHandler:
         if not (0.0 <= activation_threshold <= 1.0):
             raise ValueError("activation_threshold must be between 0.0 and 1.0")
         
-        # Load model
+        # Load model (shared ONNX session unless a model was passed in)
         try:
-            self._session = load_vad_model(onnx_file_path, force_cpu)
-            self._model = SileroVADModel(self._session, sample_rate)
+            if model is None:
+                model = get_shared_vad_model(onnx_file_path, force_cpu, sample_rate)
+            elif model.sample_rate != sample_rate:
+                raise ValueError(f"Shared VAD model sample rate {model.sample_rate} does not match {sample_rate}")
+            self._model = model
+            self._session = model._sess
         except AudioProcessingError:
             raise
         except Exception as e:
@@ -293,11 +538,53 @@ class SileroVADHandler:
                 retriable=False
             ) from e
         
+        self._config = config
+        self._force_cpu = force_cpu
         self._sample_rate = sample_rate
         self._activation_threshold = activation_threshold
+        self._state = self._model.create_state()
+        self._batcher = None
+        
+        # Energy gate: compare the window's sum of squares (normalized samples)
+        # against threshold² * window size instead of taking a square root
+        window_size = self._model.window_size_samples
+        silence_threshold = getattr(config, 'silence_threshold', 0.0) or 0.0
+        self._silence_energy = silence_threshold * silence_threshold * window_size
+        self._silence_reset_windows = max(1, math.ceil(
+            getattr(config, 'silence_reset_ms', 500) / 1000 * sample_rate / window_size
+        ))
+        self._silent_windows = 0
         self._is_speaking = False
         self._last_event: Optional[Literal["START_OF_SPEECH", "END_OF_SPEECH", "CONTINUING"]] = None
     
+    def create_stream(self) -> "SileroVADHandler":
+        """Create an independent VAD stream that shares this handler's model.
+        
+        Returns:
+            SileroVADHandler with fresh state and the same ONNX session
+        """
+        stream = SileroVADHandler(self._config, force_cpu=self._force_cpu, model=self._model)
+        stream._batcher = self._batcher
+        return stream
+    
+    @property
+    def batching_enabled(self) -> bool:
+        """Whether process_audio_frame_async() batches across streams"""
+        return self._batcher is not None
+    
+    def enable_batching(self, max_batch_size: int = 64, max_wait_ms: float = 2.0) -> None:
+        """Batch this stream's inference with other streams on the same model.
+        
+        Applies to process_audio_frame_async(); one batcher is shared by all
+        handlers over the same model.
+        
+        Args:
+            max_batch_size: Maximum windows per inference call
+            max_wait_ms: Maximum time to wait for a batch to fill
+        """
+        from kuralit.plugins.vad.silero.batching import get_vad_batcher
+        self._batcher = get_vad_batcher(self._model, max_batch_size, max_wait_ms)
+    
     @property
     def sample_rate(self) -> int:
         """Audio sample rate"""
@@ -323,18 +610,73 @@ class SileroVADHandler:
                 - is_speaking: bool - Current speaking state
                 - event: str - Event type: "START_OF_SPEECH", "END_OF_SPEECH", or "CONTINUING"
         """
+        return self.process_frame(audio_frame)._asdict()
+    
+    def process_frame(self, audio_frame: np.ndarray) -> VADFrameResult:
+        """Process a single audio frame without per-frame allocations.
+        
+        Same as process_audio_frame() but returns a VADFrameResult; the
+        server's VAD loop uses this.
+        """
+        self._load_frame(audio_frame)
+        if self._gate_silence():
+            return self._update_speaking_state(0.0)
+        return self._update_speaking_state(self._model.infer(self._state))
+    
+    async def process_audio_frame_async(self, audio_frame: np.ndarray) -> Dict[str, Any]:
+        """Process a single audio frame, batched with other streams if enabled.
+        
+        Same input and result as process_audio_frame(). Calls for one stream
+        must not overlap (await each frame before sending the next).
+        """
+        return (await self.process_frame_async(audio_frame))._asdict()
+    
+    async def process_frame_async(self, audio_frame: np.ndarray) -> VADFrameResult:
+        """Async counterpart of process_frame(), batched if enabled."""
+        if self._batcher is None:
+            return self.process_frame(audio_frame)
+        
+        self._load_frame(audio_frame)
+        if self._gate_silence():
+            return self._update_speaking_state(0.0)
+        probability = await self._batcher.infer(self._state.window, self._state)
+        return self._update_speaking_state(probability)
+    
+    def _load_frame(self, audio_frame: np.ndarray) -> None:
+        """Validate frame length and normalize it into the stream's input buffer."""
         if len(audio_frame) != self._model.window_size_samples:
             raise ValueError(
                 f"Audio frame must be exactly {self._model.window_size_samples} samples "
                 f"({self._model.window_size_samples / self._sample_rate * 1000:.0f}ms at {self._sample_rate}Hz)"
             )
         
-        # Convert int16 to float32 and normalize to [-1.0, 1.0]
-        audio_f32 = audio_frame.astype(np.float32) / np.iinfo(np.int16).max
+        # Convert int16 to float32 in [-1.0, 1.0], in place
+        self._model.load_int16(audio_frame, self._state)
+    
+    def _gate_silence(self) -> bool:
+        """Skip inference for the loaded window if it is below the silence threshold.
+        
+        Only applies while not speaking: the speaking state has no hangover,
+        so during speech the model decides when it ends.
+        
+        Returns:
+            True if the window was skipped (treat as probability 0.0)
+        """
+        if not self._silence_energy or self._is_speaking:
+            self._silent_windows = 0
+            return False
         
-        # Run inference
-        probability = self._model(audio_f32)
+        window = self._state.window
+        if np.dot(window, window) >= self._silence_energy:
+            self._silent_windows = 0
+            return False
         
+        self._silent_windows += 1
+        self._model.skip(self._state, reset=self._silent_windows == self._silence_reset_windows)
+        return True
+    
+    def _update_speaking_state(self, probability: float) -> VADFrameResult:
+        """Apply the activation threshold and derive the speech event."""
         # Determine if this frame is speech
         is_speech = probability >= self._activation_threshold
         
@@ -350,12 +692,7 @@ class SileroVADHandler:
         
         self._last_event = event
         
-        return {
-            "is_speech": is_speech,
-            "probability": probability,
-            "is_speaking": self._is_speaking,
-            "event": event
-        }
+        return VADFrameResult(event, probability, is_speech, self._is_speaking)
     
     def process_audio_chunk(self, audio_chunk: bytes) -> Dict[str, Any]:
         """Process an audio chunk (PCM16 bytes).
@@ -392,7 +729,8 @@ class SileroVADHandler:
         """Reset VAD state (speaking state and model buffers)."""
         self._is_speaking = False
         self._last_event = None
-        self._model.reset()
+        self._silent_windows = 0
+        self._state.reset()
     
     def is_speaking(self) -> bool:
         """Get current speaking state."""
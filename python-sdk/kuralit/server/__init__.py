@@ -6,14 +6,30 @@ text and audio communication with Android clients.
 Supports multiple STT providers:
 - Deepgram (recommended) - Native WebSocket, low latency
 - Google Cloud Speech-to-Text (legacy) - For existing users
+
+The exports below are imported on first access, so importing the package
+does not load the server or any STT provider's dependencies.
 """
 
-from kuralit.server.websocket_server import create_app, app
-from kuralit.plugins.stt.deepgram import DeepgramSTTHandler
-from kuralit.plugins.stt.google import GoogleSTTHandler
+from typing import TYPE_CHECKING
+
+from kuralit.utils.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from kuralit.server.websocket_server import create_app, app
+    from kuralit.plugins.stt.deepgram import DeepgramSTTHandler
+    from kuralit.plugins.stt.google import GoogleSTTHandler
 
-# Export plugin classes (backward compatible aliases)
-STTHandler = GoogleSTTHandler  # Alias for backward compatibility
+    STTHandler = GoogleSTTHandler
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    "create_app": "kuralit.server.websocket_server:create_app",
+    "app": "kuralit.server.websocket_server:app",
+    "DeepgramSTTHandler": "kuralit.plugins.stt.deepgram:DeepgramSTTHandler",
+    "GoogleSTTHandler": "kuralit.plugins.stt.google:GoogleSTTHandler",
+    # Export plugin classes (backward compatible aliases)
+    "STTHandler": "kuralit.plugins.stt.google:GoogleSTTHandler",  # Alias for backward compatibility
+})
 
 __all__ = [
     "create_app",
@@ -22,4 +38,3 @@ __all__ = [
     "GoogleSTTHandler",
     "STTHandler",  # Backward compatibility alias
 ]
-
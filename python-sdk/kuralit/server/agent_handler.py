@@ -10,10 +10,8 @@ from typing import AsyncIterator, Dict, List, Optional
 logger = logging.getLogger(__name__)
 
 from kuralit.agent import Agent
-from kuralit.plugins.llm.gemini import Gemini
 from kuralit.models.message import Message
 from kuralit.models.response import ModelResponse
-from kuralit.tools.api import RESTAPIToolkit
 
 from kuralit.server.agent_session import AgentSession
 from kuralit.server.config import ServerConfig
@@ -28,6 +26,7 @@ from kuralit.server.protocol import (
     ServerToolResultMessage,
 )
 from kuralit.server.session import Session
+from kuralit.server.speculative_llm import SpeculativeResponse
 
 
 class AgentHandler:
@@ -73,6 +72,10 @@ class AgentHandler:
             self.config = config
             self.metrics = metrics
             
+            # Plugin and toolkit modules are only needed on this path
+            from kuralit.plugins.llm.gemini import Gemini
+            from kuralit.tools.api import RESTAPIToolkit
+            
             # Create Gemini model (old way)
             self.model = Gemini(
                 id=config.agent_model_id,
@@ -207,11 +210,61 @@ class AgentHandler:
             logger.debug("AgentHandler: No instructions provided, using default behavior")
         return messages
     
+    def _get_tool_definitions(self) -> List[Dict]:
+        """Get the agent's tool definitions as dicts for the model."""
+        # Check if agent has tools (REST API tools)
+        has_tools = self.agent.functions and len(self.agent.functions) > 0
+        
+        # Convert Function objects to dicts for Gemini API
+        tool_definitions = []
+        if has_tools:
+            for func in self.agent.functions.values():
+                # Convert Function to dict format expected by Gemini
+                if hasattr(func, 'to_dict'):
+                    tool_definitions.append(func.to_dict())
+                elif isinstance(func, dict):
+                    tool_definitions.append(func)
+                else:
+                    logger.warning(f"AgentHandler: Function {func.name} cannot be converted to dict")
+            logger.info(f"AgentHandler: Prepared {len(tool_definitions)} tool definitions for model: {[f.get('name', 'unknown') for f in tool_definitions[:5]]}")
+        else:
+            logger.debug("AgentHandler: No tools available for this request")
+        return tool_definitions
+    
+    def start_speculative_response(self, session: Session, text: str) -> SpeculativeResponse:
+        """Start the model request for a user turn that is not committed yet.
+        
+        The session is not modified: the request is made on a copy of the
+        conversation with the user message appended, and its deltas are
+        buffered until the turn is processed with process_text_async(...,
+        speculation=...) or the response is discarded.
+        
+        Args:
+            session: Session object
+            text: User transcript so far
+        
+        Returns:
+            SpeculativeResponse (already streaming)
+        """
+        messages = session.get_conversation_history()
+        speculation = SpeculativeResponse(text, len(messages), Message(role="assistant"))
+        messages.append(Message(role="user", content=text))
+        tool_definitions = self._get_tool_definitions()
+        speculation.start(self.model.ainvoke_stream(
+            messages=self._prepare_messages_with_instructions(messages),
+            assistant_message=speculation.assistant_message,
+            tools=tool_definitions if tool_definitions else None,
+            tool_choice="auto" if tool_definitions else None,
+        ))
+        logger.debug(f"AgentHandler: Started speculative response for session {session.session_id}")
+        return speculation
+    
     async def process_text_async(
         self,
         session: Session,
         text: str,
         metadata: Optional[Dict] = None,
+        speculation: Optional[SpeculativeResponse] = None,
     ) -> AsyncIterator[ServerPartialMessage | ServerTextMessage | ServerToolCallMessage | ServerToolResultMessage]:
         """Process text input and stream response.
         
@@ -219,6 +272,9 @@ class AgentHandler:
             session: Session object
             text: Input text
             metadata: Optional metadata
+            speculation: Response started early by start_speculative_response();
+                used as the first model response if it was made for this text
+                and conversation, otherwise discarded
             
         Yields:
             ServerPartialMessage, ServerTextMessage, ServerToolCallMessage, 
@@ -238,28 +294,18 @@ class AgentHandler:
             # But we need to stream the response, so we'll use the model directly
             # and handle tool calls if needed
             
-            # Check if agent has tools (REST API tools)
-            has_tools = self.agent.functions and len(self.agent.functions) > 0
-            
-            # Prepare tool definitions if tools are available
-            # Convert Function objects to dicts for Gemini API
-            tool_definitions = []
-            if has_tools:
-                for func in self.agent.functions.values():
-                    # Convert Function to dict format expected by Gemini
-                    if hasattr(func, 'to_dict'):
-                        tool_definitions.append(func.to_dict())
-                    elif isinstance(func, dict):
-                        tool_definitions.append(func)
-                    else:
-                        logger.warning(f"AgentHandler: Function {func.name} cannot be converted to dict")
-                logger.info(f"AgentHandler: Prepared {len(tool_definitions)} tool definitions for model: {[f.get('name', 'unknown') for f in tool_definitions[:5]]}")
-            else:
-                logger.debug("AgentHandler: No tools available for this request")
+            # Prepare tool definitions if tools are available (REST API tools)
+            tool_definitions = self._get_tool_definitions()
             
             # Use model's response method which handles tool calls automatically
             # We'll use aresponse for async support
-            assistant_message = Message(role="assistant")
+            # A speculative response started on this transcript during the
+            # endpointing delay is used if nothing changed since
+            use_speculation = speculation is not None and speculation.matches(text, len(messages) - 1)
+            if speculation is not None and not use_speculation:
+                wasted = speculation.discard()
+                logger.info(f"AgentHandler: Speculative response discarded (turn changed), wasted ~{wasted} tokens")
+            assistant_message = speculation.assistant_message if use_speculation else Message(role="assistant")
             messages.append(assistant_message)
             
             # Prepare messages with system instructions
@@ -275,12 +321,17 @@ class AgentHandler:
             collected_tool_calls = []
             
             # Stream response with tool support
-            async for response_chunk in self.model.ainvoke_stream(
-                messages=messages_with_instructions,
-                assistant_message=assistant_message,
-                tools=tool_definitions if tool_definitions else None,
-                tool_choice="auto" if tool_definitions else None,
-            ):
+            if use_speculation:
+                logger.info(f"AgentHandler: Using speculative response ({len(speculation.transcript)} chars of transcript)")
+                response_stream = speculation.replay()
+            else:
+                response_stream = self.model.ainvoke_stream(
+                    messages=messages_with_instructions,
+                    assistant_message=assistant_message,
+                    tools=tool_definitions if tool_definitions else None,
+                    tool_choice="auto" if tool_definitions else None,
+                )
+            async for response_chunk in response_stream:
                 if response_chunk.content:
                     chunk_text = response_chunk.content
                     accumulated_text += chunk_text
@@ -595,6 +646,7 @@ class AgentHandler:
         session: Session,
         transcription: str,
         metadata: Optional[Dict] = None,
+        speculation: Optional[SpeculativeResponse] = None,
     ) -> AsyncIterator[ServerPartialMessage | ServerTextMessage | ServerToolCallMessage | ServerToolResultMessage]:
         """Process STT transcription and stream response.
         
@@ -602,6 +654,7 @@ class AgentHandler:
             session: Session object
             transcription: Transcribed text
             metadata: Optional metadata
+            speculation: Response started during the endpointing delay, if any
             
         Yields:
             ServerPartialMessage, ServerTextMessage, 
@@ -611,7 +664,7 @@ class AgentHandler:
         before calling this method, so we don't send it here to avoid duplicates.
         """
         # Process as text (STT message is already sent by websocket_server)
-        async for message in self.process_text_async(session, transcription, metadata):
+        async for message in self.process_text_async(session, transcription, metadata, speculation):
             yield message
     
     async def process_audio_async(
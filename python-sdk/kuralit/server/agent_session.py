@@ -8,7 +8,7 @@ agents using a LiveKit-style API with support for:
 """
 
 import logging
-from typing import Any, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from kuralit.config.loader import ConfigManager
 from kuralit.config.schema import (
@@ -21,7 +21,6 @@ from kuralit.config.schema import (
     ToolsConfig,
 )
 from kuralit.core.resolver import PluginResolver
-from kuralit.tools.api import RESTAPIToolkit
 
 logger = logging.getLogger(__name__)
 
@@ -120,8 +119,6 @@ class AgentSession:
             # Try to create from config
             if default_config.provider and default_config.api_key:
                 try:
-                    import kuralit.plugins.stt.deepgram  # Trigger registration
-                    import kuralit.plugins.stt.google  # Trigger registration
                     return PluginResolver.resolve_stt(default_config.provider, default_config)
                 except Exception as e:
                     logger.warning(f"Failed to create STT from config: {e}")
@@ -130,8 +127,6 @@ class AgentSession:
         
         if isinstance(stt, str):
             # String-based resolution
-            import kuralit.plugins.stt.deepgram  # Trigger registration
-            import kuralit.plugins.stt.google  # Trigger registration
             return PluginResolver.resolve_stt(stt, default_config)
         else:
             # Direct instance
@@ -151,7 +146,6 @@ class AgentSession:
             # Try to create from config
             if default_config.provider and default_config.api_key:
                 try:
-                    import kuralit.plugins.llm.gemini  # Trigger registration
                     return PluginResolver.resolve_llm(default_config.provider, default_config)
                 except Exception as e:
                     logger.warning(f"Failed to create LLM from config: {e}")
@@ -160,7 +154,6 @@ class AgentSession:
         
         if isinstance(llm, str):
             # String-based resolution
-            import kuralit.plugins.llm.gemini  # Trigger registration
             return PluginResolver.resolve_llm(llm, default_config)
         else:
             # Direct instance
@@ -180,7 +173,6 @@ class AgentSession:
             # Try to create from config
             if default_config.enabled and default_config.provider:
                 try:
-                    import kuralit.plugins.vad.silero  # Trigger registration
                     return PluginResolver.resolve_vad(default_config.provider, default_config)
                 except Exception as e:
                     logger.warning(f"Failed to create VAD from config: {e}")
@@ -189,12 +181,35 @@ class AgentSession:
         
         if isinstance(vad, str):
             # String-based resolution
-            import kuralit.plugins.vad.silero  # Trigger registration
             return PluginResolver.resolve_vad(vad, default_config)
         else:
             # Direct instance
             return vad
     
+    def preload(self, inferences: Optional[int] = None) -> Dict[str, Any]:
+        """Load the VAD and turn detector models and run warm-up inferences.
+        
+        Blocks until done. create_app() does this in the background when
+        the server config has preload_models enabled.
+        
+        Args:
+            inferences: Warm-up inferences per model (default: config.warmup_inferences)
+        
+        Returns:
+            Warm-up status with per-model load and inference times
+        """
+        from kuralit.server.warmup import preload_models
+        
+        server_config = self._config.server
+        if inferences is None:
+            inferences = getattr(server_config, 'warmup_inferences', 3)
+        return preload_models(
+            server_config,
+            vad_handler=self.vad,
+            turn_detector_handler=self.turn_detection,
+            inferences=inferences,
+        )
+    
     def _resolve_turn_detector(
         self,
         turn_detection: Optional[Union[str, Any]],
@@ -213,7 +228,6 @@ class AgentSession:
             # Try to create from config
             if default_config.enabled and default_config.provider:
                 try:
-                    import kuralit.plugins.turn_detector.multilingual  # Trigger registration
                     return PluginResolver.resolve_turn_detector(default_config.provider, default_config)
                 except Exception as e:
                     logger.warning(f"Failed to create Turn Detector from config: {e}")
@@ -222,7 +236,6 @@ class AgentSession:
         
         if isinstance(turn_detection, str):
             # String-based resolution
-            import kuralit.plugins.turn_detector.multilingual  # Trigger registration
             return PluginResolver.resolve_turn_detector(turn_detection, default_config)
         else:
             # Direct instance
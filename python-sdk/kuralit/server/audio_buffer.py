@@ -1,42 +1,63 @@
-"""Audio buffer management - Simple pass-through for continuous streaming."""
+"""Audio buffer management - bounded ring buffer of the most recent audio."""
 
-import time
 from typing import Optional
 
+from kuralit.server.audio_codecs import PCM16, get_sample_width
 from kuralit.server.config import ServerConfig
 
 
 class AudioBuffer:
     """
-    Simple audio frame buffer - no processing decisions.
+    Bounded ring buffer holding the most recent audio of a stream.
     
-    In the new architecture, audio is streamed continuously to STT,
-    so the buffer is just a temporary holder with no decision-making logic.
+    Capacity is fixed when the audio format is set: the smaller of
+    max_buffer_size_bytes and max_buffer_duration_ms (or the max_duration_ms
+    given here) at the stream's byte rate, rounded down to whole samples.
+    Storage is preallocated; once full, each chunk overwrites the oldest
+    audio. Used as the STT pre-roll when VAD-gated streaming holds back
+    silence, so the start of an utterance reaches STT along with the rest.
     """
     
-    def __init__(self, config: ServerConfig, vad_handler: Optional[object] = None):
+    def __init__(
+        self,
+        config: ServerConfig,
+        vad_handler: Optional[object] = None,
+        max_duration_ms: Optional[float] = None,
+    ):
         """Initialize audio buffer.
         
         Args:
-            config: Server configuration (kept for compatibility)
+            config: Server configuration (max_buffer_duration_ms and
+                max_buffer_size_bytes bound the capacity)
             vad_handler: Optional VAD handler (kept for compatibility, not used)
+            max_duration_ms: Audio to keep, in milliseconds (still capped by
+                the config limits; default max_buffer_duration_ms)
         """
         self.config = config
         self.vad_handler = vad_handler  # Kept for compatibility but not used
+        self.max_duration_ms = max_duration_ms
         self.sample_rate: int = 16000
-        self.encoding: str = "PCM16"
-        
-        # Legacy fields for compatibility
-        self._vad_speech_end_time: Optional[float] = None
-        self._vad_is_speaking: bool = False
+        self.encoding: str = PCM16
+        self.bytes_per_second: int = 32000
         
+        self._ring = bytearray()
+        self._start = 0  # Offset of the oldest byte
+        self._size = 0
+        self.bytes_dropped = 0  # Overwritten before being flushed
+        self.set_audio_config(self.sample_rate, self.encoding)
+    
+    @property
+    def capacity(self) -> int:
+        """Maximum bytes held."""
+        return len(self._ring)
+    
     def reset(self) -> None:
-        """Reset buffer state."""
-        self._vad_speech_end_time = None
-        self._vad_is_speaking = False
+        """Discard buffered audio."""
+        self._start = 0
+        self._size = 0
     
     def set_audio_config(self, sample_rate: int, encoding: str) -> None:
-        """Set audio configuration.
+        """Set audio configuration (resizes and empties the buffer).
         
         Args:
             sample_rate: Audio sample rate
@@ -44,40 +65,78 @@ class AudioBuffer:
         """
         self.sample_rate = sample_rate
         self.encoding = encoding
+        sample_width = get_sample_width(encoding)
+        self.bytes_per_second = sample_rate * sample_width
+        
+        duration_ms = getattr(self.config, 'max_buffer_duration_ms', 3000)
+        if self.max_duration_ms is not None:
+            duration_ms = min(duration_ms, self.max_duration_ms)
+        capacity = min(
+            int(self.bytes_per_second * duration_ms / 1000),
+            getattr(self.config, 'max_buffer_size_bytes', 131072),
+        )
+        capacity -= capacity % sample_width
+        if capacity != len(self._ring):
+            self._ring = bytearray(max(capacity, 0))
         self.reset()
     
-    def add_chunk(self, chunk: bytes, timestamp: Optional[float] = None) -> tuple[bool, bytes]:
-        """Add audio chunk - simplified to pass-through.
+    def add_chunk(self, chunk: bytes, timestamp: Optional[float] = None) -> int:
+        """Add an audio chunk, overwriting the oldest audio when full.
         
         Args:
-            chunk: Audio chunk bytes (PCM16)
+            chunk: Audio chunk bytes (in the configured encoding)
             timestamp: Optional timestamp for the chunk (ignored)
-            
+        
         Returns:
-            Tuple of (False, b"") - no longer makes processing decisions
-            Audio is streamed continuously via AudioRecognitionHandler
+            Number of older bytes overwritten (or not kept) to make room
         """
-        # In the new architecture, chunks are forwarded immediately to AudioRecognitionHandler
-        # This method is kept for compatibility but no longer accumulates or makes decisions
-        return False, b""
+        capacity = len(self._ring)
+        length = len(chunk)
+        if not capacity:
+            self.bytes_dropped += length
+            return length
+        
+        if length >= capacity:
+            # Only the newest capacity bytes survive
+            dropped = self._size + length - capacity
+            self._ring[:] = memoryview(chunk)[length - capacity:]
+            self._start = 0
+            self._size = capacity
+            self.bytes_dropped += dropped
+            return dropped
+        
+        dropped = max(0, self._size + length - capacity)
+        if dropped:
+            self._start = (self._start + dropped) % capacity
+            self._size -= dropped
+            self.bytes_dropped += dropped
+        
+        end = (self._start + self._size) % capacity
+        first = min(length, capacity - end)
+        self._ring[end:end + first] = memoryview(chunk)[:first]
+        if first < length:
+            self._ring[:length - first] = memoryview(chunk)[first:]
+        self._size += length
+        return dropped
     
     def get_buffer_size(self) -> int:
         """Get current buffer size in bytes."""
-        return 0  # No buffering in new architecture
+        return self._size
     
     def get_buffer_duration_ms(self) -> float:
-        """Estimate buffer duration in milliseconds.
-        
-        Returns:
-            Always returns 0.0 (no buffering)
-        """
-        return 0.0
+        """Get the duration of the buffered audio in milliseconds."""
+        return self._size * 1000 / self.bytes_per_second if self.bytes_per_second else 0.0
     
     def flush(self) -> bytes:
-        """Flush buffer and return accumulated audio.
+        """Return the buffered audio (oldest first) and empty the buffer.
         
         Returns:
-            Empty bytes (no buffering)
+            Buffered audio bytes
         """
-        return b""
-
+        end = self._start + self._size
+        if end <= len(self._ring):
+            audio = bytes(self._ring[self._start:end])
+        else:
+            audio = bytes(self._ring[self._start:]) + bytes(self._ring[:end - len(self._ring)])
+        self.reset()
+        return audio
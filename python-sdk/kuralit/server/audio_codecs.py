@@ -0,0 +1,139 @@
+"""Decoding of client audio encodings to PCM16.
+
+The encoding is negotiated in client_audio_start. PCM16 is the pipeline's
+native format and needs no decoding; 8-bit encodings (PCM8, G.711 µ-law and
+A-law) are decoded with a 256-entry lookup table, one NumPy gather per
+chunk. Further encodings can be added with register_audio_decoder().
+"""
+
+from typing import Dict, List, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+PCM16 = "PCM16"
+
+
+class LookupTableDecoder:
+    """Decodes an 8-bit-per-sample encoding to PCM16 through a lookup table."""
+    
+    sample_width = 1
+    
+    def __init__(self, encoding: str, table: "np.ndarray"):
+        """Initialize decoder.
+        
+        Args:
+            encoding: Encoding name (as sent in client_audio_start)
+            table: 256 int16 samples, indexed by the encoded byte
+        """
+        if table.shape != (256,):
+            raise ValueError("Lookup table must have 256 entries")
+        self.encoding = encoding
+        self._table = table.astype("<i2")
+        # The encoded byte closest to zero (sent to keep idle streams open)
+        self.silence = bytes([int(np.argmin(np.abs(self._table.astype(np.int32))))])
+    
+    def decode(self, audio_chunk: bytes) -> bytes:
+        """Decode a chunk to little-endian PCM16 bytes (two bytes per input byte)."""
+        return self._table[np.frombuffer(audio_chunk, dtype=np.uint8)].tobytes()
+
+
+def _pcm8_table() -> "np.ndarray":
+    """Unsigned 8-bit PCM (WAV convention, 128 = silence)."""
+    return (np.arange(256, dtype=np.int32) - 128) << 8
+
+
+def _mulaw_table() -> "np.ndarray":
+    """G.711 µ-law (same output as audioop.ulaw2lin)."""
+    code = ~np.arange(256, dtype=np.int32) & 0xFF
+    exponent = (code >> 4) & 0x07
+    mantissa = code & 0x0F
+    magnitude = (((mantissa << 3) + 0x84) << exponent) - 0x84
+    return np.where(code & 0x80, -magnitude, magnitude)
+
+
+def _alaw_table() -> "np.ndarray":
+    """G.711 A-law (same output as audioop.alaw2lin)."""
+    code = np.arange(256, dtype=np.int32) ^ 0x55
+    exponent = (code >> 4) & 0x07
+    mantissa = code & 0x0F
+    magnitude = np.where(
+        exponent == 0,
+        (mantissa << 4) + 8,
+        ((mantissa << 4) + 0x108) << np.maximum(exponent - 1, 0),
+    )
+    return np.where(code & 0x80, magnitude, -magnitude)
+
+
+# Decoders by encoding name (PCM16 needs none)
+_decoders: Dict[str, object] = {}
+
+
+def register_audio_decoder(encoding: str, decoder: object) -> None:
+    """Register a decoder for a client audio encoding.
+    
+    Args:
+        encoding: Encoding name clients send in client_audio_start
+        decoder: Object with decode(audio_chunk: bytes) -> bytes returning
+            PCM16; shared by all streams, so it must not keep state. Optional
+            attributes: sample_width (bytes per sample, default 1) and
+            silence (one encoded sample of silence)
+    """
+    if encoding == PCM16:
+        raise ValueError("PCM16 is the native format and cannot be replaced")
+    _decoders[encoding] = decoder
+
+
+def get_audio_decoder(encoding: str) -> Optional[object]:
+    """Get the decoder for an encoding.
+    
+    Args:
+        encoding: Encoding name from client_audio_start
+    
+    Returns:
+        Decoder, or None for PCM16
+    
+    Raises:
+        ValueError: If the encoding is not supported
+    """
+    if encoding == PCM16:
+        return None
+    decoder = _decoders.get(encoding)
+    if decoder is None:
+        raise ValueError(f"Unsupported audio encoding: {encoding}")
+    return decoder
+
+
+def get_silence(encoding: str, num_samples: int) -> bytes:
+    """Get num_samples of silence in an encoding.
+    
+    Args:
+        encoding: Encoding name from client_audio_start
+        num_samples: Number of samples
+    
+    Returns:
+        Encoded silence (PCM16 zeros for PCM16)
+    """
+    if encoding == PCM16:
+        return bytes(2 * num_samples)
+    return getattr(get_audio_decoder(encoding), "silence", b"\x00") * num_samples
+
+
+def get_sample_width(encoding: str) -> int:
+    """Get the bytes per sample of an encoding (decoders default to 8-bit)."""
+    if encoding == PCM16:
+        return 2
+    return getattr(get_audio_decoder(encoding), "sample_width", 1)
+
+
+def get_supported_encodings() -> List[str]:
+    """Get all encodings clients may send."""
+    return [PCM16, *_decoders]
+
+
+if np is not None:
+    register_audio_decoder("PCM8", LookupTableDecoder("PCM8", _pcm8_table()))
+    register_audio_decoder("MULAW", LookupTableDecoder("MULAW", _mulaw_table()))
+    register_audio_decoder("ALAW", LookupTableDecoder("ALAW", _alaw_table()))
@@ -0,0 +1,260 @@
+"""Bounded, byte-budgeted queue between incoming audio and the STT stream.
+
+Frames are read back as packets: small client frames (often 10-20 ms) are
+coalesced into packets of a target duration before being sent to the
+provider, with a deadline so a partly filled packet does not wait long.
+
+If the STT provider stalls or reconnects, audio would otherwise pile up
+without limit and, once the provider recovers, reach it seconds late. The
+queue holds at most max_bytes; what happens to audio beyond that is the
+overflow policy:
+
+- drop_oldest: whole frames are dropped from the head until the new frame fits
+- coalesce: the backlog and new frame are merged into one frame holding the
+  newest max_bytes, so the provider gets the most recent audio in a single
+  send when it recovers
+- pause: like drop_oldest, but the client is also asked to pause sending
+  (throttled) above a high-water mark and to resume below a low-water mark
+"""
+
+import asyncio
+import time
+import weakref
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+DROP_OLDEST = "drop_oldest"
+COALESCE = "coalesce"
+PAUSE = "pause"
+AUDIO_OVERFLOW_POLICIES = [DROP_OLDEST, COALESCE, PAUSE]
+
+# Live queues, for process-wide depth in /metrics
+_queues: "weakref.WeakSet[AudioQueue]" = weakref.WeakSet()
+
+# Totals of queues that have been closed
+_closed_totals: Dict[str, int] = {
+    "frames_dropped": 0,
+    "bytes_dropped": 0,
+    "coalesced": 0,
+    "throttle_events": 0,
+    "frames_out": 0,
+    "packets_out": 0,
+}
+
+
+class AudioQueue:
+    """Byte-budgeted FIFO of audio frames for one STT stream.
+    
+    put() never blocks (it runs on the audio receive path); get() waits for
+    the next packet and returns None once the queue is closed and drained.
+    Each frame's time in the queue is tracked as the STT send lag.
+    """
+    
+    # Fractions of max_bytes where the pause policy throttles / releases the client
+    THROTTLE_HIGH_WATER = 0.75
+    THROTTLE_LOW_WATER = 0.25
+    
+    def __init__(self, max_bytes: int, overflow_policy: str = DROP_OLDEST, sample_width: int = 2):
+        """Initialize audio queue.
+        
+        Args:
+            max_bytes: Byte budget for queued audio (0 = unbounded)
+            overflow_policy: 'drop_oldest', 'coalesce' or 'pause'
+            sample_width: Bytes per sample (coalescing trims on sample boundaries)
+        """
+        if overflow_policy not in AUDIO_OVERFLOW_POLICIES:
+            raise ValueError(f"overflow_policy must be one of {AUDIO_OVERFLOW_POLICIES}")
+        self.max_bytes = max_bytes
+        self.overflow_policy = overflow_policy
+        self.sample_width = sample_width
+        
+        # (enqueued_at, frame) pairs, oldest first
+        self._frames: Deque[Tuple[float, bytes]] = deque()
+        self._bytes = 0
+        self._wakeup = asyncio.Event()
+        self._closed = False
+        self.throttled = False
+        
+        # Counters
+        self.frames_in = 0
+        self.frames_out = 0
+        self.packets_out = 0
+        self.frames_dropped = 0
+        self.bytes_dropped = 0
+        self.coalesced = 0
+        self.throttle_events = 0
+        self.max_bytes_queued = 0
+        self.last_lag_seconds = 0.0
+        self.max_lag_seconds = 0.0
+        self._total_lag_seconds = 0.0
+        _queues.add(self)
+    
+    @property
+    def bytes_queued(self) -> int:
+        """Bytes waiting to be sent."""
+        return self._bytes
+    
+    def qsize(self) -> int:
+        """Frames waiting to be sent."""
+        return len(self._frames)
+    
+    def put(self, frame: bytes) -> None:
+        """Queue a frame, applying the overflow policy if it exceeds the budget."""
+        if self._closed:
+            return
+        self.frames_in += 1
+        now = time.monotonic()
+        
+        if self.max_bytes and self._bytes + len(frame) > self.max_bytes and self._frames:
+            if self.overflow_policy == COALESCE:
+                self._coalesce(now, frame)
+                return
+            while self._frames and self._bytes + len(frame) > self.max_bytes:
+                _, dropped = self._frames.popleft()
+                self._bytes -= len(dropped)
+                self.frames_dropped += 1
+                self.bytes_dropped += len(dropped)
+        
+        self._frames.append((now, frame))
+        self._bytes += len(frame)
+        self._after_put()
+    
+    def _coalesce(self, now: float, frame: bytes) -> None:
+        """Merge the backlog and frame into one frame of the newest max_bytes."""
+        excess = self._bytes + len(frame) - self.max_bytes
+        excess += -excess % self.sample_width  # Keep whole samples
+        
+        # The merged frame is as old as the oldest audio it keeps
+        enqueued_at = now
+        frames_dropped = 0
+        skipped = 0
+        for frame_enqueued_at, queued in self._frames:
+            if skipped + len(queued) > excess:
+                enqueued_at = frame_enqueued_at
+                break
+            skipped += len(queued)
+            frames_dropped += 1
+        
+        merged = b"".join([queued for _, queued in self._frames] + [frame])[excess:]
+        self.frames_dropped += frames_dropped
+        self.bytes_dropped += excess
+        self.coalesced += 1
+        self._frames.clear()
+        self._frames.append((enqueued_at, merged))
+        self._bytes = len(merged)
+        self._after_put()
+    
+    def _after_put(self) -> None:
+        """Update the high-water mark and throttle state and wake the reader."""
+        if self._bytes > self.max_bytes_queued:
+            self.max_bytes_queued = self._bytes
+        if (
+            self.overflow_policy == PAUSE
+            and not self.throttled
+            and self._bytes >= self.max_bytes * self.THROTTLE_HIGH_WATER
+        ):
+            self.throttled = True
+            self.throttle_events += 1
+        self._wakeup.set()
+    
+    async def get(self, target_bytes: int = 0, max_delay: float = 0.0) -> Optional[bytes]:
+        """Wait for the next packet of audio.
+        
+        Consecutive frames are coalesced into one packet of at least
+        target_bytes (whole frames), so providers get fewer, larger sends.
+        A packet goes out early, with what is queued, once its oldest frame
+        has waited max_delay seconds, which bounds the added latency.
+        
+        Args:
+            target_bytes: Packet size to wait for (0 = one frame per packet)
+            max_delay: Longest a frame waits for the packet to fill, in seconds
+        
+        Returns:
+            The next packet, or None once the queue is closed and empty
+        """
+        while True:
+            if self._frames:
+                if self._bytes >= target_bytes or self._closed:
+                    break
+                remaining = self._frames[0][0] + max_delay - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), remaining)
+                except asyncio.TimeoutError:
+                    break
+            elif self._closed:
+                return None
+            else:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+        
+        now = time.monotonic()
+        parts = []
+        size = 0
+        while self._frames and (not parts or size < target_bytes):
+            enqueued_at, frame = self._frames.popleft()
+            parts.append(frame)
+            size += len(frame)
+            
+            lag = now - enqueued_at
+            self._total_lag_seconds += lag
+            if lag > self.max_lag_seconds:
+                self.max_lag_seconds = lag
+        self.last_lag_seconds = lag
+        self._bytes -= size
+        self.frames_out += len(parts)
+        self.packets_out += 1
+        
+        if self.throttled and self._bytes <= self.max_bytes * self.THROTTLE_LOW_WATER:
+            self.throttled = False
+        return parts[0] if len(parts) == 1 else b"".join(parts)
+    
+    def close(self) -> None:
+        """Stop accepting frames; get() returns None after the remaining ones."""
+        if self._closed:
+            return
+        self._closed = True
+        self._wakeup.set()
+        _queues.discard(self)
+        for key in _closed_totals:
+            _closed_totals[key] += getattr(self, key)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue depth, overflow and lag statistics."""
+        return {
+            "queue_bytes": self._bytes,
+            "queue_frames": len(self._frames),
+            "max_bytes": self.max_bytes,
+            "max_bytes_queued": self.max_bytes_queued,
+            "overflow_policy": self.overflow_policy,
+            "throttled": self.throttled,
+            "frames_dropped": self.frames_dropped,
+            "bytes_dropped": self.bytes_dropped,
+            "coalesced": self.coalesced,
+            "throttle_events": self.throttle_events,
+            "frames_out": self.frames_out,
+            "packets_out": self.packets_out,
+            "frames_per_packet": self.frames_out / self.packets_out if self.packets_out else 0.0,
+            "last_lag_ms": self.last_lag_seconds * 1000,
+            "max_lag_ms": self.max_lag_seconds * 1000,
+            "average_lag_ms": self._total_lag_seconds / self.frames_out * 1000 if self.frames_out else 0.0,
+        }
+
+
+def get_audio_queue_stats() -> Dict[str, Any]:
+    """Get current depth over all open STT audio queues and overflow totals."""
+    queues = list(_queues)
+    stats: Dict[str, Any] = {
+        "open_queues": len(queues),
+        "queue_bytes": sum(q.bytes_queued for q in queues),
+        "max_queue_bytes": max((q.bytes_queued for q in queues), default=0),
+        "max_lag_ms": max((q.max_lag_seconds * 1000 for q in queues), default=0.0),
+        "throttled_streams": sum(1 for q in queues if q.throttled),
+    }
+    for key, total in _closed_totals.items():
+        stats[key] = total + sum(getattr(q, key) for q in queues)
+    # Provider messages saved by coalescing frames into packets
+    stats["frames_per_packet"] = stats["frames_out"] / stats["packets_out"] if stats["packets_out"] else 0.0
+    return stats
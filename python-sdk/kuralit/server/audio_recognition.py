@@ -5,12 +5,31 @@ Supports both Google STT and Deepgram STT providers.
 """
 
 import asyncio
+import functools
 import logging
 import time
-from typing import AsyncIterator, Callable, Optional, Union
+from typing import AsyncIterator, Callable, Dict, Optional, Union
+
+from kuralit.server.audio_buffer import AudioBuffer
+from kuralit.server.audio_codecs import get_sample_width, get_silence
+from kuralit.server.audio_queue import DROP_OLDEST, AudioQueue
+from kuralit.server.eou_memo import EOUMemo
+from kuralit.server.turn_detector_executor import get_turn_detector_executor
 
 logger = logging.getLogger(__name__)
 
+# Totals over all recognition handlers (reported by /metrics)
+_stt_audio_stats: Dict[str, int] = {
+    "bytes_sent": 0,
+    "bytes_gated": 0,
+    "keepalives_sent": 0,
+}
+
+
+def get_stt_audio_stats() -> Dict[str, int]:
+    """Get how much audio was streamed to STT and how much VAD gating held back."""
+    return dict(_stt_audio_stats)
+
 
 class AudioRecognitionHandler:
     """
@@ -23,8 +42,20 @@ class AudioRecognitionHandler:
     4. Runs turn detector to determine end-of-turn
     5. Applies dynamic endpointing delays based on EOU probability
     6. Commits user turn when conditions are met
+    
+    With VAD gating, only speech is streamed: audio is held in a pre-roll
+    ring buffer until VAD reports START_OF_SPEECH, which releases the
+    pre-roll and opens the gate; after END_OF_SPEECH another hangover's
+    worth of audio is forwarded before the gate closes again. Providers
+    that do not send their own keepalives (sends_keepalives) get a short
+    burst of silence every KEEPALIVE_INTERVAL seconds while the gate is
+    closed, so the stream is not timed out.
     """
     
+    # Seconds without audio before a gated stream is sent keepalive silence
+    KEEPALIVE_INTERVAL = 5.0
+    KEEPALIVE_SILENCE_MS = 100
+    
     def __init__(
         self,
         stt_handler,
@@ -35,6 +66,19 @@ class AudioRecognitionHandler:
         on_transcript_callback: Callable,
         on_turn_end_callback: Callable,
         conversation_history_callback: Callable,
+        vad_gating: bool = False,
+        preroll_buffer: Optional[AudioBuffer] = None,
+        hangover_ms: float = 0.0,
+        max_queue_bytes: int = 0,
+        overflow_policy: str = DROP_OLDEST,
+        on_throttle_callback: Optional[Callable] = None,
+        packet_ms: float = 0.0,
+        packet_max_delay_ms: float = 0.0,
+        eou_memo_size: int = 0,
+        speculative_eou: bool = False,
+        speculative_stable_ms: float = 200.0,
+        on_speculate_callback: Optional[Callable] = None,
+        speculate_threshold: float = 0.3,
     ):
         """
         Initialize Audio Recognition Handler.
@@ -48,6 +92,33 @@ class AudioRecognitionHandler:
             on_transcript_callback: Called when transcript is received (interim or final)
             on_turn_end_callback: Called when user turn is committed
             conversation_history_callback: Called to get conversation history for turn detector
+            vad_gating: Only stream audio to STT while VAD detects speech
+                (ignored without a VAD handler)
+            preroll_buffer: Ring buffer holding the audio sent ahead of
+                speech when the gate opens (none = no pre-roll)
+            hangover_ms: Audio still streamed after END_OF_SPEECH
+            max_queue_bytes: Byte budget of audio waiting for the STT stream
+                (0 = unbounded)
+            overflow_policy: What to do with audio over the budget
+                ('drop_oldest', 'coalesce' or 'pause'; see audio_queue)
+            on_throttle_callback: Called with (paused, queued_ms) when the
+                'pause' policy asks the client to pause or resume sending
+            packet_ms: Coalesce frames into packets of this much audio
+                before sending them to STT (0 = send frames as they arrive)
+            packet_max_delay_ms: Longest a frame waits for its packet to fill
+            eou_memo_size: End-of-turn predictions memoized until the turn
+                is committed (0 = predict on every check)
+            speculative_eou: Predict end of turn in the background on
+                interim transcripts, so the check after the final transcript
+                or END_OF_SPEECH can use the result at once (needs the memo)
+            speculative_stable_ms: How long an interim must stay unchanged
+                before it is speculated on
+            on_speculate_callback: Called with the transcript when the EOU
+                probability reaches speculate_threshold, so a response can
+                be started during the endpointing delay, and with None when
+                that response is no longer wanted (user speaking again)
+            speculate_threshold: EOU probability from which the turn is
+                likely enough to end to start a response early
         """
         self._stt = stt_handler
         self._vad = vad_handler
@@ -59,6 +130,9 @@ class AudioRecognitionHandler:
         self._on_transcript = on_transcript_callback
         self._on_turn_end = on_turn_end_callback
         self._get_conversation_history = conversation_history_callback
+        self._on_throttle = on_throttle_callback
+        self._on_speculate = on_speculate_callback
+        self._speculate_threshold = speculate_threshold
         
         # State tracking (similar to LiveKit's AudioRecognition)
         self._audio_transcript = ""  # Accumulated final transcripts
@@ -70,9 +144,41 @@ class AudioRecognitionHandler:
         self._stt_stream_task: Optional[asyncio.Task] = None
         self._eou_detection_task: Optional[asyncio.Task] = None
         
-        # Audio queue for streaming to STT
-        self._audio_queue: asyncio.Queue[Optional[bytes]] = asyncio.Queue()
+        # Memoized EOU predictions for the current turn (cleared on commit)
+        self._eou_memo = EOUMemo(eou_memo_size)
+        
+        # This session's key in the turn detector's prefix token cache (the
+        # handler may be shared); handlers without clear_cache() take no key
+        self._eou_cache_key = id(self) if hasattr(turn_detector_handler, 'clear_cache') else None
+        
+        # Speculative EOU on stable interim transcripts
+        self._speculative = speculative_eou and eou_memo_size > 0 and turn_detector_handler is not None
+        self._speculative_stable = speculative_stable_ms / 1000
+        self._speculation_task: Optional[asyncio.Task] = None
+        self._speculated_text = ""
+        self.speculative_turns = 0  # Turns whose EOU check used a speculation
+        self.last_turn_saved_ms = 0.0
+        
+        # Audio queue for streaming to STT (bounded so a stalled provider
+        # cannot make audio pile up)
+        self._audio_queue = AudioQueue(max_queue_bytes, overflow_policy)
+        self._client_throttled = False
+        self._packet_ms = packet_ms
+        self._packet_max_delay = packet_max_delay_ms / 1000
+        self._packet_bytes = 0  # Set in start()
+        self._bytes_per_second = 32000  # Set in start()
         self._closing = False
+        
+        # VAD gating: the gate is open while speaking and during the hangover
+        self._gating = vad_gating and vad_handler is not None
+        self._gate_open = not self._gating
+        self._preroll = preroll_buffer if self._gating else None
+        self._hangover_ms = hangover_ms
+        self._hangover_bytes = 0  # Set in start() from the stream's byte rate
+        self._hangover_remaining: Optional[int] = None  # Bytes left after END_OF_SPEECH
+        self.bytes_sent = 0
+        self.bytes_gated = 0  # Held back and never sent
+        self.keepalives_sent = 0
     
     async def start(self, sample_rate: int, encoding: str) -> None:
         """
@@ -84,7 +190,16 @@ class AudioRecognitionHandler:
             sample_rate: Audio sample rate in Hz
             encoding: Audio encoding format (e.g., "PCM16")
         """
-        logger.info(f"Starting AudioRecognitionHandler: sample_rate={sample_rate}, encoding={encoding}")
+        logger.info(f"Starting AudioRecognitionHandler: sample_rate={sample_rate}, encoding={encoding}, vad_gating={self._gating}")
+        sample_width = get_sample_width(encoding)
+        self._audio_queue.sample_width = sample_width
+        self._bytes_per_second = sample_rate * sample_width
+        packet_bytes = int(self._packet_ms * self._bytes_per_second / 1000)
+        self._packet_bytes = packet_bytes - packet_bytes % sample_width
+        if self._gating:
+            self._hangover_bytes = int(self._hangover_ms * self._bytes_per_second / 1000)
+            if self._preroll is not None:
+                self._preroll.set_audio_config(sample_rate, encoding)
         self._stt_stream_task = asyncio.create_task(
             self._stt_streaming_task(sample_rate, encoding),
             name="stt_streaming_task"
@@ -94,14 +209,56 @@ class AudioRecognitionHandler:
         """
         Push audio frame to be processed by STT.
         
-        Audio is queued and processed continuously by the STT streaming task.
+        Audio is queued and processed continuously by the STT streaming task
+        (with VAD gating, only while the gate is open; otherwise it goes to
+        the pre-roll buffer).
         
         Args:
-            frame: Audio frame as bytes (PCM16)
+            frame: Audio frame as bytes (in the encoding STT was started with)
         """
-        if not self._closing:
-            await self._audio_queue.put(frame)
-            logger.debug(f"[AudioRecognition] Pushed audio frame: {len(frame)} bytes, queue_size={self._audio_queue.qsize()}")
+        if self._closing:
+            return
+        
+        if not self._gate_open:
+            if self._preroll is not None:
+                dropped = self._preroll.add_chunk(frame)
+            else:
+                dropped = len(frame)
+            self.bytes_gated += dropped
+            _stt_audio_stats["bytes_gated"] += dropped
+            return
+        
+        if self._hangover_remaining is not None:
+            self._hangover_remaining -= len(frame)
+            if self._hangover_remaining <= 0:
+                # Hangover used up: this is the last frame until speech resumes
+                self._hangover_remaining = None
+                self._gate_open = False
+                logger.debug("[AudioRecognition] Hangover elapsed, holding back audio until speech")
+        
+        await self._send_audio(frame)
+        logger.debug(f"[AudioRecognition] Pushed audio frame: {len(frame)} bytes, queue_size={self._audio_queue.qsize()}")
+    
+    async def _send_audio(self, audio: bytes) -> None:
+        """Queue audio for the STT stream."""
+        self.bytes_sent += len(audio)
+        _stt_audio_stats["bytes_sent"] += len(audio)
+        self._audio_queue.put(audio)
+        await self._update_throttle()
+    
+    async def _update_throttle(self) -> None:
+        """Tell the client to pause or resume when the queue's throttle state changes."""
+        throttled = self._audio_queue.throttled
+        if throttled == self._client_throttled:
+            return
+        self._client_throttled = throttled
+        queued_ms = self._audio_queue.bytes_queued * 1000 / self._bytes_per_second
+        logger.info(f"[AudioRecognition] {'Pausing' if throttled else 'Resuming'} client audio (queued={queued_ms:.0f}ms)")
+        if self._on_throttle:
+            try:
+                await self._on_throttle(throttled, queued_ms)
+            except Exception as e:
+                logger.warning(f"[AudioRecognition] Throttle callback error: {e}")
     
     async def handle_vad_event(self, event_type: str, probability: float) -> None:
         """
@@ -121,15 +278,32 @@ class AudioRecognitionHandler:
             self._speaking = True
             logger.info(f"[AudioRecognition] User started speaking (VAD prob={probability:.3f})")
             
+            if self._gating:
+                self._hangover_remaining = None
+                if not self._gate_open and not self._closing:
+                    # Release the audio leading up to the detection first
+                    self._gate_open = True
+                    preroll = self._preroll.flush() if self._preroll is not None else b""
+                    if preroll:
+                        await self._send_audio(preroll)
+                    logger.debug(f"[AudioRecognition] Gate opened, sent {len(preroll)} bytes of pre-roll")
+            
             # Cancel any pending EOU detection when user starts speaking again
             if self._eou_detection_task and not self._eou_detection_task.done():
                 self._eou_detection_task.cancel()
                 logger.info("[AudioRecognition] Cancelled pending EOU detection (user started speaking)")
+            self._speculate_response(None)
         
         elif event_type == "END_OF_SPEECH":
             self._speaking = False
             logger.info(f"[AudioRecognition] User stopped speaking (VAD prob={probability:.3f})")
             
+            if self._gating and self._gate_open:
+                if self._hangover_bytes > 0:
+                    self._hangover_remaining = self._hangover_bytes
+                else:
+                    self._gate_open = False
+            
             # Trigger EOU detection when user stops speaking (if we have transcript)
             if self._audio_transcript:
                 logger.info(f"[AudioRecognition] Triggering EOU detection (transcript accumulated: '{self._audio_transcript[:50]}...')")
@@ -151,18 +325,36 @@ class AudioRecognitionHandler:
         """
         logger.info("[AudioRecognition] STT streaming task started")
         
+        # Gated streams go quiet between utterances; keep them alive with
+        # silence unless the provider sends its own keepalives
+        keepalive_interval = None
+        if self._gating and not getattr(self._stt, 'sends_keepalives', False):
+            keepalive_interval = self.KEEPALIVE_INTERVAL
+            keepalive_silence = get_silence(encoding, sample_rate * self.KEEPALIVE_SILENCE_MS // 1000)
+        
         async def audio_generator() -> AsyncIterator[bytes]:
-            """Generator that yields audio frames from queue."""
-            frame_count = 0
+            """Generator that yields audio packets (coalesced frames) from queue."""
+            packet_count = 0
             while True:
-                frame = await self._audio_queue.get()
-                if frame is None:  # Sentinel to stop
-                    logger.debug(f"[AudioRecognition] Audio generator received stop sentinel (processed {frame_count} frames)")
+                next_packet = self._audio_queue.get(self._packet_bytes, self._packet_max_delay)
+                if keepalive_interval is None:
+                    packet = await next_packet
+                else:
+                    try:
+                        packet = await asyncio.wait_for(next_packet, timeout=keepalive_interval)
+                    except asyncio.TimeoutError:
+                        self.keepalives_sent += 1
+                        _stt_audio_stats["keepalives_sent"] += 1
+                        yield keepalive_silence
+                        continue
+                if packet is None:  # Queue closed and drained
+                    logger.debug(f"[AudioRecognition] Audio generator reached end of queue (sent {packet_count} packets)")
                     break
-                frame_count += 1
-                if frame_count % 50 == 0:  # Log every 50 frames (~1 second at 20ms frames)
-                    logger.debug(f"[AudioRecognition] Audio generator yielding frame #{frame_count} ({len(frame)} bytes)")
-                yield frame
+                await self._update_throttle()
+                packet_count += 1
+                if packet_count % 50 == 0:  # Log every 50 packets
+                    logger.debug(f"[AudioRecognition] Audio generator yielding packet #{packet_count} ({len(packet)} bytes)")
+                yield packet
         
         try:
             logger.debug(f"[AudioRecognition] Starting STT stream_transcribe loop")
@@ -182,6 +374,7 @@ class AudioRecognitionHandler:
                     self._audio_transcript = self._audio_transcript.strip()
                     self._audio_interim_transcript = ""
                     self._last_final_transcript_time = time.time()
+                    self._cancel_speculation()  # The real check runs now
                     
                     # Send final transcript to client
                     await self._on_transcript(transcript, is_final, confidence)
@@ -197,6 +390,10 @@ class AudioRecognitionHandler:
                     logger.debug(f"[AudioRecognition] Interim transcript: '{transcript}'")
                     self._audio_interim_transcript = transcript
                     await self._on_transcript(transcript, is_final, confidence)
+                    
+                    # Predict end of turn ahead of the final transcript
+                    if self._speculative and transcript:
+                        self._speculate(transcript)
         
         except asyncio.CancelledError:
             logger.info("[AudioRecognition] STT streaming task cancelled")
@@ -246,44 +443,25 @@ class AudioRecognitionHandler:
         """
         endpointing_delay = self._min_delay
         eou_probability = 0.0
+        eou_saved_ms = 0.0
+        speculate = False
         
         if self._turn_detector and self._audio_transcript:
             try:
                 # Capture transcript at this moment (in case it changes during delay)
                 current_transcript = self._audio_transcript
                 
-                # Get conversation history (callback should return turn detector format)
-                conversation_history = self._get_conversation_history()
-                
-                # Ensure conversation_history is a list of dicts with "role" and "content"
-                if conversation_history:
-                    # Check if already in correct format (list of dicts)
-                    if not (isinstance(conversation_history[0], dict) and "role" in conversation_history[0]):
-                        # Convert from Message objects to dict format
-                        if hasattr(self._turn_detector, 'convert_message_history'):
-                            conversation_history = self._turn_detector.convert_message_history(conversation_history)
-                        else:
-                            # Fallback: try to convert manually
-                            converted = []
-                            for msg in conversation_history:
-                                if isinstance(msg, dict):
-                                    converted.append(msg)
-                                elif hasattr(msg, 'role') and hasattr(msg, 'content'):
-                                    converted.append({"role": msg.role, "content": str(msg.content)})
-                            conversation_history = converted
-                
-                # Build temporary conversation with current user transcript
-                # (similar to LiveKit's chat_ctx.copy() + add_message)
-                temp_history = conversation_history + [
-                    {"role": "user", "content": current_transcript}
-                ]
-                
-                logger.info(f"[AudioRecognition] Running turn detector with {len(temp_history)} messages (history: {len(conversation_history)}, current: 1), last user message: '{current_transcript[:50]}...'")
-                if conversation_history:
-                    logger.debug(f"[AudioRecognition] Conversation history sample: {conversation_history[-2:] if len(conversation_history) >= 2 else conversation_history}")
+                temp_history = self._build_eou_history(current_transcript)
+                logger.info(f"[AudioRecognition] Running turn detector with {len(temp_history)} messages, last user message: '{current_transcript[:50]}...'")
                 
-                # Get EOU probability from turn detector
-                eou_probability = self._turn_detector.predict_end_of_turn(temp_history)
+                # Get EOU probability from turn detector, off the event loop,
+                # memoized on the turns the model reads (a check with other
+                # turns cancels the obsolete prediction; a speculative one
+                # made on the same interim text answers at once)
+                eou_probability = await self._eou_memo.predict(temp_history, self._predict_end_of_turn)
+                eou_saved_ms = self._eou_memo.last_saved_ms
+                if eou_saved_ms:
+                    logger.info(f"[AudioRecognition] Speculative EOU prediction matched, saved {eou_saved_ms:.0f}ms")
                 threshold = self._turn_detector.threshold
                 
                 logger.info(f"[AudioRecognition] Turn detector returned EOU probability: {eou_probability:.3f}, threshold: {threshold:.3f}")
@@ -301,6 +479,7 @@ class AudioRecognitionHandler:
                         f"[AudioRecognition] High EOU probability ({eou_probability:.3f} >= {threshold:.3f}), "
                         f"using min delay ({self._min_delay}s)"
                     )
+                speculate = eou_probability >= self._speculate_threshold
             
             except Exception as e:
                 logger.warning(f"[AudioRecognition] Turn detector error: {e}, using min delay", exc_info=True)
@@ -312,6 +491,11 @@ class AudioRecognitionHandler:
                 logger.debug("[AudioRecognition] No turn detector configured, using min delay")
             if not self._audio_transcript:
                 logger.debug("[AudioRecognition] No transcript accumulated yet")
+            speculate = bool(self._audio_transcript)
+        
+        # Start the response during the delay if the turn is likely over
+        # (a response started on another transcript is replaced)
+        self._speculate_response(self._audio_transcript if speculate else None)
         
         # Wait for endpointing delay
         # During this delay, new final transcripts may arrive and update self._audio_transcript
@@ -333,18 +517,123 @@ class AudioRecognitionHandler:
             self._audio_transcript = ""
             self._audio_interim_transcript = ""
             self._last_final_transcript_time = None
+            self._eou_memo.clear()  # History changes with the committed turn
+            self._release_eou_cache()
+            self._cancel_speculation()
+            self.last_turn_saved_ms = eou_saved_ms
+            if eou_saved_ms:
+                self.speculative_turns += 1
             
             # Call the turn end callback with the complete accumulated transcript
             await self._on_turn_end(transcript)
         else:
             logger.debug("[AudioRecognition] No transcript to commit (may have been cleared)")
     
+    def _speculate_response(self, transcript: Optional[str]) -> None:
+        """Ask for a response to be started on transcript, or dropped (None)."""
+        if self._on_speculate is None:
+            return
+        try:
+            self._on_speculate(transcript)
+        except Exception as e:
+            logger.warning(f"[AudioRecognition] Speculation callback error: {e}", exc_info=True)
+    
+    def _build_eou_history(self, current_transcript: str) -> list:
+        """Build the turns the turn detector reads: history plus the transcript."""
+        # Get conversation history (callback should return turn detector format)
+        conversation_history = self._get_conversation_history()
+        
+        # Ensure conversation_history is a list of dicts with "role" and "content"
+        if conversation_history:
+            # Check if already in correct format (list of dicts)
+            if not (isinstance(conversation_history[0], dict) and "role" in conversation_history[0]):
+                # Convert from Message objects to dict format
+                if hasattr(self._turn_detector, 'convert_message_history'):
+                    conversation_history = self._turn_detector.convert_message_history(conversation_history)
+                else:
+                    # Fallback: try to convert manually
+                    converted = []
+                    for msg in conversation_history:
+                        if isinstance(msg, dict):
+                            converted.append(msg)
+                        elif hasattr(msg, 'role') and hasattr(msg, 'content'):
+                            converted.append({"role": msg.role, "content": str(msg.content)})
+                    conversation_history = converted
+        
+        if conversation_history:
+            logger.debug(f"[AudioRecognition] Conversation history sample: {conversation_history[-2:] if len(conversation_history) >= 2 else conversation_history}")
+        
+        # Build temporary conversation with current user transcript
+        # (similar to LiveKit's chat_ctx.copy() + add_message)
+        temp_history = conversation_history + [
+            {"role": "user", "content": current_transcript}
+        ]
+        
+        max_history_turns = getattr(self._turn_detector, 'max_history_turns', None)
+        if max_history_turns:
+            temp_history = temp_history[-max_history_turns:]
+        return temp_history
+    
+    def _speculate(self, interim_transcript: str) -> None:
+        """Schedule a speculative EOU prediction for the turn so far.
+        
+        Runs once the interim has been stable for speculative_stable_ms; a
+        different interim or a final transcript reschedules or cancels it.
+        """
+        text = f"{self._audio_transcript} {interim_transcript}".strip()
+        if not text or text == self._speculated_text:
+            return
+        self._cancel_speculation()
+        self._speculated_text = text
+        self._speculation_task = asyncio.create_task(
+            self._speculative_eou(text),
+            name="speculative_eou_task"
+        )
+    
+    async def _speculative_eou(self, text: str) -> None:
+        """Wait for the interim to settle, then predict into the EOU memo."""
+        await asyncio.sleep(self._speculative_stable)
+        try:
+            probability = await self._eou_memo.predict(
+                self._build_eou_history(text), self._predict_end_of_turn, speculative=True
+            )
+            logger.debug(f"[AudioRecognition] Speculative EOU probability {probability:.3f} for '{text[:50]}...'")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.debug(f"[AudioRecognition] Speculative EOU prediction failed: {e}")
+    
+    def _cancel_speculation(self) -> None:
+        """Cancel a scheduled speculative prediction."""
+        if self._speculation_task and not self._speculation_task.done():
+            self._speculation_task.cancel()
+        self._speculation_task = None
+        self._speculated_text = ""
+    
+    async def _predict_end_of_turn(self, conversation_history: list) -> float:
+        """Run the turn detector in its executor."""
+        kwargs = {} if self._eou_cache_key is None else {"cache_key": self._eou_cache_key}
+        predict_async = getattr(self._turn_detector, 'predict_end_of_turn_async', None)
+        if predict_async is not None:
+            return await predict_async(conversation_history, **kwargs)
+        return await get_turn_detector_executor().run(
+            functools.partial(self._turn_detector.predict_end_of_turn, **kwargs), conversation_history
+        )
+    
+    def _release_eou_cache(self) -> None:
+        """Drop this session's cached history prefix in the turn detector."""
+        if self._eou_cache_key is not None:
+            self._turn_detector.clear_cache(self._eou_cache_key)
+    
     def clear_user_turn(self) -> None:
         """Clear accumulated transcript and interim state."""
         logger.debug("[AudioRecognition] Clearing user turn state")
         self._audio_transcript = ""
         self._audio_interim_transcript = ""
         self._last_final_transcript_time = None
+        self._eou_memo.clear()
+        self._cancel_speculation()
+        self._speculate_response(None)
     
     async def stop(self) -> None:
         """
@@ -355,9 +644,16 @@ class AudioRecognitionHandler:
         logger.info("[AudioRecognition] Stopping audio recognition handler")
         self._closing = True
         
-        # Stop STT streaming task
+        # Pre-roll still held back is never sent
+        if self._preroll is not None:
+            unsent = self._preroll.get_buffer_size()
+            self._preroll.reset()
+            self.bytes_gated += unsent
+            _stt_audio_stats["bytes_gated"] += unsent
+        
+        # Stop STT streaming task (it sends what is queued, then ends)
+        self._audio_queue.close()
         if self._stt_stream_task:
-            await self._audio_queue.put(None)  # Send sentinel
             try:
                 await asyncio.wait_for(self._stt_stream_task, timeout=2.0)
             except asyncio.TimeoutError:
@@ -375,9 +671,33 @@ class AudioRecognitionHandler:
                 await self._eou_detection_task
             except asyncio.CancelledError:
                 pass
+        self._cancel_speculation()
+        self._speculate_response(None)
+        self._eou_memo.clear()
+        self._release_eou_cache()
         
         logger.info("[AudioRecognition] Audio recognition handler stopped")
     
+    def get_stats(self) -> Dict[str, object]:
+        """Get the audio streamed to STT, held back by VAD gating, and queued."""
+        return {
+            "bytes_sent": self.bytes_sent,
+            "bytes_gated": self.bytes_gated,
+            "keepalives_sent": self.keepalives_sent,
+            "queue": self._audio_queue.get_stats(),
+            "eou_memo": self._eou_memo.get_stats(),
+            "speculative_eou": {
+                "enabled": self.speculative_eou_enabled,
+                "turns": self.speculative_turns,
+                "last_turn_saved_ms": self.last_turn_saved_ms,
+            },
+        }
+    
+    @property
+    def speculative_eou_enabled(self) -> bool:
+        """Whether end-of-turn predictions are speculated on interim transcripts."""
+        return self._speculative
+    
     @property
     def current_transcript(self) -> str:
         """
@@ -81,6 +81,8 @@ class ServerConfig:
     port: int = field(default_factory=lambda: int(os.getenv("KURALIT_PORT", "8000")))
     debug: bool = field(default_factory=lambda: os.getenv("KURALIT_DEBUG", "false").lower() == "true")
     log_level: str = field(default_factory=lambda: os.getenv("KURALIT_LOG_LEVEL", "INFO"))
+    preload_models: bool = field(default_factory=lambda: os.getenv("KURALIT_PRELOAD_MODELS", "false").lower() == "true")  # Load and warm up models at startup
+    warmup_inferences: int = field(default_factory=lambda: int(os.getenv("KURALIT_WARMUP_INFERENCES", "3")))
     
     # Security
     api_key_validator: Optional[Callable[[str], bool]] = None
@@ -100,6 +102,14 @@ class ServerConfig:
     # Common STT settings
     stt_language_code: str = field(default_factory=lambda: os.getenv("KURALIT_STT_LANGUAGE", "en-US"))
     sample_rate: int = field(default_factory=lambda: int(os.getenv("KURALIT_SAMPLE_RATE", "16000")))
+    stt_max_sample_rate: int = field(default_factory=lambda: int(os.getenv("KURALIT_STT_MAX_SAMPLE_RATE", "16000")))  # Higher client rates are resampled; 0 = never
+    stt_vad_gating: bool = field(default_factory=lambda: os.getenv("KURALIT_STT_VAD_GATING", "false").lower() == "true")  # Only stream speech (per VAD) to STT
+    stt_preroll_ms: int = field(default_factory=lambda: int(os.getenv("KURALIT_STT_PREROLL_MS", "300")))
+    stt_hangover_ms: int = field(default_factory=lambda: int(os.getenv("KURALIT_STT_HANGOVER_MS", "500")))
+    stt_queue_max_bytes: int = field(default_factory=lambda: int(os.getenv("KURALIT_STT_QUEUE_MAX_BYTES", "64000")))  # ~2s of 16kHz PCM16; 0 = unbounded
+    stt_queue_overflow_policy: str = field(default_factory=lambda: os.getenv("KURALIT_STT_QUEUE_OVERFLOW_POLICY", "drop_oldest"))  # "drop_oldest", "coalesce" or "pause"
+    stt_packet_ms: int = field(default_factory=lambda: int(os.getenv("KURALIT_STT_PACKET_MS", "40")))  # Frames coalesced per STT send; 0 = no coalescing
+    stt_packet_max_delay_ms: int = field(default_factory=lambda: int(os.getenv("KURALIT_STT_PACKET_MAX_DELAY_MS", "60")))
     
     # Audio buffer settings
     silence_threshold: float = field(default_factory=lambda: float(os.getenv("KURALIT_SILENCE_THRESHOLD", "0.01")))
@@ -112,11 +122,23 @@ class ServerConfig:
     vad_enabled: bool = field(default_factory=lambda: os.getenv("KURALIT_VAD_ENABLED", "true").lower() == "true")
     vad_activation_threshold: float = field(default_factory=lambda: float(os.getenv("KURALIT_VAD_ACTIVATION_THRESHOLD", "0.5")))
     vad_model_path: Optional[str] = field(default_factory=lambda: _normalize_model_path(os.getenv("KURALIT_VAD_MODEL_PATH")))
+    vad_execution_mode: str = field(default_factory=lambda: os.getenv("KURALIT_VAD_EXECUTION_MODE", "thread_pool"))  # "thread_pool", "batched" or "inline"
+    vad_worker_threads: int = field(default_factory=lambda: int(os.getenv("KURALIT_VAD_WORKER_THREADS", "4")))
+    vad_batch_max_size: int = field(default_factory=lambda: int(os.getenv("KURALIT_VAD_BATCH_MAX_SIZE", "64")))
+    vad_batch_max_wait_ms: float = field(default_factory=lambda: float(os.getenv("KURALIT_VAD_BATCH_MAX_WAIT_MS", "2.0")))
     
     # Turn Detector settings
     turn_detector_enabled: bool = field(default_factory=lambda: os.getenv("KURALIT_TURN_DETECTOR_ENABLED", "true").lower() == "true")
     turn_detector_threshold: float = field(default_factory=lambda: float(os.getenv("KURALIT_TURN_DETECTOR_THRESHOLD", "0.5")))
     turn_detector_model_path: Optional[str] = field(default_factory=lambda: _normalize_model_path(os.getenv("KURALIT_TURN_DETECTOR_MODEL_PATH")))
+    turn_detector_worker_threads: int = field(default_factory=lambda: int(os.getenv("KURALIT_TURN_DETECTOR_WORKER_THREADS", "2")))  # Concurrent inferences
+    turn_detector_offline: bool = field(default_factory=lambda: os.getenv("KURALIT_TURN_DETECTOR_OFFLINE", "false").lower() == "true")  # Never use the network to load the model
+    turn_detector_batching: bool = field(default_factory=lambda: os.getenv("KURALIT_TURN_DETECTOR_BATCHING", "false").lower() == "true")  # Batch inference across sessions
+    turn_detector_batch_max_size: int = field(default_factory=lambda: int(os.getenv("KURALIT_TURN_DETECTOR_BATCH_MAX_SIZE", "16")))
+    turn_detector_batch_max_wait_ms: float = field(default_factory=lambda: float(os.getenv("KURALIT_TURN_DETECTOR_BATCH_MAX_WAIT_MS", "5.0")))
+    turn_detector_memo_size: int = field(default_factory=lambda: int(os.getenv("KURALIT_TURN_DETECTOR_MEMO_SIZE", "16")))  # Predictions memoized per turn; 0 = off
+    turn_detector_speculative: bool = field(default_factory=lambda: os.getenv("KURALIT_TURN_DETECTOR_SPECULATIVE", "false").lower() == "true")  # Predict on stable interim transcripts
+    turn_detector_speculative_stable_ms: float = field(default_factory=lambda: float(os.getenv("KURALIT_TURN_DETECTOR_SPECULATIVE_STABLE_MS", "200")))
     
     # Endpointing delays (matching LiveKit defaults)
     # These control how long to wait after turn detector signals end-of-turn before committing the turn
@@ -126,6 +148,8 @@ class ServerConfig:
     # Agent settings
     agent_api_key: Optional[str] = field(default_factory=lambda: os.getenv("GOOGLE_API_KEY"))
     agent_model_id: str = field(default_factory=lambda: os.getenv("KURALIT_MODEL_ID", "gemini-2.0-flash-001"))
+    agent_speculative_generation: bool = field(default_factory=lambda: os.getenv("KURALIT_AGENT_SPECULATIVE_GENERATION", "false").lower() == "true")  # Start responses during the endpointing delay
+    agent_speculative_threshold: float = field(default_factory=lambda: float(os.getenv("KURALIT_AGENT_SPECULATIVE_THRESHOLD", "0.3")))  # EOU probability
     
     # REST API Tools settings
     postman_collection_path: Optional[str] = field(default_factory=lambda: os.getenv("KURALIT_POSTMAN_COLLECTION"))
@@ -137,6 +161,11 @@ class ServerConfig:
     max_audio_chunk_size_bytes: int = field(default_factory=lambda: int(os.getenv("KURALIT_MAX_AUDIO_CHUNK_SIZE", "16384")))  # 16KB
     max_concurrent_connections: int = field(default_factory=lambda: int(os.getenv("KURALIT_MAX_CONNECTIONS", "1000")))
     connection_timeout_seconds: int = field(default_factory=lambda: int(os.getenv("KURALIT_CONNECTION_TIMEOUT", "300")))
+    session_reconnect_grace_seconds: float = field(default_factory=lambda: float(os.getenv("KURALIT_SESSION_RECONNECT_GRACE", "30")))  # 0 = release on disconnect
+    
+    # Dashboard event delivery (per-subscriber queue bound and overflow policy)
+    dashboard_event_queue_size: int = field(default_factory=lambda: int(os.getenv("KURALIT_DASHBOARD_EVENT_QUEUE_SIZE", "256")))
+    dashboard_event_drop_policy: str = field(default_factory=lambda: os.getenv("KURALIT_DASHBOARD_EVENT_DROP_POLICY", "drop_oldest"))  # "drop_oldest" or "coalesce"
     
     # Metrics
     enable_metrics: bool = field(default_factory=lambda: os.getenv("KURALIT_ENABLE_METRICS", "true").lower() == "true")
@@ -167,6 +196,12 @@ class ServerConfig:
             else:
                 raise ValueError(f"Unknown STT provider: {self.stt_provider}. Use 'deepgram' or 'google'.")
         
+        if self.vad_execution_mode not in ("inline", "thread_pool", "batched"):
+            raise ValueError(f"Unknown VAD execution mode: {self.vad_execution_mode}. Use 'thread_pool', 'batched' or 'inline'.")
+        
+        if self.stt_queue_overflow_policy not in ("drop_oldest", "coalesce", "pause"):
+            raise ValueError(f"Unknown STT queue overflow policy: {self.stt_queue_overflow_policy}. Use 'drop_oldest', 'coalesce' or 'pause'.")
+        
         if not self.agent_api_key:
             raise ValueError("Agent API key required (set GOOGLE_API_KEY)")
         
@@ -0,0 +1,221 @@
+"""Memo of end-of-turn predictions for one session.
+
+End-of-turn checks run for every final transcript and every VAD
+END_OF_SPEECH, often with the same transcript and history (END_OF_SPEECH
+right after a final transcript). Predictions are memoized in a small LRU
+keyed by a rolling hash of the turns the model reads, so the same inference
+never runs twice: a finished prediction is returned as is, and one still
+running is shared (awaited, not restarted) when its caller was cancelled by
+the identical check that replaced it.
+
+A check with a different key makes pending predictions obsolete; they are
+cancelled, as the turn detector executor drops them. A speculative lookup
+only cancels other speculative predictions, never one a real check is
+waiting on. Entries are evicted when the session commits a turn, since the
+history they were keyed on has changed.
+
+Speculative predictions (made on interim transcripts ahead of the real
+check) go through the same memo; when the real check finds one, the
+inference time it skips is counted as saved.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+# Totals over all sessions (reported by /metrics)
+_eou_memo_stats: Dict[str, float] = {
+    "hits": 0,
+    "shared": 0,
+    "misses": 0,
+    "cancelled": 0,
+    "evictions": 0,
+    "speculations": 0,
+    "speculative_hits": 0,
+    "saved_ms": 0.0,
+}
+
+
+def get_eou_memo_stats() -> Dict[str, Any]:
+    """Get end-of-turn memo hits and misses over all sessions."""
+    stats: Dict[str, Any] = dict(_eou_memo_stats)
+    lookups = stats["hits"] + stats["shared"] + stats["misses"]
+    stats["hit_rate"] = (stats["hits"] + stats["shared"]) / lookups if lookups else 0.0
+    return stats
+
+
+def _cancelling() -> bool:
+    """Whether the current task is being cancelled (Python 3.11+; else False)."""
+    task = asyncio.current_task()
+    cancelling = getattr(task, "cancelling", None)
+    return bool(cancelling and cancelling())
+
+
+def turns_key(turns: List[Dict[str, str]]) -> Tuple[int, Tuple[Tuple[str, str], ...]]:
+    """Rolling hash of (role, content) pairs, and the pairs it was built from."""
+    digest = 0
+    pairs = []
+    for msg in turns:
+        pair = (msg.get("role", ""), msg.get("content", ""))
+        digest = hash((digest, pair))
+        pairs.append(pair)
+    return digest, tuple(pairs)
+
+
+class _MemoEntry:
+    """A prediction (finished or in flight) and when it ran."""
+    
+    __slots__ = ("pairs", "task", "speculative", "awaited", "started", "finished")
+    
+    def __init__(self, pairs: Tuple[Tuple[str, str], ...], task: asyncio.Task, speculative: bool):
+        self.pairs = pairs
+        self.task = task
+        self.speculative = speculative
+        self.awaited = not speculative  # A real check waits on it
+        self.started = time.perf_counter()
+        self.finished: Optional[float] = None
+        task.add_done_callback(self._on_done)
+    
+    def _on_done(self, task: asyncio.Task) -> None:
+        self.finished = time.perf_counter()
+    
+    def usable(self, pairs: Tuple[Tuple[str, str], ...]) -> bool:
+        """Whether the entry can answer a lookup for pairs."""
+        if self.pairs != pairs or self.task.cancelled():  # Hash collision or dropped
+            return False
+        return not (self.task.done() and self.task.exception() is not None)
+
+
+class EOUMemo:
+    """LRU of end-of-turn predictions (finished or in flight) for one session."""
+    
+    def __init__(self, max_entries: int = 16):
+        """Initialize memo.
+        
+        Args:
+            max_entries: Predictions kept (0 disables memoization)
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[int, _MemoEntry]" = OrderedDict()
+        
+        # Counters (speculative lookups are counted as speculations only)
+        self.hits = 0
+        self.shared = 0  # Joined a prediction still running
+        self.misses = 0
+        self.cancelled = 0  # Obsolete predictions cancelled
+        self.evictions = 0
+        self.speculations = 0
+        self.speculative_hits = 0  # Checks answered by a speculative prediction
+        self.saved_ms = 0.0
+        # Inference time the last non-speculative lookup skipped thanks to
+        # a speculative prediction (0.0 if it had to predict)
+        self.last_saved_ms = 0.0
+    
+    def __len__(self) -> int:
+        """Entries held."""
+        return len(self._entries)
+    
+    async def predict(
+        self,
+        turns: List[Dict[str, str]],
+        predict: Callable[[List[Dict[str, str]]], Awaitable[float]],
+        speculative: bool = False,
+    ) -> float:
+        """Get the end-of-turn probability for turns, running predict on a miss.
+        
+        Cancelling the caller does not cancel the prediction; it stays in the
+        memo for the next check, which cancels it if its key differs.
+        
+        Args:
+            turns: The turns the model reads ({"role", "content"} dicts)
+            predict: Coroutine function returning the probability for turns
+            speculative: The turns are a guess (interim transcript); the
+                prediction is kept for a later real check
+        
+        Returns:
+            End-of-turn probability
+        """
+        if not speculative:
+            self.last_saved_ms = 0.0
+        if not self.max_entries:
+            if not speculative:
+                self._count("misses")
+            return await predict(turns)
+        
+        digest, pairs = turns_key(turns)
+        entry = self._entries.get(digest)
+        if entry is not None and not entry.usable(pairs):
+            entry = None
+        self._cancel_pending(keep=digest if entry is not None else None, speculative_only=speculative)
+        
+        if entry is not None:
+            self._entries.move_to_end(digest)
+            if not speculative:
+                entry.awaited = True
+                self._count("hits" if entry.task.done() else "shared")
+                if entry.speculative:
+                    # Skipped the whole inference, or the part already run
+                    end = entry.finished if entry.finished is not None else time.perf_counter()
+                    self.last_saved_ms = (end - entry.started) * 1000
+                    self._count("speculative_hits")
+                    self._count("saved_ms", self.last_saved_ms)
+        else:
+            entry = _MemoEntry(pairs, asyncio.ensure_future(predict(turns)), speculative)
+            self._entries[digest] = entry
+            self._count("speculations" if speculative else "misses")
+            while len(self._entries) > self.max_entries:
+                _, evicted = self._entries.popitem(last=False)
+                evicted.task.cancel()
+        
+        try:
+            return await asyncio.shield(entry.task)
+        except asyncio.CancelledError:
+            if speculative or not entry.task.cancelled() or _cancelling():
+                raise
+            # The shared prediction was dropped by another lookup (or
+            # evicted) while this check waited on it; run it again
+            return await predict(turns)
+    
+    def _count(self, key: str, amount: float = 1) -> None:
+        """Add to a counter of this memo and the process-wide total."""
+        setattr(self, key, getattr(self, key) + amount)
+        _eou_memo_stats[key] += amount
+    
+    def _cancel_pending(self, keep: Optional[int] = None, speculative_only: bool = False) -> None:
+        """Cancel and forget predictions still running, except keep.
+        
+        Args:
+            keep: Key of the prediction to leave running
+            speculative_only: Leave predictions a real check waits on running
+        """
+        for digest in [
+            d for d, entry in self._entries.items()
+            if not entry.task.done() and d != keep and not (speculative_only and entry.awaited)
+        ]:
+            self._entries.pop(digest).task.cancel()
+            self._count("cancelled")
+    
+    def clear(self) -> None:
+        """Evict all entries (the session committed a turn); pending ones are cancelled."""
+        self._cancel_pending()
+        if self._entries:
+            self._count("evictions", len(self._entries))
+            self._entries.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get memo size and hit counters."""
+        lookups = self.hits + self.shared + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "shared": self.shared,
+            "misses": self.misses,
+            "cancelled": self.cancelled,
+            "evictions": self.evictions,
+            "speculations": self.speculations,
+            "speculative_hits": self.speculative_hits,
+            "saved_ms": self.saved_ms,
+            "hit_rate": (self.hits + self.shared) / lookups if lookups else 0.0,
+        }
@@ -5,20 +5,27 @@ import inspect
 import json
 import logging
 import time
-from typing import Any, Callable, Dict, List, Optional
-from dataclasses import dataclass, asdict
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+from dataclasses import dataclass, asdict, field
 
 logger = logging.getLogger(__name__)
 
 
 @dataclass
 class Event:
-    """Represents an event to be broadcast."""
+    """Represents an event to be broadcast.
+    
+    The JSON encoding is computed on first use and cached, so an event fanned
+    out to many dashboard subscribers is serialized once. Events are treated
+    as immutable once published.
+    """
     
     event_type: str
     session_id: Optional[str]
     timestamp: float
     data: Dict[str, Any]
+    _json: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert event to dictionary for JSON serialization."""
@@ -31,44 +38,198 @@ class Event:
         }
     
     def to_json(self) -> str:
-        """Convert event to JSON string."""
-        return json.dumps(self.to_dict())
+        """Convert event to JSON string (encoded once and cached)."""
+        if self._json is None:
+            self._json = json.dumps(self.to_dict())
+        return self._json
+
+
+DROP_OLDEST = "drop_oldest"
+COALESCE = "coalesce"
+DROP_POLICIES = [DROP_OLDEST, COALESCE]
+
+DEFAULT_MAX_QUEUE_SIZE = 256
+
+
+class _Subscriber:
+    """Bounded event queue and drain task for a single subscriber."""
+    
+    def __init__(
+        self,
+        callback: Callable[[Event], None],
+        max_queue_size: int,
+        drop_policy: str,
+    ):
+        self.callback = callback
+        self.max_queue_size = max_queue_size
+        self.drop_policy = drop_policy
+        # (enqueued_at, event) pairs, oldest first
+        self.queue: Deque[Tuple[float, Event]] = deque()
+        self.wakeup = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+        
+        # Counters
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.last_lag_seconds = 0.0
+        self.max_lag_seconds = 0.0
+    
+    def enqueue(self, event: Event) -> None:
+        """Queue an event, applying the drop policy if the queue is full."""
+        item = (time.monotonic(), event)
+        if len(self.queue) >= self.max_queue_size:
+            if self.drop_policy == COALESCE and self._coalesce(item):
+                return
+            self.queue.popleft()
+            self.dropped += 1
+        self.queue.append(item)
+        self.wakeup.set()
+    
+    def _coalesce(self, item: Tuple[float, Event]) -> bool:
+        """Replace the newest pending event of the same type and session.
+        
+        Returns:
+            True if a pending event was replaced
+        """
+        event = item[1]
+        for i in range(len(self.queue) - 1, -1, -1):
+            pending = self.queue[i][1]
+            if pending.event_type == event.event_type and pending.session_id == event.session_id:
+                del self.queue[i]
+                self.queue.append(item)
+                self.coalesced += 1
+                return True
+        return False
+    
+    def ensure_started(self) -> None:
+        """Start the drain task if it is not running (requires a running loop)."""
+        if self.task is None or self.task.done():
+            self.task = asyncio.get_running_loop().create_task(self._drain())
+    
+    async def _drain(self) -> None:
+        """Deliver queued events to the callback, one at a time and in order."""
+        while True:
+            while not self.queue:
+                self.wakeup.clear()
+                await self.wakeup.wait()
+            
+            enqueued_at, event = self.queue.popleft()
+            lag = time.monotonic() - enqueued_at
+            self.last_lag_seconds = lag
+            if lag > self.max_lag_seconds:
+                self.max_lag_seconds = lag
+            
+            try:
+                # Called on the loop; awaited if it returns an awaitable
+                result = self.callback(event)
+                if inspect.isawaitable(result):
+                    await result
+                self.delivered += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"EventBus: Subscriber raised exception for event '{event.event_type}': {e}", exc_info=True)
+    
+    def stop(self) -> None:
+        """Cancel the drain task and discard pending events."""
+        if self.task is not None and not self.task.done():
+            self.task.cancel()
+        self.task = None
+        self.queue.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get delivery statistics for this subscriber."""
+        return {
+            "queue_depth": len(self.queue),
+            "max_queue_size": self.max_queue_size,
+            "drop_policy": self.drop_policy,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "last_lag_ms": self.last_lag_seconds * 1000,
+            "max_lag_ms": self.max_lag_seconds * 1000,
+        }
 
 
 class EventBus:
     """Event bus for broadcasting events to subscribers.
     
     This class manages event publishing and subscription for real-time
-    dashboard updates. Events are broadcast to all subscribed callbacks.
+    dashboard updates. Publishing never waits on subscribers: each subscriber
+    gets a bounded queue drained by its own task, so a slow dashboard only
+    delays (or loses) its own events.
     """
     
-    def __init__(self):
-        """Initialize event bus."""
-        self._subscribers: List[Callable[[Event], None]] = []
-        self._lock = asyncio.Lock()
+    def __init__(
+        self,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        drop_policy: str = DROP_OLDEST,
+    ):
+        """Initialize event bus.
+        
+        Args:
+            max_queue_size: Default per-subscriber queue bound
+            drop_policy: Default policy when a subscriber queue is full
+                ('drop_oldest' or 'coalesce')
+        """
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be at least 1")
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(f"drop_policy must be one of {DROP_POLICIES}")
+        
+        self._subscribers: Dict[Callable[[Event], None], _Subscriber] = {}
         self._event_count = 0
+        self.max_queue_size = max_queue_size
+        self.drop_policy = drop_policy
         
-    def subscribe(self, callback: Callable[[Event], None]) -> None:
+    def subscribe(
+        self,
+        callback: Callable[[Event], None],
+        max_queue_size: Optional[int] = None,
+        drop_policy: Optional[str] = None,
+    ) -> None:
         """Subscribe to events.
         
         Args:
-            callback: Async function that will be called for each event.
+            callback: Function called on the event loop for each event; its
+                     result is awaited if awaitable.
                      Signature: async def callback(event: Event) -> None
+            max_queue_size: Optional queue bound for this subscriber
+            drop_policy: Optional drop policy for this subscriber
         """
-        if callback not in self._subscribers:
-            self._subscribers.append(callback)
-            logger.info(f"EventBus: New subscriber added. Total subscribers: {len(self._subscribers)}")
-        else:
+        if callback in self._subscribers:
             logger.warning("EventBus: Attempted to subscribe with existing callback")
+            return
+        
+        max_queue_size = max_queue_size or self.max_queue_size
+        drop_policy = drop_policy or self.drop_policy
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(f"drop_policy must be one of {DROP_POLICIES}")
+        
+        subscriber = _Subscriber(callback, max_queue_size, drop_policy)
+        self._subscribers[callback] = subscriber
+        try:
+            subscriber.ensure_started()
+        except RuntimeError:
+            # No running loop yet: started on first publish
+            pass
+        logger.info(f"EventBus: New subscriber added. Total subscribers: {len(self._subscribers)}")
     
     def unsubscribe(self, callback: Callable[[Event], None]) -> None:
         """Unsubscribe from events.
         
+        Pending events for the subscriber are discarded.
+        
         Args:
             callback: The callback function to remove
         """
-        if callback in self._subscribers:
-            self._subscribers.remove(callback)
+        subscriber = self._subscribers.pop(callback, None)
+        if subscriber is not None:
+            subscriber.stop()
             logger.info(f"EventBus: Subscriber removed. Total subscribers: {len(self._subscribers)}")
         else:
             logger.warning("EventBus: Attempted to unsubscribe with non-existent callback")
@@ -81,11 +242,34 @@ class EventBus:
     ) -> None:
         """Publish an event to all subscribers.
         
+        Returns as soon as the event is queued; delivery happens in each
+        subscriber's drain task.
+        
         Args:
             event_type: Type of event (e.g., 'message_received', 'agent_response')
             session_id: Optional session ID associated with the event
             data: Optional event data dictionary
         """
+        self.publish_nowait(event_type, session_id, data)
+    
+    def publish_nowait(
+        self,
+        event_type: str,
+        session_id: Optional[str] = None,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> Event:
+        """Queue an event for all subscribers without awaiting.
+        
+        Must be called from the event loop thread.
+        
+        Args:
+            event_type: Type of event
+            session_id: Optional session ID associated with the event
+            data: Optional event data dictionary
+            
+        Returns:
+            The published Event
+        """
         if data is None:
             data = {}
         
@@ -98,60 +282,16 @@ class EventBus:
         
         self._event_count += 1
         
-        # Broadcast to all subscribers
-        if self._subscribers:
-            async with self._lock:
-                # Create a copy of subscribers list to avoid modification during iteration
-                subscribers_copy = self._subscribers.copy()
-            
-            logger.info(f"EventBus: Broadcasting to {len(subscribers_copy)} subscribers for event '{event_type}' (session={session_id})")
-            
-            # Call all subscribers concurrently
-            tasks = []
-            for i, callback in enumerate(subscribers_copy):
+        for subscriber in self._subscribers.values():
+            subscriber.enqueue(event)
+            if subscriber.task is None or subscriber.task.done():
                 try:
-                    # Try calling as async first (all our callbacks are async)
-                    logger.debug(f"EventBus: Calling subscriber {i} for event '{event_type}'")
-                    coro = callback(event)
-                    if asyncio.iscoroutine(coro):
-                        tasks.append((i, coro))
-                        logger.info(f"EventBus: Subscriber {i}: async callback registered (event='{event_type}')")
-                    else:
-                        # Not a coroutine, try sync
-                        logger.warning(f"EventBus: Subscriber {i}: callback didn't return coroutine, treating as sync")
-                        task = asyncio.create_task(
-                            asyncio.to_thread(callback, event)
-                        )
-                        tasks.append((i, task))
-                except TypeError as e:
-                    # Callback might be sync, try in thread
-                    logger.warning(f"EventBus: Subscriber {i}: TypeError calling callback, treating as sync: {e}")
-                    try:
-                        task = asyncio.create_task(
-                            asyncio.to_thread(callback, event)
-                        )
-                        tasks.append((i, task))
-                    except Exception as thread_error:
-                        logger.error(f"EventBus: Error creating thread task for subscriber {i}: {thread_error}", exc_info=True)
-                except Exception as e:
-                    logger.error(f"EventBus: Error calling subscriber {i}: {e}", exc_info=True)
-            
-            # Wait for all callbacks to complete (or fail)
-            if tasks:
-                # Extract just the tasks for gather
-                task_list = [task for _, task in tasks]
-                results = await asyncio.gather(*task_list, return_exceptions=True)
-                # Log any exceptions
-                for (idx, _), result in zip(tasks, results):
-                    if isinstance(result, Exception):
-                        logger.error(f"EventBus: Subscriber {idx} raised exception: {result}", exc_info=True)
-                    else:
-                        logger.debug(f"EventBus: Subscriber {idx} completed successfully")
-        
-        if self._subscribers:
-            logger.info(f"EventBus: Published event '{event_type}' (session={session_id}, subscribers={len(self._subscribers)})")
-        else:
-            logger.debug(f"EventBus: Published event '{event_type}' (session={session_id}, no subscribers)")
+                    subscriber.ensure_started()
+                except RuntimeError:
+                    pass
+        
+        logger.debug(f"EventBus: Published event '{event_type}' (session={session_id}, subscribers={len(self._subscribers)})")
+        return event
     
     def get_subscriber_count(self) -> int:
         """Get number of active subscribers."""
@@ -160,6 +300,21 @@ class EventBus:
     def get_event_count(self) -> int:
         """Get total number of events published."""
         return self._event_count
+    
+    def get_subscriber_stats(self) -> List[Dict[str, Any]]:
+        """Get queue depth, lag and drop counters for each subscriber."""
+        return [subscriber.get_stats() for subscriber in self._subscribers.values()]
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get event bus statistics."""
+        subscriber_stats = self.get_subscriber_stats()
+        return {
+            "event_count": self._event_count,
+            "subscriber_count": len(subscriber_stats),
+            "dropped": sum(s["dropped"] for s in subscriber_stats),
+            "coalesced": sum(s["coalesced"] for s in subscriber_stats),
+            "subscribers": subscriber_stats,
+        }
 
 
 # Global event bus instance
@@ -53,6 +53,8 @@ class ServerMetrics:
     total_tool_calls: int = 0
     average_latency_ms: float = 0.0
     average_stt_latency_ms: float = 0.0
+    active_sessions: int = 0
+    total_sessions_reaped: int = 0
     start_time: float = field(default_factory=time.time)
     
     def to_dict(self) -> Dict:
@@ -69,6 +71,8 @@ class ServerMetrics:
             "total_tool_calls": self.total_tool_calls,
             "average_latency_ms": self.average_latency_ms,
             "average_stt_latency_ms": self.average_stt_latency_ms,
+            "active_sessions": self.active_sessions,
+            "total_sessions_reaped": self.total_sessions_reaped,
             "uptime_seconds": uptime_seconds,
         }
 
@@ -85,6 +89,7 @@ class MetricsCollector:
         """Create metrics for a session."""
         metrics = SessionMetrics()
         self.session_metrics[session_id] = metrics
+        self.server_metrics.active_sessions = len(self.session_metrics)
         return metrics
     
     def get_session_metrics(self, session_id: str) -> Optional[SessionMetrics]:
@@ -94,6 +99,12 @@ class MetricsCollector:
     def remove_session_metrics(self, session_id: str) -> None:
         """Remove metrics for a session."""
         self.session_metrics.pop(session_id, None)
+        self.server_metrics.active_sessions = len(self.session_metrics)
+    
+    def record_session_reaped(self, session_id: str) -> None:
+        """Record that a session was released and drop its metrics."""
+        self.remove_session_metrics(session_id)
+        self.server_metrics.total_sessions_reaped += 1
     
     def increment_connection(self) -> None:
         """Increment connection count."""
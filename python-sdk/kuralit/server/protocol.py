@@ -1,13 +1,60 @@
 """WebSocket message protocol models."""
 
 import base64
+import struct
+from dataclasses import dataclass
 from typing import Any, Dict, Literal, Optional, Union
 from uuid import uuid4
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
 
+from kuralit.server.audio_codecs import get_supported_encodings
 from kuralit.server.exceptions import MessageValidationError
 
+# Audio transports negotiated in client_audio_start
+AUDIO_TRANSPORTS = ["json", "binary"]
+
+# Binary audio frame header: version, reserved flags, stream id, sequence, timestamp (ms).
+# 12 bytes keeps the PCM16 payload 2-byte aligned.
+BINARY_AUDIO_FRAME_VERSION = 1
+_BINARY_AUDIO_HEADER = struct.Struct("<BBHII")
+BINARY_AUDIO_HEADER_SIZE = _BINARY_AUDIO_HEADER.size
+
+# Maximum decoded size of a single audio chunk
+MAX_AUDIO_CHUNK_BYTES = 16384  # 16KB
+
+
+def _decode_audio_chunk(chunk: Any) -> bytes:
+    """Validate and decode a base64 audio chunk.
+    
+    The size limit is checked against the encoded length first so oversized
+    chunks are rejected without being decoded.
+    
+    Args:
+        chunk: Base64-encoded audio chunk
+        
+    Returns:
+        Decoded audio bytes
+        
+    Raises:
+        ValueError: If the chunk is missing, not valid base64 or too large
+    """
+    if not chunk or not isinstance(chunk, str):
+        raise ValueError("chunk field is required and must be a string")
+    
+    padding = 2 if chunk.endswith("==") else 1 if chunk.endswith("=") else 0
+    if (len(chunk) * 3) // 4 - padding > MAX_AUDIO_CHUNK_BYTES:
+        raise ValueError("audio chunk exceeds maximum size of 16KB")
+    
+    try:
+        decoded = base64.b64decode(chunk)
+    except Exception as e:
+        raise ValueError(f"Invalid base64 chunk: {str(e)}")
+    
+    if len(decoded) > MAX_AUDIO_CHUNK_BYTES:
+        raise ValueError("audio chunk exceeds maximum size of 16KB")
+    return decoded
+
 
 class ClientMessageBase(BaseModel):
     """Base class for all client messages."""
@@ -66,6 +113,16 @@ class ClientAudioStartMessage(ClientMessageBase):
         """Get encoding from data."""
         return self.data.get("encoding", "PCM16")
     
+    @property
+    def transport(self) -> str:
+        """Get audio chunk transport from data ("json" or "binary")."""
+        return self.data.get("transport", "json")
+    
+    @property
+    def stream_id(self) -> int:
+        """Get binary stream identifier from data."""
+        return self.data.get("stream_id", 0)
+    
     @property
     def metadata(self) -> Dict[str, Any]:
         """Get metadata from data."""
@@ -80,8 +137,17 @@ class ClientAudioStartMessage(ClientMessageBase):
             raise ValueError("sample_rate must be one of: 8000, 16000, 44100, 48000")
         
         encoding = self.data.get("encoding", "PCM16")
-        if encoding not in ["PCM16", "PCM8"]:
-            raise ValueError("encoding must be PCM16 or PCM8")
+        encodings = get_supported_encodings()
+        if encoding not in encodings:
+            raise ValueError(f"encoding must be one of: {', '.join(encodings)}")
+        
+        transport = self.data.get("transport", "json")
+        if transport not in AUDIO_TRANSPORTS:
+            raise ValueError(f"transport must be one of: {', '.join(AUDIO_TRANSPORTS)}")
+        
+        stream_id = self.data.get("stream_id", 0)
+        if not isinstance(stream_id, int) or isinstance(stream_id, bool) or not (0 <= stream_id <= 0xFFFF):
+            raise ValueError("stream_id must be an integer between 0 and 65535")
         
         return self
 
@@ -92,6 +158,9 @@ class ClientAudioChunkMessage(ClientMessageBase):
     type: Literal["client_audio_chunk"] = "client_audio_chunk"
     data: Dict[str, Any] = Field(default_factory=dict)
     
+    # Decoded chunk, cached so the base64 payload is decoded exactly once
+    _decoded_chunk: Optional[bytes] = PrivateAttr(default=None)
+    
     @property
     def chunk(self) -> str:
         """Get base64-encoded chunk from data."""
@@ -104,23 +173,46 @@ class ClientAudioChunkMessage(ClientMessageBase):
     
     @model_validator(mode="after")
     def validate_chunk(self) -> "ClientAudioChunkMessage":
-        chunk = self.data.get("chunk", "")
-        if not chunk or not isinstance(chunk, str):
-            raise ValueError("chunk field is required and must be a string")
+        self._decoded_chunk = _decode_audio_chunk(self.data.get("chunk", ""))
+        return self
+    
+    @classmethod
+    def parse_fast(cls, raw_message: Dict[str, Any]) -> "ClientAudioChunkMessage":
+        """Build an audio chunk message without the generic pydantic validation path.
         
-        # Validate base64 and size
-        try:
-            decoded = base64.b64decode(chunk)
-            if len(decoded) > 16384:  # 16KB limit
-                raise ValueError("audio chunk exceeds maximum size of 16KB")
-        except Exception as e:
-            raise ValueError(f"Invalid base64 chunk: {str(e)}")
+        Audio chunks arrive every 10-20 ms per session, so this performs only the
+        checks the validators would (session_id, chunk presence and size),
+        decodes the chunk once and caches the result.
         
-        return self
+        Args:
+            raw_message: Raw message dict (already JSON-decoded)
+            
+        Returns:
+            ClientAudioChunkMessage with the decoded chunk cached
+            
+        Raises:
+            ValueError: If the message is invalid
+        """
+        session_id = raw_message.get("session_id")
+        if not isinstance(session_id, str) or not session_id.strip():
+            raise ValueError("session_id cannot be empty")
+        
+        data = raw_message.get("data", {})
+        if not isinstance(data, dict):
+            raise ValueError("data must be an object")
+        
+        decoded = _decode_audio_chunk(data.get("chunk", ""))
+        
+        message = cls.model_construct(type="client_audio_chunk", session_id=session_id.strip(), data=data)
+        message._decoded_chunk = decoded
+        return message
     
     def get_decoded_chunk(self) -> bytes:
-        """Get decoded audio chunk."""
-        return base64.b64decode(self.chunk)
+        """Get decoded audio chunk (decoded once and cached)."""
+        decoded = self._decoded_chunk
+        if decoded is None:
+            decoded = self._decoded_chunk = _decode_audio_chunk(self.chunk)
+        return decoded
 
 
 class ClientAudioEndMessage(ClientMessageBase):
@@ -142,6 +234,71 @@ class ClientAudioEndMessage(ClientMessageBase):
         return None
 
 
+@dataclass
+class BinaryAudioFrame:
+    """Client audio frame sent as a WebSocket binary message.
+    
+    Used when the audio stream was started with ``transport="binary"``. The
+    payload is raw audio in the negotiated encoding, without JSON or base64.
+    """
+    
+    stream_id: int
+    sequence: int
+    timestamp_ms: int
+    payload: bytes
+
+
+def parse_binary_audio_frame(raw_frame: bytes) -> BinaryAudioFrame:
+    """Parse a binary WebSocket message into a BinaryAudioFrame.
+    
+    Args:
+        raw_frame: Raw binary message (12-byte header followed by audio payload)
+        
+    Returns:
+        Parsed BinaryAudioFrame
+        
+    Raises:
+        MessageValidationError: If the header is truncated or the version is unsupported
+    """
+    if len(raw_frame) < BINARY_AUDIO_HEADER_SIZE:
+        raise MessageValidationError(
+            f"Binary audio frame too short: {len(raw_frame)} bytes (header is {BINARY_AUDIO_HEADER_SIZE} bytes)"
+        )
+    
+    version, _flags, stream_id, sequence, timestamp_ms = _BINARY_AUDIO_HEADER.unpack_from(raw_frame)
+    if version != BINARY_AUDIO_FRAME_VERSION:
+        raise MessageValidationError(f"Unsupported binary audio frame version: {version}")
+    
+    return BinaryAudioFrame(
+        stream_id=stream_id,
+        sequence=sequence,
+        timestamp_ms=timestamp_ms,
+        payload=raw_frame[BINARY_AUDIO_HEADER_SIZE:],
+    )
+
+
+def encode_binary_audio_frame(stream_id: int, sequence: int, timestamp_ms: int, payload: bytes) -> bytes:
+    """Encode an audio payload as a binary WebSocket frame (client side helper).
+    
+    Args:
+        stream_id: Stream identifier negotiated in client_audio_start
+        sequence: Frame sequence number (wraps at 2**32)
+        timestamp_ms: Capture timestamp in milliseconds (wraps at 2**32)
+        payload: Raw audio bytes
+        
+    Returns:
+        Header plus payload, ready to send as a binary message
+    """
+    header = _BINARY_AUDIO_HEADER.pack(
+        BINARY_AUDIO_FRAME_VERSION,
+        0,
+        stream_id,
+        sequence & 0xFFFFFFFF,
+        int(timestamp_ms) & 0xFFFFFFFF,
+    )
+    return header + bytes(payload)
+
+
 # Union type for all client messages
 ClientMessage = Union[
     ClientTextMessage,
@@ -329,6 +486,38 @@ class ServerToolResultMessage(ServerMessageBase):
         )
 
 
+class ServerAudioThrottleMessage(ServerMessageBase):
+    """Server flow-control message asking the client to pause or resume audio."""
+    
+    type: Literal["server_audio_throttle"] = "server_audio_throttle"
+    data: Dict[str, Any] = Field(default_factory=dict)
+    
+    @classmethod
+    def create(
+        cls,
+        session_id: str,
+        paused: bool,
+        queued_ms: float,
+        stream_id: Optional[str] = None,
+    ) -> "ServerAudioThrottleMessage":
+        """Create a server audio throttle message.
+        
+        Args:
+            session_id: Session identifier
+            paused: True to ask the client to stop sending audio, False to resume
+            queued_ms: Audio waiting to be sent to STT, in milliseconds
+            stream_id: Audio stream the message applies to
+        """
+        return cls(
+            session_id=session_id,
+            data={
+                "action": "pause" if paused else "resume",
+                "queued_ms": round(queued_ms, 1),
+                "stream_id": stream_id,
+            }
+        )
+
+
 # Union type for all server messages
 ServerMessage = Union[
     ServerTextMessage,
@@ -338,6 +527,7 @@ ServerMessage = Union[
     ServerConnectedMessage,
     ServerToolCallMessage,
     ServerToolResultMessage,
+    ServerAudioThrottleMessage,
 ]
 
 
@@ -351,7 +541,8 @@ def parse_client_message(raw_message: Dict[str, Any]) -> ClientMessage:
         elif msg_type == "client_audio_start":
             return ClientAudioStartMessage(**raw_message)
         elif msg_type == "client_audio_chunk":
-            return ClientAudioChunkMessage(**raw_message)
+            # Hot path: skips generic pydantic validation, decodes once
+            return ClientAudioChunkMessage.parse_fast(raw_message)
         elif msg_type == "client_audio_end":
             return ClientAudioEndMessage(**raw_message)
         else:
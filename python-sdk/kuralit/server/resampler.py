@@ -0,0 +1,167 @@
+"""Streaming sample-rate conversion for incoming PCM16 audio."""
+
+import math
+from typing import Dict, Iterable
+
+try:
+    import numpy as np
+    from numpy.lib.stride_tricks import sliding_window_view
+except ImportError:
+    np = None
+    sliding_window_view = None
+
+
+class StreamingResampler:
+    """Polyphase windowed-sinc resampler for one PCM16 audio stream.
+    
+    Converts by the rational factor up/down (e.g. 160/441 for 44.1 kHz to
+    16 kHz) with a Kaiser-windowed sinc low-pass, one filter row per output
+    phase. Input samples still needed by upcoming outputs are kept between
+    calls, so chunk boundaries are seamless: the output is the same however
+    the input is split. Output lags input by half the filter length
+    (about 1 ms).
+    
+    Each call is vectorized: output samples are gathered as strided windows
+    over the buffered input and multiplied with their phase's filter row.
+    """
+    
+    def __init__(
+        self,
+        input_rate: int,
+        output_rate: int,
+        zero_crossings: int = 16,
+        rolloff: float = 0.9,
+        kaiser_beta: float = 8.0,
+    ):
+        """Initialize resampler.
+        
+        Args:
+            input_rate: Input sample rate in Hz
+            output_rate: Output sample rate in Hz
+            zero_crossings: Sinc zero crossings on each side of the filter
+                (at the lower of the two rates); more is sharper and slower
+            rolloff: Cutoff as a fraction of the lower Nyquist frequency
+            kaiser_beta: Kaiser window shape (stopband attenuation)
+        """
+        if input_rate <= 0 or output_rate <= 0:
+            raise ValueError("Sample rates must be positive")
+        
+        self.input_rate = input_rate
+        self.output_rate = output_rate
+        
+        divisor = math.gcd(input_rate, output_rate)
+        self._up = output_rate // divisor
+        self._down = input_rate // divisor
+        
+        # Filter in input-sample time; scale narrows it when downsampling
+        scale = min(1.0, self._up / self._down) * rolloff
+        half_width = zero_crossings / scale
+        self._half_taps = int(math.ceil(half_width))
+        self._num_taps = 2 * self._half_taps
+        
+        offsets = np.arange(-self._half_taps + 1, self._half_taps + 1)
+        t = offsets[None, :] - np.arange(self._up)[:, None] / self._up
+        window = np.i0(kaiser_beta * np.sqrt(np.clip(1.0 - (t / half_width) ** 2, 0.0, None))) / np.i0(kaiser_beta)
+        filters = np.sinc(scale * t) * window
+        filters /= filters.sum(axis=1, keepdims=True)  # Unity DC gain per phase
+        self._filters = filters.astype(np.float32)
+        
+        self.reset()
+    
+    def reset(self) -> None:
+        """Discard buffered input (start of a new stream)."""
+        # Zero history before the first sample; _buffer_start is the input
+        # index of _buffer[0]
+        self._buffer = np.zeros(self._half_taps - 1, dtype=np.float32)
+        self._buffer_start = -(self._half_taps - 1)
+        self._input_count = 0
+        self._output_count = 0
+    
+    def process(self, samples: "np.ndarray") -> "np.ndarray":
+        """Resample the next chunk of the stream.
+        
+        Args:
+            samples: int16 samples at input_rate
+        
+        Returns:
+            int16 samples at output_rate (every output sample whose filter
+            window the input so far covers)
+        """
+        buffer = np.concatenate((self._buffer, samples.astype(np.float32)))
+        self._input_count += len(samples)
+        
+        # Output n sits at input position n * down / up and needs input up to
+        # floor(n * down / up) + half_taps; end is one past the last output
+        # the input so far covers
+        last_base = self._input_count - 1 - self._half_taps
+        end = ((last_base + 1) * self._up - 1) // self._down + 1 if last_base >= 0 else 0
+        
+        if end > self._output_count:
+            positions = np.arange(self._output_count, end, dtype=np.int64) * self._down
+            base, phase = np.divmod(positions, self._up)
+            windows = sliding_window_view(buffer, self._num_taps)[base - (self._half_taps - 1) - self._buffer_start]
+            output = np.einsum("ij,ij->i", windows, self._filters[phase])
+            self._output_count = end
+        else:
+            output = np.empty(0, dtype=np.float32)
+        
+        # Keep the input the next output still needs
+        keep_from = (self._output_count * self._down) // self._up - (self._half_taps - 1)
+        self._buffer = buffer[keep_from - self._buffer_start:].copy()
+        self._buffer_start = keep_from
+        
+        np.rint(output, out=output)
+        np.clip(output, -32768, 32767, out=output)
+        return output.astype(np.int16)
+
+
+class AudioResampleStage:
+    """Converts one incoming audio stream to each rate its consumers ask for.
+    
+    Consumers (STT, VAD, ...) request a rate with request_rate(); process()
+    then returns the chunk at every requested rate, converting once per
+    distinct rate. The input rate is passed through untouched.
+    """
+    
+    def __init__(self, input_rate: int, rates: Iterable[int] = ()):
+        """Initialize stage.
+        
+        Args:
+            input_rate: Sample rate of the incoming PCM16 stream
+            rates: Rates to provide (more can be added with request_rate())
+        """
+        self.input_rate = input_rate
+        self._resamplers: Dict[int, StreamingResampler] = {}
+        for rate in rates:
+            self.request_rate(rate)
+    
+    @property
+    def needs_resampling(self) -> bool:
+        """Whether any consumer asked for a rate other than the input rate."""
+        return bool(self._resamplers)
+    
+    def request_rate(self, rate: int) -> None:
+        """Make process() provide audio at a rate."""
+        if rate != self.input_rate and rate not in self._resamplers:
+            self._resamplers[rate] = StreamingResampler(self.input_rate, rate)
+    
+    def process(self, audio_chunk: bytes) -> Dict[int, bytes]:
+        """Convert the next PCM16 chunk to every requested rate.
+        
+        Args:
+            audio_chunk: Raw PCM16 bytes at input_rate
+        
+        Returns:
+            Chunk bytes keyed by sample rate (including input_rate)
+        """
+        chunks = {self.input_rate: audio_chunk}
+        if self._resamplers:
+            samples = np.frombuffer(audio_chunk, dtype=np.int16, count=len(audio_chunk) // 2)
+            for rate, resampler in self._resamplers.items():
+                chunks[rate] = resampler.process(samples).tobytes()
+        return chunks
+    
+    def reset(self) -> None:
+        """Discard buffered input of every resampler."""
+        for resampler in self._resamplers.values():
+            resampler.reset()
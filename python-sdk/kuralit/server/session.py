@@ -3,14 +3,17 @@
 import logging
 import time
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 from uuid import uuid4
 
 from kuralit.models.message import Message
+from kuralit.server.audio_codecs import PCM16, get_audio_decoder
 
 from kuralit.server.audio_buffer import AudioBuffer
 from kuralit.server.config import ServerConfig
 from kuralit.server.metrics import SessionMetrics
+from kuralit.server.resampler import AudioResampleStage
+from kuralit.server.vad_frames import VADFrameAssembler
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +28,9 @@ class Session:
     audio_buffer: AudioBuffer = field(init=False)
     is_audio_active: bool = False
     current_audio_stream_id: Optional[str] = None
+    audio_transport: str = "json"
+    binary_stream_id: Optional[int] = None
+    last_binary_sequence: Optional[int] = None
     user_metadata: Dict = field(default_factory=dict)
     created_at: float = field(default_factory=time.time)
     last_activity: float = field(default_factory=time.time)
@@ -36,19 +42,44 @@ class Session:
     
     # VAD and Turn Detector handlers (optional) - public interface
     vad_handler: Optional[object] = field(default=None, init=False)
+    # vad_handler is the AgentSession's handler itself, shared with other
+    # sessions (it has no create_stream()); its calls must not run concurrently
+    vad_handler_shared: bool = field(default=False, init=False)
     turn_detector_handler: Optional[object] = field(default=None, init=False)
     
     # Audio Recognition Handler (coordinates VAD, STT, Turn Detector)
     audio_recognition_handler: Optional[object] = field(default=None, init=False)
     
+    # Response started during the endpointing delay (SpeculativeResponse),
+    # taken by the next committed turn
+    speculative_response: Optional[object] = field(default=None, init=False)
+    
+    # Carries partial VAD windows across audio chunks (one per audio stream)
+    vad_frame_assembler: Optional[VADFrameAssembler] = field(default=None, init=False)
+    
+    # Converts client audio to the rates STT and VAD consume (one per audio stream)
+    audio_resampler: Optional[AudioResampleStage] = field(default=None, init=False)
+    
+    # Decodes client audio to PCM16 (None for PCM16 streams); STT gets the
+    # client's encoding as-is when it accepts it natively
+    audio_decoder: Optional[object] = field(default=None, init=False)
+    stt_encoding: str = field(default=PCM16, init=False)
+    stt_sample_rate: int = field(default=16000, init=False)
+    vad_sample_rate: int = field(default=16000, init=False)
+    
     # VAD initialization state (internal)
     _vad_handler_class: Optional[type] = field(default=None, init=False)
     _vad_initialized: bool = field(default=False, init=False)
     
     def __post_init__(self):
         """Initialize audio buffer and optional handlers after object creation."""
-        # Audio buffer will get VAD handler after VAD is initialized in start_audio_stream
-        self.audio_buffer = AudioBuffer(self.config, vad_handler=None)
+        # Audio buffer will get VAD handler after VAD is initialized in start_audio_stream.
+        # It holds the STT pre-roll while VAD-gated streaming waits for speech.
+        self.audio_buffer = AudioBuffer(
+            self.config,
+            vad_handler=None,
+            max_duration_ms=getattr(self.config, 'stt_preroll_ms', 300),
+        )
         
         # If handlers were provided (from AgentSession), use them
         if self._turn_detector_handler:
@@ -70,6 +101,7 @@ class Session:
                         provider="multilingual",
                         model_path=turn_detector_model_path,
                         threshold=turn_detector_threshold,
+                        offline=getattr(self.config, 'turn_detector_offline', False),
                     )
                     self.turn_detector_handler = turn_detector_plugin.create_handler(turn_detector_config)
                     logger.debug(f"Turn Detector handler initialized for session {self.session_id}")
@@ -108,23 +140,53 @@ class Session:
         self.last_activity = time.time()
         self.metrics.update_activity()
     
-    def start_audio_stream(self, sample_rate: int, encoding: str, stream_id: Optional[str] = None) -> None:
+    def start_audio_stream(
+        self,
+        sample_rate: int,
+        encoding: str,
+        stream_id: Optional[str] = None,
+        transport: str = "json",
+        binary_stream_id: Optional[int] = None,
+        stt_encodings: Sequence[str] = (PCM16,),
+    ) -> None:
         """Start an audio stream.
         
         Args:
             sample_rate: Audio sample rate
             encoding: Audio encoding format
             stream_id: Optional stream identifier
+            transport: Audio chunk transport ("json" or "binary")
+            binary_stream_id: Stream id carried in binary frame headers (binary transport only)
+            stt_encodings: Encodings the STT provider accepts natively
+        
+        Raises:
+            ValueError: If the encoding is not supported
         """
+        audio_decoder = get_audio_decoder(encoding)
+        
         self.is_audio_active = True
         self.current_audio_stream_id = stream_id or str(uuid4())
-        self.audio_buffer.set_audio_config(sample_rate, encoding)
+        self.audio_transport = transport
+        self.binary_stream_id = binary_stream_id if transport == "binary" else None
+        self.last_binary_sequence = None
         
         # Initialize VAD handler if enabled and not already initialized
         if not self._vad_initialized:
             if self._vad_handler:
-                # Use provided VAD handler (from AgentSession)
-                self.vad_handler = self._vad_handler
+                # Use provided VAD handler (from AgentSession). It is shared by
+                # all sessions, so take a per-session stream over its model
+                # when the handler supports it.
+                if hasattr(self._vad_handler, 'create_stream'):
+                    self.vad_handler = self._vad_handler.create_stream()
+                else:
+                    self.vad_handler = self._vad_handler
+                    self.vad_handler_shared = True
+                    if getattr(self.config, 'vad_execution_mode', 'inline') != 'inline':
+                        logger.warning(
+                            f"VAD handler {type(self._vad_handler).__name__} has no create_stream() and is "
+                            f"shared by all sessions; running it inline instead of "
+                            f"'{self.config.vad_execution_mode}' (session {self.session_id})"
+                        )
                 # Update audio buffer with VAD handler
                 self.audio_buffer.vad_handler = self.vad_handler
                 self._vad_initialized = True
@@ -142,7 +204,9 @@ class Session:
                         provider="silero",
                         model_path=vad_model_path,
                         activation_threshold=vad_activation_threshold,
-                        sample_rate=sample_rate,
+                        sample_rate=min(sample_rate, 16000),  # Higher rates are resampled
+                        silence_threshold=getattr(self.config, 'silence_threshold', 0.01),
+                        silence_reset_ms=getattr(self.config, 'silence_duration_ms', 500),
                     )
                     self.vad_handler = self._vad_plugin.create_handler(vad_config)
                     # Update audio buffer with VAD handler
@@ -153,6 +217,27 @@ class Session:
                     logger.warning(f"Failed to initialize VAD handler: {e}. VAD will be disabled for this session.")
                     self.vad_handler = None
         
+        # Fresh assembler per stream: pending VAD work for a previous stream may
+        # still hold the old one
+        if self.vad_handler:
+            self.vad_frame_assembler = VADFrameAssembler(self.vad_handler.window_size_samples)
+        
+        # STT gets at most stt_max_sample_rate (speech needs no more), VAD the
+        # rate its model runs at
+        max_stt_rate = getattr(self.config, 'stt_max_sample_rate', 16000)
+        self.stt_sample_rate = min(sample_rate, max_stt_rate) if max_stt_rate else sample_rate
+        self.vad_sample_rate = getattr(self.vad_handler, 'sample_rate', sample_rate) if self.vad_handler else sample_rate
+        self.audio_resampler = AudioResampleStage(sample_rate, {self.stt_sample_rate, self.vad_sample_rate})
+        
+        # Compressed audio goes to STT undecoded if the provider takes it
+        # (and it needs no resampling), saving upstream bandwidth
+        self.audio_decoder = audio_decoder
+        if encoding in stt_encodings and self.stt_sample_rate == sample_rate:
+            self.stt_encoding = encoding
+        else:
+            self.stt_encoding = PCM16
+        self.audio_buffer.set_audio_config(self.stt_sample_rate, self.stt_encoding)
+        
         self.update_activity()
     
     def end_audio_stream(self) -> bytes:
@@ -164,6 +249,12 @@ class Session:
         self.is_audio_active = False
         accumulated = self.audio_buffer.flush()
         self.current_audio_stream_id = None
+        self.audio_transport = "json"
+        self.binary_stream_id = None
+        self.last_binary_sequence = None
+        self.vad_frame_assembler = None
+        self.audio_resampler = None
+        self.audio_decoder = None
         self.update_activity()
         return accumulated
     
@@ -175,14 +266,15 @@ class Session:
             timestamp: Optional timestamp
             
         Returns:
-            Tuple of (should_process, accumulated_audio)
+            Tuple of (should_process, accumulated_audio); always (False, b"")
+            since audio is streamed continuously via AudioRecognitionHandler
         """
         if not self.is_audio_active:
             raise ValueError("Audio stream not active")
         
-        should_process, accumulated = self.audio_buffer.add_chunk(chunk, timestamp)
+        self.audio_buffer.add_chunk(chunk, timestamp)
         self.update_activity()
-        return should_process, accumulated
+        return False, b""
     
     def add_message(self, message: Message) -> None:
         """Add message to conversation history.
@@ -226,12 +318,57 @@ class Session:
         inactive_time = time.time() - self.last_activity
         return inactive_time > timeout_seconds
     
+    async def close_audio(self) -> None:
+        """Stop audio recognition and drop any active audio stream.
+        
+        Used when the connection that started the stream goes away, since the
+        recognition handler's callbacks are bound to that connection.
+        """
+        handler = self.audio_recognition_handler
+        self.audio_recognition_handler = None
+        if handler:
+            try:
+                await handler.stop()
+            except Exception as e:
+                logger.warning(f"Error stopping audio recognition for session {self.session_id}: {e}")
+        
+        if self.is_audio_active:
+            self.is_audio_active = False
+            self.audio_buffer.reset()
+            self.current_audio_stream_id = None
+            self.audio_transport = "json"
+            self.binary_stream_id = None
+            self.last_binary_sequence = None
+            self.vad_frame_assembler = None
+        self.audio_resampler = None
+        self.audio_decoder = None
+    
+    async def release(self) -> None:
+        """Release all session resources (audio handlers, buffers and history)."""
+        await self.close_audio()
+        self.conversation_history.clear()
+        self.audio_buffer.reset()
+        self.user_metadata = {}
+        
+        # Drop this session's reference on the shared turn detector model
+        # (a handler provided by AgentSession is shared and stays open)
+        handler = self.turn_detector_handler
+        if handler is not None and handler is not self._turn_detector_handler and hasattr(handler, 'close'):
+            self.turn_detector_handler = None
+            handler.close()
+    
     def reset(self) -> None:
         """Reset session state (keep session_id)."""
         self.conversation_history.clear()
         self.audio_buffer.reset()
         self.is_audio_active = False
         self.current_audio_stream_id = None
+        self.audio_transport = "json"
+        self.binary_stream_id = None
+        self.last_binary_sequence = None
+        self.vad_frame_assembler = None
+        self.audio_resampler = None
+        self.audio_decoder = None
         
         # Reset VAD handler if initialized
         if self.vad_handler:
@@ -252,5 +389,11 @@ class Session:
         if not self.turn_detector_handler:
             return []
         
+        # Only the most recent messages are read by the model
+        max_history_turns = getattr(self.turn_detector_handler, 'max_history_turns', None)
+        if max_history_turns is not None:
+            return self.turn_detector_handler.convert_message_history(
+                self.conversation_history, limit=max_history_turns
+            )
         return self.turn_detector_handler.convert_message_history(self.conversation_history)
 
@@ -0,0 +1,211 @@
+"""Background reaper for idle and disconnected sessions."""
+
+import asyncio
+import heapq
+import logging
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from kuralit.server.session import Session
+
+logger = logging.getLogger(__name__)
+
+REAP_REASON_IDLE = "idle"
+REAP_REASON_DISCONNECTED = "disconnected"
+
+
+class SessionReaper:
+    """Releases sessions that are idle or whose connection has gone away.
+    
+    Deadlines are kept in a min-heap with at most one live entry per session,
+    so the reaper only touches sessions that are due. Activity does not touch
+    the heap: when an idle deadline comes due the session's actual
+    last_activity is checked and the entry is rescheduled if it was active.
+    
+    Only sessions no connection is attached to are reaped: one is due when
+    it has been inactive for idle_timeout_seconds (counted from the later of
+    its last activity and its disconnect), or when no connection has been
+    attached to it for reconnect_grace_seconds. A session in use by an open
+    connection is never released under it.
+    """
+    
+    def __init__(
+        self,
+        sessions: Dict[str, Session],
+        idle_timeout_seconds: float,
+        reconnect_grace_seconds: float = 0.0,
+        on_reap: Optional[Callable[[Session, str], Awaitable[None]]] = None,
+    ):
+        """Initialize session reaper.
+        
+        Args:
+            sessions: Live sessions by session_id (reaped sessions are removed)
+            idle_timeout_seconds: Inactivity after which a session is reaped
+            reconnect_grace_seconds: How long a disconnected session is kept
+                so the client can reconnect to it (0 = reap on disconnect)
+            on_reap: Optional async callback invoked with (session, reason)
+                after a session has been released
+        """
+        self.sessions = sessions
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self.reconnect_grace_seconds = reconnect_grace_seconds
+        self.on_reap = on_reap
+        
+        self._heap: List[Tuple[float, str]] = []
+        self._scheduled: Dict[str, float] = {}  # session_id -> live heap deadline
+        self._attached: Dict[str, int] = {}  # session_id -> attached connections
+        self._disconnected_at: Dict[str, float] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        
+        self.reaped_idle = 0
+        self.reaped_disconnected = 0
+    
+    def start(self) -> None:
+        """Start the reaper task if not running (requires a running event loop)."""
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            logger.info(
+                f"SessionReaper: started (idle_timeout={self.idle_timeout_seconds}s, "
+                f"reconnect_grace={self.reconnect_grace_seconds}s)"
+            )
+    
+    async def stop(self) -> None:
+        """Stop the reaper task."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+    
+    def track(self, session_id: str) -> None:
+        """Start tracking a session's idle deadline."""
+        session = self.sessions.get(session_id)
+        if session is not None:
+            self._schedule(session_id, session.last_activity + self.idle_timeout_seconds)
+    
+    def attach(self, session_id: str) -> None:
+        """Record that a connection is using the session (cancels a pending disconnect reap)."""
+        self._attached[session_id] = self._attached.get(session_id, 0) + 1
+        self._disconnected_at.pop(session_id, None)
+    
+    def detach(self, session_id: str) -> None:
+        """Record that a connection using the session has closed."""
+        if session_id not in self.sessions:
+            self._forget(session_id)
+            return
+        
+        remaining = self._attached.get(session_id, 0) - 1
+        if remaining > 0:
+            self._attached[session_id] = remaining
+            return
+        
+        self._attached.pop(session_id, None)
+        self._disconnected_at[session_id] = time.time()
+        self._schedule(session_id, self._due(session_id, self.sessions[session_id])[0])
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Get live and reaped session gauges."""
+        return {
+            "live_sessions": len(self.sessions),
+            "disconnected_sessions": len(self._disconnected_at),
+            "reaped_idle": self.reaped_idle,
+            "reaped_disconnected": self.reaped_disconnected,
+            "total_reaped": self.reaped_idle + self.reaped_disconnected,
+        }
+    
+    def _schedule(self, session_id: str, deadline: float) -> None:
+        """Schedule a session check, keeping only the earliest live entry."""
+        current = self._scheduled.get(session_id)
+        if current is not None and current <= deadline:
+            return
+        
+        self._scheduled[session_id] = deadline
+        heapq.heappush(self._heap, (deadline, session_id))
+        if self._wakeup is not None and self._heap[0][1] == session_id:
+            self._wakeup.set()
+    
+    def _due(self, session_id: str, session: Session) -> Optional[Tuple[float, str]]:
+        """Get the session's actual next deadline and the reason it applies.
+        
+        Returns:
+            (deadline, reason), or None while a connection is attached (detach
+            schedules the session again)
+        """
+        if self._attached.get(session_id, 0) > 0:
+            return None
+        idle_deadline = session.last_activity + self.idle_timeout_seconds
+        disconnected_at = self._disconnected_at.get(session_id)
+        if disconnected_at is not None:
+            idle_deadline = max(idle_deadline, disconnected_at + self.idle_timeout_seconds)
+            disconnect_deadline = disconnected_at + self.reconnect_grace_seconds
+            if disconnect_deadline <= idle_deadline:
+                return disconnect_deadline, REAP_REASON_DISCONNECTED
+        return idle_deadline, REAP_REASON_IDLE
+    
+    async def _run(self) -> None:
+        """Reap sessions as their deadlines come due."""
+        while True:
+            now = time.time()
+            while self._heap and self._heap[0][0] <= now:
+                deadline, session_id = heapq.heappop(self._heap)
+                if self._scheduled.get(session_id) != deadline:
+                    continue  # Superseded by an earlier entry
+                del self._scheduled[session_id]
+                
+                session = self.sessions.get(session_id)
+                if session is None:
+                    self._forget(session_id)
+                    continue
+                
+                due = self._due(session_id, session)
+                if due is None:
+                    continue  # In use by a connection
+                due_at, reason = due
+                if due_at > now:
+                    self._schedule(session_id, due_at)
+                    continue
+                
+                try:
+                    await self.reap(session_id, reason)
+                except Exception as e:
+                    logger.error(f"SessionReaper: error reaping session {session_id}: {e}", exc_info=True)
+            
+            timeout = max(0.0, self._heap[0][0] - time.time()) if self._heap else None
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+    
+    async def reap(self, session_id: str, reason: str) -> None:
+        """Release a session now.
+        
+        Args:
+            session_id: Session to release
+            reason: Why the session is reaped ('idle' or 'disconnected')
+        """
+        session = self.sessions.pop(session_id, None)
+        self._forget(session_id)
+        if session is None:
+            return
+        
+        await session.release()
+        
+        if reason == REAP_REASON_DISCONNECTED:
+            self.reaped_disconnected += 1
+        else:
+            self.reaped_idle += 1
+        logger.info(f"SessionReaper: reaped session {session_id} ({reason}), live={len(self.sessions)}")
+        
+        if self.on_reap is not None:
+            await self.on_reap(session, reason)
+    
+    def _forget(self, session_id: str) -> None:
+        """Drop all tracking state for a session."""
+        self._scheduled.pop(session_id, None)
+        self._attached.pop(session_id, None)
+        self._disconnected_at.pop(session_id, None)
@@ -0,0 +1,187 @@
+"""Speculative LLM generation during the endpointing delay.
+
+Once the turn detector thinks the user is probably done (EOU probability
+above a lower threshold), the endpointing delay still has to pass before
+the turn is committed, and only then does the LLM request start. A
+SpeculativeResponse starts the request on the current transcript right
+away and buffers the streamed deltas server-side, without touching the
+session. If the turn commits with the same transcript (and history), the
+buffer is replayed to the client at once and the rest streams live; if the
+user keeps speaking or says something else, the request is cancelled and
+the buffer discarded.
+
+Tool calls proposed by the model are buffered like text; they are only
+executed after the turn commits, so speculation has no side effects.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from kuralit.models.message import Message
+from kuralit.models.response import ModelResponse
+
+logger = logging.getLogger(__name__)
+
+# Characters per token, to estimate tokens of a stream cancelled before the
+# provider reported usage
+CHARS_PER_TOKEN = 4
+
+# Totals over all sessions (reported by /metrics)
+_speculative_llm_stats: Dict[str, float] = {
+    "started": 0,
+    "used": 0,
+    "discarded": 0,
+    "wasted_tokens": 0,
+    "saved_ms": 0.0,
+}
+
+
+def get_speculative_llm_stats() -> Dict[str, float]:
+    """Get speculative generations used and discarded, wasted tokens and saved latency."""
+    return dict(_speculative_llm_stats)
+
+
+class SpeculativeResponse:
+    """A buffered LLM response started before the user turn is committed."""
+    
+    def __init__(self, transcript: str, history_length: int, assistant_message: Message):
+        """Initialize speculative response.
+        
+        Args:
+            transcript: User transcript the request was made with
+            history_length: Session conversation length when it started (the
+                response is only valid if nothing was added since)
+            assistant_message: Message the model streams into
+        """
+        self.transcript = transcript
+        self.history_length = history_length
+        self.assistant_message = assistant_message
+        
+        self._chunks: List[ModelResponse] = []
+        self._updated = asyncio.Event()
+        self._done = False
+        self._error: Optional[BaseException] = None
+        self._task: Optional[asyncio.Task] = None
+        
+        self.started = time.perf_counter()
+        self.first_chunk_at: Optional[float] = None
+        self.committed_at: Optional[float] = None
+        self.output_chars = 0
+        self.reported_tokens: Optional[int] = None
+        self.outcome = "pending"  # pending, used or discarded
+        self.saved_ms = 0.0
+    
+    def start(self, stream: AsyncIterator[ModelResponse]) -> None:
+        """Consume the model stream in the background."""
+        self._task = asyncio.create_task(self._consume(stream), name="speculative_llm_task")
+        _speculative_llm_stats["started"] += 1
+    
+    async def _consume(self, stream: AsyncIterator[ModelResponse]) -> None:
+        """Buffer stream deltas until the stream ends or is cancelled."""
+        try:
+            async for chunk in stream:
+                if self.first_chunk_at is None:
+                    self.first_chunk_at = time.perf_counter()
+                if chunk.content:
+                    self.output_chars += len(chunk.content)
+                usage = getattr(chunk, "response_usage", None)
+                output_tokens = getattr(usage, "output_tokens", None) if usage is not None else None
+                if output_tokens:
+                    self.reported_tokens = max(self.reported_tokens or 0, output_tokens)
+                self._chunks.append(chunk)
+                self._updated.set()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.debug(f"[SpeculativeLLM] Speculative generation failed: {e}")
+            self._error = e
+        finally:
+            self._done = True
+            self._updated.set()
+    
+    @property
+    def tokens(self) -> int:
+        """Output tokens generated so far (reported by the provider, or estimated)."""
+        if self.reported_tokens is not None:
+            return self.reported_tokens
+        return -(-self.output_chars // CHARS_PER_TOKEN)
+    
+    def matches(self, transcript: str, history_length: int) -> bool:
+        """Whether this response answers the committed turn.
+        
+        Args:
+            transcript: Committed user transcript
+            history_length: Session conversation length before the user message
+        """
+        return (
+            self.outcome == "pending"
+            and self._error is None
+            and transcript == self.transcript
+            and history_length == self.history_length
+        )
+    
+    async def replay(self) -> AsyncIterator[ModelResponse]:
+        """Yield the buffered deltas, then the rest as they arrive.
+        
+        Marks the response used; the first delta's head start over a
+        request started now is recorded as saved latency.
+        
+        Raises:
+            Exception: If the stream fails after being committed to
+        """
+        self.outcome = "used"
+        self.committed_at = time.perf_counter()
+        _speculative_llm_stats["used"] += 1
+        index = 0
+        while True:
+            while index < len(self._chunks):
+                if index == 0:
+                    self._record_saved()
+                yield self._chunks[index]
+                index += 1
+            if self._done:
+                break
+            self._updated.clear()
+            if index < len(self._chunks) or self._done:
+                continue
+            await self._updated.wait()
+        if self._error is not None:
+            raise self._error
+    
+    def _record_saved(self) -> None:
+        """Record how much sooner the first delta reached the client."""
+        time_to_first_chunk = self.first_chunk_at - self.started
+        waited = max(0.0, self.first_chunk_at - self.committed_at)
+        self.saved_ms = max(0.0, time_to_first_chunk - waited) * 1000
+        _speculative_llm_stats["saved_ms"] += self.saved_ms
+    
+    def discard(self) -> int:
+        """Cancel the request and drop the buffer.
+        
+        Returns:
+            Output tokens wasted
+        """
+        if self.outcome != "pending":
+            return 0
+        self.outcome = "discarded"
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._chunks.clear()
+        wasted = self.tokens
+        _speculative_llm_stats["discarded"] += 1
+        _speculative_llm_stats["wasted_tokens"] += wasted
+        return wasted
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get this turn's speculation outcome, tokens and saved latency."""
+        return {
+            "outcome": self.outcome,
+            "tokens": self.tokens,
+            "wasted_tokens": self.tokens if self.outcome == "discarded" else 0,
+            "saved_ms": self.saved_ms,
+            "head_start_ms": (
+                (self.committed_at - self.started) * 1000 if self.committed_at is not None else 0.0
+            ),
+        }
@@ -0,0 +1,149 @@
+"""Turn detector inference off the event loop.
+
+End-of-turn prediction (chat templating, tokenization and an ONNX run with
+several intra-op threads) takes tens of milliseconds, so it runs in a
+dedicated thread pool. The pool size caps concurrent inferences so they do
+not oversubscribe cores. A request whose caller is cancelled (a newer
+transcript made it obsolete) is dropped if it has not started yet, and
+handlers that support it skip the ONNX run if it is cancelled mid-way.
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _TurnRequest:
+    """Cancellation state shared between the caller and the worker thread."""
+    
+    __slots__ = ("started", "cancelled")
+    
+    def __init__(self):
+        self.started = False
+        self.cancelled = False
+
+
+class TurnDetectorExecutor:
+    """Runs end-of-turn predictions in a bounded thread pool."""
+    
+    def __init__(self, max_workers: int = 2):
+        """Initialize turn detector executor.
+        
+        Args:
+            max_workers: Concurrent inferences (each may use several ONNX
+                intra-op threads)
+        """
+        self.max_workers = max_workers
+        self._pool: Optional[ThreadPoolExecutor] = None
+        
+        # Metrics
+        self._queued = 0
+        self._in_flight = 0
+        self._completed = 0
+        self._dropped = 0  # Cancelled before starting
+        self._abandoned = 0  # Cancelled while running
+        self._inference_seconds = 0.0
+    
+    def configure(self, max_workers: Optional[int] = None) -> None:
+        """Update pool settings (takes effect when the pool is next created)."""
+        if max_workers:
+            self.max_workers = max_workers
+    
+    async def run(
+        self,
+        predict: Callable[..., Any],
+        conversation_history: List[Dict[str, str]],
+        cancellable: bool = False,
+    ) -> Any:
+        """Run a prediction in the pool and wait for its result.
+        
+        Cancelling the awaiting task drops the request if it is still queued.
+        
+        Args:
+            predict: predict_end_of_turn(conversation_history) of a handler
+                (or another blocking step, e.g. tokenization before batching)
+            conversation_history: List of {"role": str, "content": str}
+            cancellable: predict accepts an is_cancelled callable and stops
+                early once it returns True
+        
+        Returns:
+            predict's result (the end-of-turn probability)
+        """
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="kuralit-turn")
+        
+        request = _TurnRequest()
+        self._queued += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._pool, self._run_request, request, predict, conversation_history, cancellable
+            )
+        except asyncio.CancelledError:
+            request.cancelled = True
+            if request.started:
+                self._abandoned += 1
+            else:
+                self._queued -= 1
+                self._dropped += 1
+            raise
+    
+    def _run_request(
+        self,
+        request: _TurnRequest,
+        predict: Callable[..., Any],
+        conversation_history: List[Dict[str, str]],
+        cancellable: bool,
+    ) -> Any:
+        """Worker thread: run one prediction unless it was cancelled."""
+        # Mark started before checking, so a cancel either sees the request
+        # as started or the check below sees the cancel
+        request.started = True
+        self._queued -= 1
+        if request.cancelled:
+            return 0.0
+        self._in_flight += 1
+        started = time.perf_counter()
+        try:
+            if cancellable:
+                return predict(conversation_history, is_cancelled=lambda: request.cancelled)
+            return predict(conversation_history)
+        finally:
+            self._inference_seconds += time.perf_counter() - started
+            self._in_flight -= 1
+            self._completed += 1
+    
+    def get_stats(self) -> Dict[str, float]:
+        """Get queue and latency metrics."""
+        return {
+            "max_workers": self.max_workers,
+            "queued": max(0, self._queued),
+            "in_flight": self._in_flight,
+            "completed": self._completed,
+            "dropped": self._dropped,
+            "abandoned": self._abandoned,
+            "average_inference_ms": (
+                self._inference_seconds / self._completed * 1000 if self._completed else 0.0
+            ),
+        }
+    
+    def shutdown(self) -> None:
+        """Stop the thread pool (queued requests are not run)."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+# Global executor shared by all sessions and turn detector handlers
+_turn_detector_executor: Optional[TurnDetectorExecutor] = None
+
+
+def get_turn_detector_executor() -> TurnDetectorExecutor:
+    """Get the process-wide turn detector executor."""
+    global _turn_detector_executor
+    if _turn_detector_executor is None:
+        _turn_detector_executor = TurnDetectorExecutor()
+    return _turn_detector_executor
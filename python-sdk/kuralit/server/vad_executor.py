@@ -0,0 +1,247 @@
+"""VAD execution off the event loop.
+
+Runs VAD inference for audio chunks in a dedicated thread pool (onnxruntime
+releases the GIL during inference), or through the VAD handler's
+cross-session batcher, while keeping each session's chunks in order, since
+VAD state depends on seeing the audio sequentially.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+from kuralit.server.vad_frames import VADFrameAssembler
+
+logger = logging.getLogger(__name__)
+
+VAD_EXECUTION_MODES = ["inline", "thread_pool", "batched"]
+
+# (event, probability) for each complete VAD window in a chunk
+VADResults = List[Tuple[str, float]]
+
+
+def run_vad_windows(
+    vad_handler: object,
+    audio_chunk: bytes,
+    assembler: Optional[VADFrameAssembler] = None,
+) -> VADResults:
+    """Run VAD over every window a PCM16 chunk completes.
+    
+    Handlers that implement process_frame() (returning a result with event
+    and probability attributes) are used through it, avoiding a result dict
+    per window.
+    
+    Args:
+        vad_handler: VAD handler implementing process_audio_frame()
+        audio_chunk: Raw PCM16 audio bytes
+        assembler: The stream's frame assembler, which carries samples that
+            do not fill a window over to the next chunk (without one, a
+            trailing partial window is dropped)
+    
+    Returns:
+        (event, probability) per processed window, in order
+    """
+    if assembler is None:
+        assembler = VADFrameAssembler(vad_handler.window_size_samples)
+    
+    results: VADResults = []
+    process_frame = getattr(vad_handler, "process_frame", None)
+    if process_frame is not None:
+        for frame in assembler.push(audio_chunk):
+            result = process_frame(frame)
+            results.append((result.event, result.probability))
+        return results
+    
+    for frame in assembler.push(audio_chunk):
+        vad_result = vad_handler.process_audio_frame(frame)
+        results.append((vad_result.get("event", "CONTINUING"), vad_result.get("probability", 0.0)))
+    return results
+
+
+async def run_vad_windows_async(
+    vad_handler: object,
+    audio_chunk: bytes,
+    assembler: Optional[VADFrameAssembler] = None,
+) -> VADResults:
+    """Run VAD over every window a PCM16 chunk completes via process_audio_frame_async().
+    
+    Used with handlers that batch inference across sessions; windows of one
+    chunk are awaited one after another since each depends on the last.
+    
+    Args:
+        vad_handler: VAD handler implementing process_audio_frame_async()
+        audio_chunk: Raw PCM16 audio bytes
+        assembler: The stream's frame assembler (see run_vad_windows)
+    
+    Returns:
+        (event, probability) per processed window, in order
+    """
+    if assembler is None:
+        assembler = VADFrameAssembler(vad_handler.window_size_samples)
+    
+    results: VADResults = []
+    process_frame_async = getattr(vad_handler, "process_frame_async", None)
+    if process_frame_async is not None:
+        for frame in assembler.push(audio_chunk):
+            result = await process_frame_async(frame)
+            results.append((result.event, result.probability))
+        return results
+    
+    for frame in assembler.push(audio_chunk):
+        vad_result = await vad_handler.process_audio_frame_async(frame)
+        results.append((vad_result.get("event", "CONTINUING"), vad_result.get("probability", 0.0)))
+    return results
+
+
+class _SessionLane:
+    """Pending chunks for one session, processed one at a time."""
+    
+    def __init__(self):
+        self.pending: Deque[Tuple[object, bytes, Optional[VADFrameAssembler], Callable[[VADResults], Awaitable[None]]]] = deque()
+        self.task: Optional[asyncio.Task] = None
+        self.dropped = 0
+
+
+class VADExecutor:
+    """Runs VAD inference in a thread pool with per-session ordering.
+    
+    Each session gets a lane: chunks are queued in arrival order and a single
+    drain task per lane hands them to the pool one at a time, so a session's
+    VAD state is never used by two threads at once while different sessions
+    run in parallel. Results are delivered back on the event loop.
+    
+    Handlers with batching enabled are awaited through
+    process_audio_frame_async() instead; their batcher does the inference
+    off the loop.
+    """
+    
+    def __init__(self, max_workers: Optional[int] = None, max_pending_per_session: int = 50):
+        """Initialize VAD executor.
+        
+        Args:
+            max_workers: Inference threads (None = ThreadPoolExecutor default)
+            max_pending_per_session: Chunks a session may have queued before
+                the oldest are dropped (keeps VAD close to real time)
+        """
+        self.max_workers = max_workers
+        self.max_pending_per_session = max_pending_per_session
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lanes: Dict[str, _SessionLane] = {}
+        
+        # Metrics
+        self._in_flight = 0
+        self._max_queue_depth = 0
+        self._chunks_processed = 0
+        self._chunks_dropped = 0
+        self._inference_seconds = 0.0
+    
+    def configure(self, max_workers: Optional[int] = None, max_pending_per_session: Optional[int] = None) -> None:
+        """Update pool settings (takes effect when the pool is next created)."""
+        if max_workers is not None:
+            self.max_workers = max_workers
+        if max_pending_per_session is not None:
+            self.max_pending_per_session = max_pending_per_session
+    
+    def submit(
+        self,
+        session_id: str,
+        vad_handler: object,
+        audio_chunk: bytes,
+        on_results: Callable[[VADResults], Awaitable[None]],
+        assembler: Optional[VADFrameAssembler] = None,
+    ) -> None:
+        """Queue a chunk for VAD inference.
+        
+        Returns immediately; on_results is awaited on the event loop with the
+        chunk's results, in the order chunks were submitted for the session.
+        
+        Args:
+            session_id: Session the chunk belongs to (ordering key)
+            vad_handler: The session's VAD handler
+            audio_chunk: Raw PCM16 audio bytes
+            on_results: Async callback receiving the chunk's VAD results
+            assembler: The session's frame assembler (see run_vad_windows)
+        """
+        lane = self._lanes.get(session_id)
+        if lane is None:
+            lane = _SessionLane()
+            self._lanes[session_id] = lane
+        
+        if len(lane.pending) >= self.max_pending_per_session:
+            lane.pending.popleft()
+            lane.dropped += 1
+            self._chunks_dropped += 1
+        lane.pending.append((vad_handler, audio_chunk, assembler, on_results))
+        
+        depth = len(lane.pending)
+        if depth > self._max_queue_depth:
+            self._max_queue_depth = depth
+        
+        if lane.task is None or lane.task.done():
+            lane.task = asyncio.get_running_loop().create_task(self._drain(session_id, lane))
+    
+    def discard(self, session_id: str) -> None:
+        """Drop a session's pending chunks (e.g. when its audio stream ends)."""
+        lane = self._lanes.pop(session_id, None)
+        if lane is not None:
+            lane.pending.clear()
+    
+    async def _drain(self, session_id: str, lane: _SessionLane) -> None:
+        """Process a lane's chunks in order until it is empty."""
+        loop = asyncio.get_running_loop()
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="kuralit-vad")
+        
+        while lane.pending:
+            vad_handler, audio_chunk, assembler, on_results = lane.pending.popleft()
+            self._in_flight += 1
+            started = time.perf_counter()
+            try:
+                if getattr(vad_handler, 'batching_enabled', False):
+                    results = await run_vad_windows_async(vad_handler, audio_chunk, assembler)
+                else:
+                    results = await loop.run_in_executor(self._pool, run_vad_windows, vad_handler, audio_chunk, assembler)
+            except Exception as e:
+                logger.warning(f"[VAD] Inference error: {e}, session={session_id}")
+                continue
+            finally:
+                self._in_flight -= 1
+                self._inference_seconds += time.perf_counter() - started
+            
+            self._chunks_processed += 1
+            try:
+                await on_results(results)
+            except Exception as e:
+                logger.warning(f"[VAD] Error handling results: {e}, session={session_id}")
+        
+        # Lane is idle: remove it unless it was replaced or refilled meanwhile
+        if self._lanes.get(session_id) is lane and not lane.pending:
+            del self._lanes[session_id]
+    
+    def get_stats(self) -> Dict[str, float]:
+        """Get queue depth and throughput metrics."""
+        queue_depth = sum(len(lane.pending) for lane in self._lanes.values())
+        return {
+            "max_workers": self.max_workers or 0,
+            "active_sessions": len(self._lanes),
+            "queue_depth": queue_depth,
+            "max_session_queue_depth": self._max_queue_depth,
+            "in_flight": self._in_flight,
+            "chunks_processed": self._chunks_processed,
+            "chunks_dropped": self._chunks_dropped,
+            "average_chunk_ms": (
+                self._inference_seconds / self._chunks_processed * 1000 if self._chunks_processed else 0.0
+            ),
+        }
+    
+    def shutdown(self) -> None:
+        """Drop all pending work and stop the thread pool."""
+        for lane in self._lanes.values():
+            lane.pending.clear()
+        self._lanes.clear()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
@@ -0,0 +1,93 @@
+"""Reassembly of incoming PCM16 audio into fixed-size VAD windows."""
+
+from typing import Iterator
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class VADFrameAssembler:
+    """Splits a stream of PCM16 chunks into VAD windows without losing samples.
+    
+    Client chunks rarely align with the VAD window (512 samples at 16 kHz).
+    Samples that do not fill a whole window are carried over in a
+    preallocated one-window int16 buffer and completed by the next chunk.
+    Windows lying entirely inside a chunk are yielded as zero-copy views of
+    the chunk, so sample data is only copied for the one window per chunk
+    that straddles a chunk boundary.
+    
+    One assembler per audio stream. Windows are only valid until the
+    generator advances, and push() calls must not overlap.
+    """
+    
+    def __init__(self, window_size_samples: int):
+        """Initialize assembler.
+        
+        Args:
+            window_size_samples: VAD window size in samples
+        """
+        self.window_size_samples = window_size_samples
+        self._carry = np.zeros(window_size_samples, dtype=np.int16)
+        self._carry_len = 0
+        self._odd_byte = b""  # Half a sample left over from an odd-length chunk
+        self.samples_in = 0
+        self.windows_out = 0
+    
+    @property
+    def pending_samples(self) -> int:
+        """Samples waiting for the next chunk to complete a window."""
+        return self._carry_len
+    
+    def push(self, audio_chunk: bytes) -> Iterator[np.ndarray]:
+        """Add a PCM16 chunk and yield every window it completes, in order.
+        
+        Args:
+            audio_chunk: Raw PCM16 (little-endian) audio bytes
+        
+        Yields:
+            int16 arrays of exactly window_size_samples samples
+        """
+        if self._odd_byte:
+            audio_chunk = self._odd_byte + audio_chunk
+            self._odd_byte = b""
+        if len(audio_chunk) % 2:
+            self._odd_byte = audio_chunk[-1:]
+            audio_chunk = memoryview(audio_chunk)[:-1]
+        
+        samples = np.frombuffer(audio_chunk, dtype=np.int16)
+        total = len(samples)
+        self.samples_in += total
+        window = self.window_size_samples
+        offset = 0
+        
+        # Complete the carried-over partial window first
+        if self._carry_len:
+            needed = window - self._carry_len
+            if total < needed:
+                self._carry[self._carry_len:self._carry_len + total] = samples
+                self._carry_len += total
+                return
+            self._carry[self._carry_len:] = samples[:needed]
+            self._carry_len = 0
+            offset = needed
+            self.windows_out += 1
+            yield self._carry
+        
+        # Whole windows inside this chunk: views, no copy
+        while total - offset >= window:
+            self.windows_out += 1
+            yield samples[offset:offset + window]
+            offset += window
+        
+        # Carry the remainder to the next chunk
+        remainder = total - offset
+        if remainder:
+            self._carry[:remainder] = samples[offset:]
+            self._carry_len = remainder
+    
+    def reset(self) -> None:
+        """Discard carried-over samples."""
+        self._carry_len = 0
+        self._odd_byte = b""
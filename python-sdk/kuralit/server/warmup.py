@@ -0,0 +1,222 @@
+"""Model preloading and warm-up at startup.
+
+Without it, the first session after a deploy pays for loading the VAD and
+turn detector models (ONNX session creation and graph optimization,
+tokenizer load) and for their first, slowest inferences. preload_models()
+loads the configured models ahead of time, keeps them loaded (the shared
+models stay referenced for the life of the process) and runs a few
+inferences through each: speech-like noise through VAD and short
+conversations through the turn detector, which also derives the
+tokenizer's chat template splits used by incremental tokenization.
+
+Progress is kept in a process-wide status; /health reports the server as
+not ready until warm-up has finished. Warm-up that fails outright still
+finishes (mark_failed()), with the error recorded, so the server is not
+held unready forever.
+"""
+
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+WARMUP_PENDING = "pending"
+WARMUP_RUNNING = "warming_up"
+WARMUP_READY = "ready"
+
+# Conversations run through the turn detector (different lengths and roles)
+_WARMUP_CONVERSATIONS = [
+    [{"role": "user", "content": "hello"}],
+    [
+        {"role": "user", "content": "hi, can you help me with my order"},
+        {"role": "assistant", "content": "of course, what is the order number?"},
+        {"role": "user", "content": "it is one two three four and i would like to change the"},
+    ],
+]
+
+# Handlers created by preloading, kept so their shared models stay loaded
+_pinned: List[Any] = []
+
+_warmup_status: Dict[str, Any] = {
+    "status": WARMUP_PENDING,
+    "started_at": None,
+    "duration_ms": 0.0,
+    "models": {},
+    "error": None,
+}
+
+
+def get_warmup_status() -> Dict[str, Any]:
+    """Get warm-up progress and per-model load and inference times."""
+    return dict(_warmup_status, models=dict(_warmup_status["models"]))
+
+
+def is_ready() -> bool:
+    """Whether warm-up has finished."""
+    return _warmup_status["status"] == WARMUP_READY
+
+
+def mark_failed(error: BaseException) -> Dict[str, Any]:
+    """Finish warm-up that failed outright, recording the error.
+    
+    Models that were not warmed up load when sessions first use them, as
+    without preloading.
+    
+    Args:
+        error: Exception that stopped warm-up
+    
+    Returns:
+        Warm-up status (see get_warmup_status())
+    """
+    _warmup_status["error"] = str(error)
+    if _warmup_status["started_at"] is not None:
+        _warmup_status["duration_ms"] = (time.time() - _warmup_status["started_at"]) * 1000
+    _warmup_status["status"] = WARMUP_READY
+    return get_warmup_status()
+
+
+def _speech_like_noise(samples: int, seed: int) -> Any:
+    """int16 noise loud enough to pass the VAD silence gate."""
+    import numpy as np
+    return np.random.default_rng(seed).normal(0, 3000, samples).clip(-32768, 32767).astype(np.int16)
+
+
+def warm_up_vad(
+    handler: Optional[Any] = None,
+    model_path: Optional[str] = None,
+    sample_rates: tuple = (8000, 16000),
+    inferences: int = 3,
+) -> Dict[str, Any]:
+    """Load the Silero VAD model and run warm-up inferences.
+    
+    Args:
+        handler: VAD handler to warm up (AgentSession); its shared model is
+            used through a separate stream so its state is not touched
+        model_path: Model file when no handler is given (None = bundled)
+        sample_rates: Rates to load models for when no handler is given
+        inferences: Inferences per model
+    
+    Returns:
+        Load and inference times in milliseconds
+    """
+    started = time.perf_counter()
+    streams = []
+    if handler is not None:
+        streams.append(handler.create_stream() if hasattr(handler, 'create_stream') else handler)
+    else:
+        from kuralit.plugins.vad.silero.handler import get_shared_vad_model
+        for sample_rate in sample_rates:
+            streams.append(get_shared_vad_model(model_path, True, sample_rate))
+    loaded = time.perf_counter()
+    
+    for stream in streams:
+        window = stream.window_size_samples
+        for i in range(inferences):
+            frame = _speech_like_noise(window, i)
+            if hasattr(stream, 'process_frame'):
+                stream.process_frame(frame)
+            else:
+                stream(frame.astype("float32") / 32768.0, stream.create_state())
+    
+    return {
+        "load_ms": (loaded - started) * 1000,
+        "warmup_ms": (time.perf_counter() - loaded) * 1000,
+        "inferences": inferences * len(streams),
+    }
+
+
+def warm_up_turn_detector(handler: Any, inferences: int = 3) -> Dict[str, Any]:
+    """Run warm-up predictions through a turn detector handler.
+    
+    Args:
+        handler: Turn detector handler (its model is already loaded)
+        inferences: Predictions per warm-up conversation
+    
+    Returns:
+        Inference time in milliseconds
+    """
+    started = time.perf_counter()
+    count = 0
+    for conversation in _WARMUP_CONVERSATIONS:
+        for _ in range(inferences):
+            handler.predict_end_of_turn(conversation)
+            count += 1
+    return {"warmup_ms": (time.perf_counter() - started) * 1000, "inferences": count}
+
+
+def _create_turn_detector(config: Any) -> Optional[Any]:
+    """Create a turn detector handler the way sessions do (shares their model)."""
+    from kuralit.config.schema import TurnDetectorConfig
+    from kuralit.core.plugin_registry import PluginRegistry
+    
+    turn_detector_plugin = PluginRegistry.get_turn_detector_plugin("multilingual")
+    if not turn_detector_plugin:
+        return None
+    return turn_detector_plugin.create_handler(TurnDetectorConfig(
+        enabled=True,
+        provider="multilingual",
+        model_path=getattr(config, 'turn_detector_model_path', None),
+        threshold=getattr(config, 'turn_detector_threshold', 0.6),
+        offline=getattr(config, 'turn_detector_offline', False),
+    ))
+
+
+def preload_models(
+    config: Any,
+    vad_handler: Optional[Any] = None,
+    turn_detector_handler: Optional[Any] = None,
+    inferences: int = 3,
+) -> Dict[str, Any]:
+    """Load all configured models and run warm-up inferences (blocking).
+    
+    Handlers passed in (from AgentSession) are warmed up as they are;
+    otherwise the models sessions would load from config are loaded. A
+    model that fails to load is reported and left to fail (or be disabled)
+    when sessions load it, as without preloading.
+    
+    Args:
+        config: Server configuration
+        vad_handler: VAD handler shared by sessions, if any
+        turn_detector_handler: Turn detector handler shared by sessions, if any
+        inferences: Warm-up inferences per model
+    
+    Returns:
+        Warm-up status (see get_warmup_status())
+    """
+    _warmup_status["status"] = WARMUP_RUNNING
+    _warmup_status["started_at"] = time.time()
+    started = time.perf_counter()
+    models = _warmup_status["models"]
+    
+    if vad_handler is not None or getattr(config, 'vad_enabled', False):
+        try:
+            models["vad"] = warm_up_vad(
+                vad_handler,
+                model_path=getattr(config, 'vad_model_path', None),
+                inferences=inferences,
+            )
+        except Exception as e:
+            logger.warning(f"[Warmup] VAD warm-up failed: {e}")
+            models["vad"] = {"error": str(e)}
+    
+    if turn_detector_handler is not None or getattr(config, 'turn_detector_enabled', False):
+        try:
+            load_ms = 0.0
+            handler = turn_detector_handler
+            if handler is None:
+                load_started = time.perf_counter()
+                handler = _create_turn_detector(config)
+                load_ms = (time.perf_counter() - load_started) * 1000
+                if handler is not None:
+                    _pinned.append(handler)
+            if handler is not None:
+                models["turn_detector"] = dict(warm_up_turn_detector(handler, inferences), load_ms=load_ms)
+        except Exception as e:
+            logger.warning(f"[Warmup] Turn detector warm-up failed: {e}")
+            models["turn_detector"] = {"error": str(e)}
+    
+    _warmup_status["duration_ms"] = (time.perf_counter() - started) * 1000
+    _warmup_status["status"] = WARMUP_READY
+    logger.info(f"[Warmup] Models ready in {_warmup_status['duration_ms']:.0f}ms: {models}")
+    return get_warmup_status()
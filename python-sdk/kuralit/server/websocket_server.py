@@ -4,7 +4,8 @@ import asyncio
 import json
 import logging
 import time
-from typing import Callable, Dict, Optional
+from contextlib import asynccontextmanager
+from typing import Callable, Dict, Optional, Set
 from uuid import uuid4
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, status
@@ -12,7 +13,10 @@ from fastapi.responses import JSONResponse
 
 from kuralit.server.agent_handler import AgentHandler
 from kuralit.server.agent_session import AgentSession
+from kuralit.server.audio_queue import get_audio_queue_stats
+from kuralit.server.audio_recognition import get_stt_audio_stats
 from kuralit.server.config import ServerConfig
+from kuralit.server.eou_memo import get_eou_memo_stats
 from kuralit.server.exceptions import (
     AgentError,
     AudioProcessingError,
@@ -29,7 +33,9 @@ from kuralit.server.protocol import (
     ClientAudioEndMessage,
     ClientAudioStartMessage,
     ClientTextMessage,
+    parse_binary_audio_frame,
     parse_client_message,
+    ServerAudioThrottleMessage,
     ServerConnectedMessage,
     ServerErrorMessage,
     ServerMessage,
@@ -37,18 +43,26 @@ from kuralit.server.protocol import (
 )
 from kuralit.server.session import Session
 from kuralit.server.event_bus import EventBus, get_event_bus, Event
+from kuralit.server.session_reaper import SessionReaper
+from kuralit.server.speculative_llm import get_speculative_llm_stats
+from kuralit.server.turn_detector_executor import get_turn_detector_executor
+from kuralit.server.vad_executor import VADExecutor, VADResults, run_vad_windows
+from kuralit.server.warmup import get_warmup_status, is_ready, mark_failed, preload_models
 from kuralit.server.dashboard_utils import (
     get_all_sessions,
     get_agent_config,
     metrics_to_ui_format,
 )
 from kuralit.core.plugin_registry import PluginRegistry
-from kuralit.plugins.stt.deepgram import DeepgramSTTHandler
-from kuralit.plugins.stt.google import GoogleSTTHandler
-from typing import Union
+from typing import TYPE_CHECKING, Union
+
+if TYPE_CHECKING:
+    # STT provider modules are imported when a provider is configured
+    from kuralit.plugins.stt.deepgram import DeepgramSTTHandler
+    from kuralit.plugins.stt.google import GoogleSTTHandler
 
 # Type alias for STT handlers
-STTHandler = Union[DeepgramSTTHandler, GoogleSTTHandler]
+STTHandler = Union["DeepgramSTTHandler", "GoogleSTTHandler"]
 
 # Configure logging
 logging.basicConfig(
@@ -62,12 +76,15 @@ sessions: Dict[str, Session] = {}
 connections: Dict[str, WebSocket] = {}
 metrics_collector = MetricsCollector()
 event_bus: EventBus = get_event_bus()  # Global event bus for dashboard updates
+vad_executor = VADExecutor()  # VAD inference worker pool (vad_execution_mode="thread_pool")
+turn_detector_executor = get_turn_detector_executor()  # Turn detector inference worker pool
 
 
 def create_app(
     api_key_validator: Callable[[str], bool],
     agent_session: Optional[AgentSession] = None,
     config: Optional[ServerConfig] = None,
+    preload: Optional[bool] = None,
 ) -> FastAPI:
     """Create FastAPI app with WebSocket endpoint.
     
@@ -75,6 +92,8 @@ def create_app(
         api_key_validator: Function to validate API keys
         agent_session: Optional AgentSession configuration (takes precedence)
         config: Optional server configuration (fallback if agent_session not provided)
+        preload: Load and warm up models at startup, reporting /health as
+            not ready until done (default: config.preload_models)
         
     Returns:
         FastAPI application
@@ -97,10 +116,34 @@ def create_app(
         config.api_key_validator = api_key_validator
         config.validate()
     
+    if preload is None:
+        preload = getattr(config, 'preload_models', False)
+    
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        """Warm up models in the background while the server starts accepting probes."""
+        warmup_task = None  # Referenced until shutdown
+        if preload and not is_ready():
+            async def warm_up_models():
+                try:
+                    if agent_session:
+                        await asyncio.to_thread(agent_session.preload)
+                    else:
+                        await asyncio.to_thread(
+                            preload_models, config, inferences=getattr(config, 'warmup_inferences', 3)
+                        )
+                except Exception as e:
+                    logger.error(f"Model warm-up failed: {e}", exc_info=True)
+                    mark_failed(e)  # Models load on first use instead
+            
+            warmup_task = asyncio.create_task(warm_up_models(), name="model_warmup")
+        yield
+    
     app = FastAPI(
         title="Kuralit WebSocket Server",
         description="Realtime text and audio communication server",
         version="0.1.1",
+        lifespan=lifespan,
     )
     
     # Initialize handlers
@@ -115,10 +158,12 @@ def create_app(
         try:
             if config.stt_provider == "deepgram":
                 logger.info("Using Deepgram STT (recommended)")
+                from kuralit.plugins.stt.deepgram import DeepgramSTTHandler
                 stt_handler = DeepgramSTTHandler(config)
                 logger.info("Deepgram STT handler initialized successfully")
             elif config.stt_provider == "google":
                 logger.info("Using Google STT")
+                from kuralit.plugins.stt.google import GoogleSTTHandler
                 stt_handler = GoogleSTTHandler(config)
                 logger.info("Google STT handler initialized successfully")
             else:
@@ -156,6 +201,9 @@ def create_app(
             logger.warning(f"VAD plugin not available: {e}. VAD will be disabled.")
             config.vad_enabled = False
     
+    vad_executor.configure(max_workers=getattr(config, 'vad_worker_threads', None))
+    turn_detector_executor.configure(max_workers=getattr(config, 'turn_detector_worker_threads', None))
+    
     # Turn Detector handler - check if model is available at startup
     # When using AgentSession, Turn Detector handler is already provided, so skip this check
     turn_detector_handler_available = False
@@ -183,14 +231,49 @@ def create_app(
     else:
         agent_handler = AgentHandler(config=config, metrics=metrics_collector, event_bus=event_bus)
     
+    async def on_session_reaped(session: Session, reason: str) -> None:
+        """Drop metrics and notify dashboards when a session is released."""
+        vad_executor.discard(session.session_id)
+        metrics_collector.record_session_reaped(session.session_id)
+        await event_bus.publish(
+            event_type="session_reaped",
+            session_id=session.session_id,
+            data={
+                "session_id": session.session_id,
+                "reason": reason,
+                "created_at": session.created_at,
+                "last_activity": session.last_activity,
+            }
+        )
+    
+    # Releases idle sessions and sessions whose client did not reconnect in time
+    session_reaper = SessionReaper(
+        sessions,
+        idle_timeout_seconds=config.connection_timeout_seconds,
+        reconnect_grace_seconds=getattr(config, 'session_reconnect_grace_seconds', 0.0),
+        on_reap=on_session_reaped,
+    )
+    
     @app.get("/health")
     async def health_check():
-        """Health check endpoint."""
-        return {
+        """Health check endpoint (503 until preloaded models are warmed up)."""
+        if preload and not is_ready():
+            return JSONResponse(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                content={
+                    "status": "warming_up",
+                    "timestamp": time.time(),
+                    "warmup": get_warmup_status(),
+                }
+            )
+        health = {
             "status": "healthy",
             "timestamp": time.time(),
             "active_connections": metrics_collector.server_metrics.active_connections,
         }
+        if preload:
+            health["warmup"] = get_warmup_status()
+        return health
     
     @app.get("/metrics")
     async def get_metrics():
@@ -200,7 +283,28 @@ def create_app(
                 status_code=status.HTTP_403_FORBIDDEN,
                 content={"error": "Metrics disabled"}
             )
-        return metrics_collector.server_metrics.to_dict()
+        metrics = metrics_collector.server_metrics.to_dict()
+        metrics["sessions"] = session_reaper.get_stats()
+        metrics["event_bus"] = event_bus.get_stats()
+        metrics["vad_executor"] = vad_executor.get_stats()
+        metrics["turn_detector"] = turn_detector_executor.get_stats()
+        metrics["turn_detector"]["memo"] = get_eou_memo_stats()
+        if getattr(config, 'turn_detector_enabled', False):
+            from kuralit.plugins.turn_detector.multilingual.model_registry import get_turn_detector_model_stats
+            metrics["turn_detector"]["models"] = get_turn_detector_model_stats()
+        if getattr(config, 'turn_detector_batching', False):
+            from kuralit.plugins.turn_detector.multilingual.batching import get_turn_detector_batcher_stats
+            metrics["turn_detector"]["batching"] = get_turn_detector_batcher_stats()
+        metrics["speculative_llm"] = get_speculative_llm_stats()
+        metrics["stt_audio"] = get_stt_audio_stats()
+        metrics["stt_audio"]["queue"] = get_audio_queue_stats()
+        if getattr(config, 'vad_execution_mode', 'inline') == 'batched':
+            from kuralit.plugins.vad.silero.batching import get_vad_batcher_stats
+            metrics["vad_executor"]["batching"] = get_vad_batcher_stats()
+        if getattr(config, 'vad_enabled', False):
+            from kuralit.plugins.vad.silero.handler import get_vad_model_stats
+            metrics["vad_executor"]["models"] = get_vad_model_stats()
+        return metrics
     
     # Dashboard API endpoints
     @app.get("/api/sessions")
@@ -233,6 +337,9 @@ def create_app(
             session = sessions[session_id]
             from kuralit.server.dashboard_utils import session_to_conversation
             conversation = session_to_conversation(session)
+            if session.audio_recognition_handler is not None:
+                # STT streaming, queue and end-of-turn memo/speculation stats
+                conversation["audio"] = session.audio_recognition_handler.get_stats()
             
             return conversation
         except Exception as e:
@@ -302,11 +409,13 @@ def create_app(
         """WebSocket endpoint for realtime communication."""
         connection_id = str(uuid4())
         session: Optional[Session] = None
+        attached_session_ids: Set[str] = set()  # Sessions used by this connection
         
         try:
             # Accept connection
             await websocket.accept()
             logger.info(f"[WS] Connection accepted: connection={connection_id}")
+            session_reaper.start()
             
             # Authenticate
             api_key = websocket.headers.get("x-api-key") or websocket.headers.get("X-Api-Key")
@@ -335,6 +444,9 @@ def create_app(
             )
             sessions[initial_session_id] = session
             metrics_collector.create_session_metrics(initial_session_id)
+            session_reaper.track(initial_session_id)
+            session_reaper.attach(initial_session_id)
+            attached_session_ids.add(initial_session_id)
             
             logger.info(f"[WS] Authenticated: connection={connection_id}, session={initial_session_id}, app_id={app_id}")
             
@@ -350,8 +462,18 @@ def create_app(
             # Main message loop
             while True:
                 try:
-                    # Receive message
-                    raw_message = await websocket.receive_text()
+                    # Receive message (text for JSON protocol, bytes for binary audio frames)
+                    ws_message = await websocket.receive()
+                    if ws_message["type"] == "websocket.disconnect":
+                        raise WebSocketDisconnect(ws_message.get("code", status.WS_1000_NORMAL_CLOSURE))
+                    
+                    raw_frame = ws_message.get("bytes")
+                    if raw_frame is not None:
+                        # Binary audio frame - bypasses JSON parsing and base64 decoding
+                        await handle_binary_audio_frame(websocket, session, raw_frame, config)
+                        continue
+                    
+                    raw_message = ws_message.get("text")
                     
                     # Log incoming request (only at DEBUG level to reduce noise)
                     logger.debug(f"[WS] Received message: connection={connection_id}, session={session.session_id if session else 'unknown'}")
@@ -386,6 +508,7 @@ def create_app(
                         )
                         sessions[client_message.session_id] = session
                         metrics_collector.create_session_metrics(client_message.session_id)
+                        session_reaper.track(client_message.session_id)
                         
                         # Emit session_created event
                         await event_bus.publish(
@@ -400,6 +523,11 @@ def create_app(
                     else:
                         session = sessions[client_message.session_id]
                     
+                    if session.session_id not in attached_session_ids:
+                        # New session, or a client reconnecting within the grace window
+                        session_reaper.attach(session.session_id)
+                        attached_session_ids.add(session.session_id)
+                    
                     session.update_activity()
                     
                     # Handle message by type
@@ -431,7 +559,7 @@ def create_app(
                             config,
                         )
                     elif isinstance(client_message, ClientAudioStartMessage):
-                        logger.info(f"[WS] Audio stream start: session={session.session_id}, sample_rate={client_message.sample_rate}Hz, encoding={client_message.encoding}")
+                        logger.info(f"[WS] Audio stream start: session={session.session_id}, sample_rate={client_message.sample_rate}Hz, encoding={client_message.encoding}, transport={client_message.transport}")
                         await handle_audio_start(
                             websocket,
                             session,
@@ -442,7 +570,8 @@ def create_app(
                         )
                     elif isinstance(client_message, ClientAudioChunkMessage):
                         # Only log at DEBUG level for audio chunks to reduce noise
-                        logger.debug(f"[WS] Audio chunk: session={session.session_id}, size={len(client_message.get_decoded_chunk())} bytes")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"[WS] Audio chunk: session={session.session_id}, size={len(client_message.get_decoded_chunk())} bytes")
                         await handle_audio_chunk(
                             websocket,
                             session,
@@ -483,6 +612,15 @@ def create_app(
             connections.pop(connection_id, None)
             metrics_collector.decrement_connection()
             
+            # Audio handlers are bound to this socket; history is kept for the
+            # reconnect grace window and released by the session reaper
+            for session_id in attached_session_ids:
+                attached_session = sessions.get(session_id)
+                if attached_session:
+                    vad_executor.discard(session_id)
+                    await attached_session.close_audio()
+                session_reaper.detach(session_id)
+            
             logger.info(f"[WS] Connection closed: connection={connection_id}")
     
     @app.websocket("/ws/dashboard")
@@ -527,10 +665,9 @@ def create_app(
                     return  # Connection closed, don't try to send
                     
                 try:
-                    event_json = event.to_json()
-                    logger.info(f"[Dashboard] Sending event to {dashboard_id}: {event.event_type} (session={event.session_id})")
-                    await websocket.send_text(event_json)
-                    logger.info(f"[Dashboard] ✓ Event sent successfully: {event.event_type} (session={event.session_id})")
+                    # Shared payload: serialized once per event, not per dashboard
+                    await websocket.send_text(event.to_json())
+                    logger.debug(f"[Dashboard] Event sent to {dashboard_id}: {event.event_type} (session={event.session_id})")
                 except WebSocketDisconnect as e:
                     logger.warning(f"[Dashboard] WebSocket disconnected while sending event: {event.event_type}, error={e}")
                     connection_active = False
@@ -541,7 +678,11 @@ def create_app(
                     # This prevents trying to send more events to a closed connection
             
             event_callback_ref = event_callback
-            event_bus.subscribe(event_callback)
+            event_bus.subscribe(
+                event_callback,
+                max_queue_size=getattr(config, 'dashboard_event_queue_size', None),
+                drop_policy=getattr(config, 'dashboard_event_drop_policy', None),
+            )
             logger.info(f"[Dashboard] Subscribed to events: dashboard={dashboard_id}, subscribers={event_bus.get_subscriber_count()}")
             
             # Test the callback immediately with a test event
@@ -998,8 +1139,35 @@ async def handle_audio_start(
         session.start_audio_stream(
             sample_rate=message.sample_rate,
             encoding=message.encoding,
+            transport=message.transport,
+            binary_stream_id=message.stream_id,
+            stt_encodings=getattr(stt_handler, 'native_encodings', ("PCM16",)),
         )
         
+        # Batch this session's VAD windows with other sessions on the same model
+        if (
+            getattr(config, 'vad_execution_mode', 'inline') == 'batched'
+            and session.vad_handler
+            and hasattr(session.vad_handler, 'enable_batching')
+            and not session.vad_handler.batching_enabled
+        ):
+            session.vad_handler.enable_batching(
+                max_batch_size=getattr(config, 'vad_batch_max_size', 64),
+                max_wait_ms=getattr(config, 'vad_batch_max_wait_ms', 2.0),
+            )
+        
+        # Batch this session's turn detector inference with other sessions
+        if (
+            getattr(config, 'turn_detector_batching', False)
+            and session.turn_detector_handler
+            and hasattr(session.turn_detector_handler, 'enable_batching')
+            and not session.turn_detector_handler.batching_enabled
+        ):
+            session.turn_detector_handler.enable_batching(
+                max_batch_size=getattr(config, 'turn_detector_batch_max_size', 16),
+                max_wait_ms=getattr(config, 'turn_detector_batch_max_wait_ms', 5.0),
+            )
+        
         # Initialize AudioRecognitionHandler for continuous streaming
         if stt_handler and config:
             from kuralit.server.audio_recognition import AudioRecognitionHandler
@@ -1037,6 +1205,32 @@ async def handle_audio_start(
                 """Get conversation history for turn detector."""
                 return session.get_conversation_history_for_turn_detector()
             
+            async def on_throttle_callback(paused: bool, queued_ms: float):
+                """Ask the client to pause or resume audio while STT is backed up."""
+                throttle_message = ServerAudioThrottleMessage.create(
+                    session_id=session.session_id,
+                    paused=paused,
+                    queued_ms=queued_ms,
+                    stream_id=session.current_audio_stream_id,
+                )
+                await send_message(websocket, throttle_message, config)
+            
+            def on_speculate_callback(transcript: Optional[str]):
+                """Start the agent response while the turn is likely ending, or drop it."""
+                speculation = session.speculative_response
+                if (
+                    transcript is not None
+                    and speculation is not None
+                    and speculation.matches(transcript, len(session.conversation_history))
+                ):
+                    return  # Already generating for this transcript
+                if speculation is not None:
+                    session.speculative_response = None
+                    wasted = speculation.discard()
+                    logger.debug(f"[Audio] Speculative response discarded, wasted ~{wasted} tokens, session={session.session_id}")
+                if transcript is not None:
+                    session.speculative_response = agent_handler.start_speculative_response(session, transcript)
+            
             # Create AudioRecognitionHandler
             session.audio_recognition_handler = AudioRecognitionHandler(
                 stt_handler=stt_handler,
@@ -1047,17 +1241,33 @@ async def handle_audio_start(
                 on_transcript_callback=on_transcript_callback,
                 on_turn_end_callback=on_turn_end_callback,
                 conversation_history_callback=get_conversation_history_callback,
+                vad_gating=getattr(config, 'stt_vad_gating', False),
+                preroll_buffer=session.audio_buffer,
+                hangover_ms=getattr(config, 'stt_hangover_ms', 500),
+                max_queue_bytes=getattr(config, 'stt_queue_max_bytes', 64000),
+                overflow_policy=getattr(config, 'stt_queue_overflow_policy', 'drop_oldest'),
+                on_throttle_callback=on_throttle_callback,
+                packet_ms=getattr(config, 'stt_packet_ms', 40),
+                packet_max_delay_ms=getattr(config, 'stt_packet_max_delay_ms', 60),
+                eou_memo_size=getattr(config, 'turn_detector_memo_size', 16),
+                speculative_eou=getattr(config, 'turn_detector_speculative', False),
+                speculative_stable_ms=getattr(config, 'turn_detector_speculative_stable_ms', 200),
+                on_speculate_callback=(
+                    on_speculate_callback if getattr(config, 'agent_speculative_generation', False) else None
+                ),
+                speculate_threshold=getattr(config, 'agent_speculative_threshold', 0.3),
             )
             
-            # Start the audio recognition handler
+            # Start the audio recognition handler (in the format STT is fed)
             await session.audio_recognition_handler.start(
-                sample_rate=message.sample_rate,
-                encoding=message.encoding
+                sample_rate=session.stt_sample_rate,
+                encoding=session.stt_encoding
             )
             
             logger.info(
                 f"[Audio] Stream started with AudioRecognitionHandler: "
-                f"session={session.session_id}, sample_rate={message.sample_rate}Hz, "
+                f"session={session.session_id}, sample_rate={message.sample_rate}Hz "
+                f"(STT {session.stt_sample_rate}Hz {session.stt_encoding}, VAD {session.vad_sample_rate}Hz), "
                 f"encoding={message.encoding}, VAD={'enabled' if session.vad_handler else 'disabled'}, "
                 f"TurnDetector={'enabled' if session.turn_detector_handler else 'disabled'}"
             )
@@ -1094,54 +1304,166 @@ async def handle_audio_chunk(
     try:
         # Decode chunk
         audio_chunk = message.get_decoded_chunk()
+        await handle_audio_frame(session, audio_chunk, config)
+    
+    except Exception as e:
+        logger.error(f"[Audio] Error processing chunk: {e}, session={session.session_id}", exc_info=True)
+        raise AudioProcessingError(f"Failed to process audio chunk: {str(e)}", retriable=True) from e
+
+
+async def handle_binary_audio_frame(
+    websocket: WebSocket,
+    session: Optional[Session],
+    raw_frame: bytes,
+    config: ServerConfig,
+) -> None:
+    """Handle a binary audio frame (audio stream started with transport="binary").
+    
+    The frame header carries the stream id, sequence number and timestamp; the
+    payload is raw audio and goes straight to the audio pipeline.
+    
+    Args:
+        websocket: WebSocket connection
+        session: Session object for this connection
+        raw_frame: Raw binary WebSocket message
+        config: Server configuration
+    """
+    if session is None or not session.is_audio_active or session.audio_transport != "binary":
+        raise MessageValidationError("Binary audio frame received without an active binary audio stream")
+    
+    frame = parse_binary_audio_frame(raw_frame)
+    
+    # Frames from a previous stream may still be in flight after a restart
+    if frame.stream_id != session.binary_stream_id:
+        logger.debug(f"[Audio] Dropping binary frame for stale stream {frame.stream_id} (active={session.binary_stream_id}), session={session.session_id}")
+        return
+    
+    if len(frame.payload) > config.max_audio_chunk_size_bytes:
+        raise MessageValidationError(
+            f"audio chunk exceeds maximum size of {config.max_audio_chunk_size_bytes} bytes"
+        )
+    
+    last_sequence = session.last_binary_sequence
+    if last_sequence is not None:
+        # Sequence numbers wrap at 2**32; anything "behind" the last frame is a duplicate or reordered frame
+        delta = (frame.sequence - last_sequence) & 0xFFFFFFFF
+        if delta == 0 or delta > 0x7FFFFFFF:
+            logger.debug(f"[Audio] Dropping out-of-order binary frame seq={frame.sequence} (last={last_sequence}), session={session.session_id}")
+            return
+        if delta > 1:
+            logger.warning(f"[Audio] Binary frame gap: {delta - 1} frame(s) missing before seq={frame.sequence}, session={session.session_id}")
+    session.last_binary_sequence = frame.sequence
+    
+    session.update_activity()
+    
+    try:
+        await handle_audio_frame(session, frame.payload, config)
+    except Exception as e:
+        logger.error(f"[Audio] Error processing binary frame: {e}, session={session.session_id}", exc_info=True)
+        raise AudioProcessingError(f"Failed to process audio chunk: {str(e)}", retriable=True) from e
+
+
+async def handle_audio_frame(
+    session: Session,
+    audio_chunk: bytes,
+    config: ServerConfig,
+) -> None:
+    """Feed decoded audio into the session's recognition pipeline and VAD.
+    
+    Shared by the JSON (base64) and binary audio transports and by the
+    final chunk of client_audio_end. Audio is decoded to PCM16 and
+    resampled to the rates STT and VAD consume when they differ from the
+    client's; STT providers that accept the client's encoding natively get
+    the chunk as sent.
+    
+    Args:
+        session: Session object
+        audio_chunk: Raw audio bytes in the stream's encoding
+        config: Server configuration
+    """
+    # Log first chunk and every 100 chunks to verify we're receiving audio
+    if not hasattr(session, '_audio_chunk_count'):
+        session._audio_chunk_count = 0
+    session._audio_chunk_count += 1
+    
+    if session._audio_chunk_count == 1 or session._audio_chunk_count % 100 == 0:
+        logger.info(f"[Audio] Received chunk #{session._audio_chunk_count}: {len(audio_chunk)} bytes, session={session.session_id}")
+    
+    encoded_chunk = audio_chunk
+    if session.audio_decoder is not None:
+        audio_chunk = session.audio_decoder.decode(encoded_chunk)
+    
+    stt_chunk = vad_chunk = audio_chunk
+    resampler = session.audio_resampler
+    if resampler is not None and resampler.needs_resampling:
+        chunks = resampler.process(audio_chunk)
+        stt_chunk = chunks[session.stt_sample_rate]
+        vad_chunk = chunks[session.vad_sample_rate]
+    if session.stt_encoding != "PCM16":
+        stt_chunk = encoded_chunk
+    
+    # Forward to AudioRecognitionHandler (continuous streaming)
+    if session.audio_recognition_handler:
+        await session.audio_recognition_handler.push_audio_frame(stt_chunk)
+    else:
+        logger.warning(f"[Audio] No AudioRecognitionHandler initialized, dropping chunk #{session._audio_chunk_count}, session={session.session_id}")
+    
+    # Process VAD in parallel (for events only)
+    if session.vad_handler and session.is_audio_active:
+        chunk_number = session._audio_chunk_count
         
-        # Log first chunk and every 100 chunks to verify we're receiving audio
-        if not hasattr(session, '_audio_chunk_count'):
-            session._audio_chunk_count = 0
-        session._audio_chunk_count += 1
-        
-        if session._audio_chunk_count == 1 or session._audio_chunk_count % 100 == 0:
-            logger.info(f"[Audio] Received chunk #{session._audio_chunk_count}: {len(audio_chunk)} bytes, session={session.session_id}")
+        async def on_vad_results(results: VADResults) -> None:
+            await dispatch_vad_results(session, chunk_number, results, config)
         
-        # Forward to AudioRecognitionHandler (continuous streaming)
-        if session.audio_recognition_handler:
-            await session.audio_recognition_handler.push_audio_frame(audio_chunk)
+        # A handler shared by all sessions runs inline: per-session lanes would
+        # call it from several worker threads at once
+        execution_mode = 'inline' if session.vad_handler_shared else getattr(config, 'vad_execution_mode', 'inline')
+        if execution_mode in ('thread_pool', 'batched'):
+            # Inference runs in the VAD worker pool or batcher; results arrive in order
+            vad_executor.submit(
+                session.session_id,
+                session.vad_handler,
+                vad_chunk,
+                on_vad_results,
+                assembler=session.vad_frame_assembler,
+            )
         else:
-            logger.warning(f"[Audio] No AudioRecognitionHandler initialized, dropping chunk #{session._audio_chunk_count}, session={session.session_id}")
-        
-        # Process VAD in parallel (for events only)
-        if session.vad_handler and session.is_audio_active:
             try:
-                import numpy as np
-                # Convert bytes to numpy array
-                audio_array = np.frombuffer(audio_chunk, dtype=np.int16)
-                window_size = session.vad_handler.window_size_samples
-                
-                # Process frame-by-frame
-                for i in range(0, len(audio_array), window_size):
-                    frame = audio_array[i:i + window_size]
-                    if len(frame) == window_size:
-                        # Process complete frame
-                        vad_result = session.vad_handler.process_audio_frame(frame)
-                        event = vad_result.get("event", "CONTINUING")
-                        prob = vad_result.get("probability", 0.0)
-                        
-                        # Debug: Log VAD probabilities every 100 chunks
-                        if session._audio_chunk_count % 100 == 0:
-                            vad_threshold = getattr(config, 'vad_activation_threshold', 0.5)
-                            logger.info(f"[VAD] Chunk #{session._audio_chunk_count}: event={event}, prob={prob:.3f}, threshold={vad_threshold}, session={session.session_id}")
-                        
-                        # Forward VAD events to AudioRecognitionHandler
-                        if event != "CONTINUING" and session.audio_recognition_handler:
-                            await session.audio_recognition_handler.handle_vad_event(event, prob)
+                results = run_vad_windows(session.vad_handler, vad_chunk, session.vad_frame_assembler)
             except Exception as e:
                 logger.warning(f"[VAD] Processing error: {e}, session={session.session_id}")
-        
-        metrics_collector.record_audio_chunk(session.session_id)
+            else:
+                await on_vad_results(results)
     
-    except Exception as e:
-        logger.error(f"[Audio] Error processing chunk: {e}, session={session.session_id}", exc_info=True)
-        raise AudioProcessingError(f"Failed to process audio chunk: {str(e)}", retriable=True) from e
+    metrics_collector.record_audio_chunk(session.session_id)
+
+
+async def dispatch_vad_results(
+    session: Session,
+    chunk_number: int,
+    results: VADResults,
+    config: ServerConfig,
+) -> None:
+    """Forward VAD events for one audio chunk to the AudioRecognitionHandler.
+    
+    Args:
+        session: Session object
+        chunk_number: Sequence number of the chunk the results belong to
+        results: (event, probability) per VAD window
+        config: Server configuration
+    """
+    if not session.is_audio_active:
+        return  # Stream ended while inference was pending
+    
+    for event, prob in results:
+        # Debug: Log VAD probabilities every 100 chunks
+        if chunk_number % 100 == 0:
+            vad_threshold = getattr(config, 'vad_activation_threshold', 0.5)
+            logger.info(f"[VAD] Chunk #{chunk_number}: event={event}, prob={prob:.3f}, threshold={vad_threshold}, session={session.session_id}")
+        
+        # Forward VAD events to AudioRecognitionHandler
+        if event != "CONTINUING" and session.audio_recognition_handler:
+            await session.audio_recognition_handler.handle_vad_event(event, prob)
 
 
 async def handle_user_turn_committed(
@@ -1230,9 +1552,15 @@ async def handle_user_turn_committed(
             agent_start_time = time.time()
             accumulated_response_text = ""
             
+            # Response started during the endpointing delay, used if it was
+            # made for this transcript
+            speculation = session.speculative_response
+            session.speculative_response = None
+            
             async for response in agent_handler.process_transcription_async(
                 session,
                 transcript,
+                speculation=speculation,
             ):
                 response_count += 1
                 logger.debug(f"[Audio] Agent response #{response_count}: type={response.type}, session={session.session_id}")
@@ -1316,14 +1644,26 @@ async def handle_user_turn_committed(
                         break
             
             logger.info(f"[Audio] Sending agent_response_complete: response_count={response_count}, final_text_length={len(final_text)}")
+            complete_data = {
+                "response_count": response_count,
+                "total_time_ms": agent_total_time,
+                "final_text": final_text,
+            }
+            recognition = session.audio_recognition_handler
+            if recognition is not None and recognition.speculative_eou_enabled:
+                # End-of-turn inference time a speculative prediction skipped
+                complete_data["eou_saved_ms"] = recognition.last_turn_saved_ms
+            if speculation is not None:
+                complete_data["speculation"] = speculation.get_stats()
+                logger.info(
+                    f"[Audio] Speculative response {speculation.outcome}: "
+                    f"saved={speculation.saved_ms:.0f}ms, "
+                    f"wasted_tokens={complete_data['speculation']['wasted_tokens']}, session={session.session_id}"
+                )
             await event_bus.publish(
                 event_type="agent_response_complete",
                 session_id=session.session_id,
-                data={
-                    "response_count": response_count,
-                    "total_time_ms": agent_total_time,
-                    "final_text": final_text,
-                }
+                data=complete_data,
             )
             
             # Emit metrics_updated event with server-level totals
@@ -1388,7 +1728,9 @@ async def handle_audio_end(
 ) -> None:
     """Handle audio stream end.
     
-    Stops the AudioRecognitionHandler and cleans up resources.
+    Feeds the optional final chunk through handle_audio_frame (it is in the
+    stream's encoding and sample rate, like any other chunk), then stops
+    the AudioRecognitionHandler and cleans up resources.
     
     Args:
         websocket: WebSocket connection
@@ -1403,15 +1745,17 @@ async def handle_audio_end(
         final_chunk = message.get_decoded_final_chunk()
         if final_chunk:
             logger.debug(f"[Audio] Final chunk: {len(final_chunk)} bytes, session={session.session_id}")
-            if session.audio_recognition_handler:
-                await session.audio_recognition_handler.push_audio_frame(final_chunk)
+            # Same path as every other chunk: decoded from the stream's
+            # encoding unless STT accepts it natively, resampled, fed to VAD
+            await handle_audio_frame(session, final_chunk, config)
         
         # Stop AudioRecognitionHandler
         if session.audio_recognition_handler:
             await session.audio_recognition_handler.stop()
             logger.info(f"[Audio] AudioRecognitionHandler stopped, session={session.session_id}")
         
-        # End audio stream in session
+        # End audio stream in session (pending VAD work is no longer needed)
+        vad_executor.discard(session.session_id)
         session.end_audio_stream()
         
         logger.info(f"[Audio] Stream ended, session={session.session_id}")
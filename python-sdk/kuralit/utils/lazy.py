@@ -0,0 +1,51 @@
+"""Lazy module attributes (PEP 562).
+
+Package __init__ modules re-export names from modules with heavy
+dependencies (google-cloud-speech, aiohttp, onnxruntime, transformers).
+lazy_attributes() builds the module's __getattr__ and __dir__ so those
+modules are only imported when one of their names is first accessed.
+"""
+
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_attributes(
+    module_name: str,
+    attributes: Dict[str, str],
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build __getattr__ and __dir__ for a module with lazy attributes.
+    
+    Args:
+        module_name: Name of the module (its __name__)
+        attributes: Attribute name -> "package.module:name" for a name in a
+            module, or "package.module" for the module itself
+    
+    Returns:
+        Tuple of (__getattr__, __dir__) to assign at module level
+    
+    Example:
+        ```python
+        __getattr__, __dir__ = lazy_attributes(__name__, {
+            "create_app": "kuralit.server.websocket_server:create_app",
+        })
+        ```
+    """
+    
+    def __getattr__(name: str) -> Any:
+        target = attributes.get(name)
+        if target is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        
+        path, _, attribute = target.partition(":")
+        value = importlib.import_module(path)
+        if attribute:
+            value = getattr(value, attribute)
+        # Cache on the module so __getattr__ is not called again
+        setattr(importlib.import_module(module_name), name, value)
+        return value
+    
+    def __dir__() -> List[str]:
+        return sorted(set(vars(importlib.import_module(module_name))) | set(attributes))
+    
+    return __getattr__, __dir__